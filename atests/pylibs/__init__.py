@@ -32,3 +32,8 @@ def sleep_asyncio(iterations: int, seconds: int):
 
     loop = asyncio.get_event_loop()
     loop.run_until_complete(do_something())
+
+
+async def sleep_async(seconds: int):
+    await asyncio.sleep(float(seconds))
+    return seconds
@@ -0,0 +1,124 @@
+"""Startup cost of a suite importing the library.
+
+Robot imports the library (and initializes it) while the suite is being set up,
+every suite listing the library pays for it even if it runs no bundle.
+Each measurement runs in a fresh interpreter with robot already imported, as it is
+in a robot run, and keeps the best of ``--repeat`` runs:
+
+    baseline    - import and init of the library at the ``--baseline`` git revision,
+                  the last release by default, which patched everything at import
+                  and imported all of its machinery
+    init        - import and init, patching at init (the default)
+    run         - import and init, patching deferred until the first bundle runs
+    never       - import and init, no patching at all
+    first run   - import, init and the first run of a bundle of one coroutine,
+                  patching at run, to show where the deferred cost goes
+    all modules - import and init without patching, then every module of
+                  the execution package, as they were imported before being deferred
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --baseline <revision>
+"""
+import argparse
+import io
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+CHILD = """
+import sys, time
+from unittest import mock
+import robot, robot.running, robot.libraries.BuiltIn, robot.api.deco
+sys.path.insert(0, {src!r})
+started = time.perf_counter()
+import GeventLibrary
+library = GeventLibrary.GeventLibrary()
+{extra}
+print(time.perf_counter() - started)
+"""
+
+FIRST_RUN = """
+with mock.patch("robot.libraries.BuiltIn.BuiltIn.run_keyword"), mock.patch(
+    "robot.running.context.ExecutionContexts.current"
+):
+    library.run_keyword("create_gevent_bundle", [], {})
+    library.run_keyword("add_coroutine", ["No Operation"], {})
+    settings = library.run_keyword("create_run_settings", [], {"log_level": "NONE"})
+    library.run_keyword("run_coroutines", [], {"settings": settings})
+"""
+
+ALL_MODULES = """
+import pkgutil, importlib, GeventLibrary.execution as execution
+for module in pkgutil.iter_modules(execution.__path__):
+    if not module.name.endswith("_worker"):
+        importlib.import_module(f"GeventLibrary.execution.{module.name}")
+"""
+
+MEASUREMENTS = (
+    ("init", "init", ""),
+    ("run", "run", ""),
+    ("never", "never", ""),
+    ("first run", "run", FIRST_RUN),
+    ("all modules", "never", ALL_MODULES),
+)
+
+
+def last_release() -> str:
+    """the last commit that changed the version of the library"""
+    return subprocess.run(
+        ["git", "log", "-1", "--format=%H", "-G", "^version = ", "--", "pyproject.toml"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def extract_sources(revision: str, directory: str) -> str:
+    """extracts the sources of the library at the given git revision, returns their path"""
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", revision, "src"], check=True, capture_output=True
+    ).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as sources:
+        sources.extractall(directory)
+    return os.path.join(directory, "src")
+
+
+def measure(moment: str, extra: str, repeat: int, src: str = "src") -> float:
+    """best seconds of the given patching moment over fresh interpreters"""
+    env = dict(os.environ, GEVENT_LIBRARY_PATCH=moment)
+    return min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", CHILD.format(src=src, extra=extra)],
+                env=env,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout.split()[-1]
+        )
+        for _ in range(repeat)
+    )
+
+
+def main():
+    """prints the milliseconds of every measurement"""
+    parser = argparse.ArgumentParser(description="library startup cost")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "--baseline", help="git revision of the library to compare with, the last release by default"
+    )
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        src = extract_sources(args.baseline or last_release(), directory)
+        baseline = measure("never", "", args.repeat, src)
+    print(f"{'measurement':<15}{'msec':>10}{'vs baseline':>14}")
+    print(f"{'baseline':<15}{baseline * 1000:>10.1f}{1:>13.2f}x")
+    for name, moment, extra in MEASUREMENTS:
+        seconds = measure(moment, extra, args.repeat)
+        print(f"{name:<15}{seconds * 1000:>10.1f}{seconds / baseline:>13.2f}x")
+
+
+if __name__ == "__main__":
+    main()
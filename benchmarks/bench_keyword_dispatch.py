@@ -0,0 +1,94 @@
+"""Per coroutine cost of dispatching its keyword.
+
+Every coroutine runs its keyword by name, robot searches the suite file, the resources
+and every imported library for that name before running it. `KeywordRunnerCache`
+resolves the names of a bundle once when it is run. Inside a robot run importing
+a typical set of libraries this measures the search alone and the full dispatch of
+`BuiltIn.run_keyword`, with and without the cache.
+
+    python benchmarks/bench_keyword_dispatch.py
+"""
+# pylint: disable=wrong-import-position
+import os
+import sys
+import tempfile
+import timeit
+from io import StringIO
+
+sys.path.insert(0, "src")
+import robot
+from robot.libraries.BuiltIn import BuiltIn
+from robot.running.context import EXECUTION_CONTEXTS
+
+from GeventLibrary.execution import KeywordRunnerCache
+
+SUITE = """
+*** Settings ***
+Library    Collections
+Library    DateTime
+Library    OperatingSystem
+Library    Process
+Library    String
+Library    XML
+Library    GeventLibrary
+Library    ${BENCHMARK}
+
+*** Test Cases ***
+Dispatch
+    Measure Dispatch    ${NUMBER}
+
+*** Keywords ***
+Suite Keyword
+    No Operation
+"""
+
+KEYWORDS = ("No Operation", "Convert To Upper Case", "Suite Keyword")
+
+
+def measure_dispatch(number):
+    """prints usec per search and per dispatch of every keyword, with and without the cache,
+    robot captures the standard output of keywords so the results are printed to the original"""
+    number = int(number)
+    ctx = EXECUTION_CONTEXTS.current
+    built_in = BuiltIn()
+    print(
+        f"{'keyword':<25}{'cache':<8}{'usec/search':>15}{'usec/dispatch':>15}",
+        file=sys.__stdout__,
+    )
+    for name in KEYWORDS:
+        args = ("abc",) if name == "Convert To Upper Case" else ()
+        for cached in (False, True):
+            cache = KeywordRunnerCache.acquire(ctx.namespace, [name]) if cached else None
+            try:
+                search = timeit.timeit(lambda n=name: ctx.get_runner(n), number=number)
+                dispatch = timeit.timeit(
+                    lambda n=name, a=args: built_in.run_keyword(n, *a), number=number
+                )
+            finally:
+                if cache is not None:
+                    cache.release()
+            print(
+                f"{name:<25}{'yes' if cached else 'no':<8}"
+                f"{search / number * 1e6:>15.2f}{dispatch / number * 1e6:>15.2f}",
+                file=sys.__stdout__,
+            )
+
+
+def main(number: int = 20_000):
+    """runs the measurement inside a robot run"""
+    with tempfile.TemporaryDirectory() as tmp:
+        suite = os.path.join(tmp, "dispatch.robot")
+        with open(suite, "w", encoding="utf-8") as suite_file:
+            suite_file.write(SUITE)
+        robot.run(
+            suite,
+            output=None,
+            log=None,
+            report=None,
+            stdout=StringIO(),
+            variable=[f"BENCHMARK:{os.path.abspath(__file__)}", f"NUMBER:{number}"],
+        )
+
+
+if __name__ == "__main__":
+    main()
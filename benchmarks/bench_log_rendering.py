@@ -0,0 +1,201 @@
+"""Per keyword cost of logging coroutine keyword events.
+
+Compares the original f-string tables (stylesheet embedded in every message,
+written with `BuiltIn.log`) with `CoroutineLogRenderer` in its different log levels.
+Rendering alone is measured in-process, then a bundle of `No Operation`
+coroutines is executed by robot with every mode to measure the full logging cost
+and the size of output.xml.
+
+    python benchmarks/bench_log_rendering.py
+"""
+# pylint: disable=wrong-import-position
+import os
+import sys
+import tempfile
+import time
+import timeit
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, "src")
+import robot
+from robot.libraries.BuiltIn import BuiltIn
+from robot.utils import safe_str
+
+from GeventLibrary.execution import CoroutineLogRenderer
+
+SUITE = """
+*** Settings ***
+Library    GeventLibrary
+
+*** Test Cases ***
+Bundle
+    Create Gevent Bundle
+    FOR    ${i}    IN RANGE    ${COROUTINES}
+        Add Coroutine    No Operation
+    END
+    ${settings}    Create Run Settings    log_level=${LOG_LEVEL}
+    Run Coroutines    settings=${settings}
+"""
+
+KEYWORD_ITEM = SimpleNamespace(
+    name="GET",
+    args=("https://jsonplaceholder.typicode.com/posts/1", "expected_status=200"),
+    doc="Sends a GET request.",
+    result=SimpleNamespace(status="PASS"),
+)
+
+
+def legacy_start(keyword_item):
+    """the start table as it was rendered before the log renderer"""
+    return f"""
+            <style>
+                #demo table, #demo th, #demo td{{
+                    border: 1px dotted black;
+                    border-collapse: collapse;
+                    table-layout: auto;
+                }}
+            </style>
+            <table id="demo" style="width:100%">
+                <tr>
+                    <th style="width:10%">Event</th>
+                    <th style="width:10%">Keyword</th>
+                    <th style="width:10%">Args</th>
+                    <th style="width:10%">Doc</th>
+                </tr>
+                <tr>
+                    <td style="text-align:center">Started</td>
+                    <td style="text-align:center">{keyword_item.name}</td>
+                    <td style="text-align:center">{"   ".join([safe_str(a) for a in keyword_item.args])}</td>
+                    <td style="text-align:center">{keyword_item.doc}</td>
+                </tr>
+            </table>
+
+            """
+
+
+def legacy_end(keyword_item):
+    """the end table as it was rendered before the log renderer"""
+    return f"""
+            <style>
+                #demo table, #demo th, #demo td{{
+                    border: 1px dotted black;
+                    border-collapse: collapse;
+                    table-layout: auto;
+                }}
+                #statusfail{{
+                    border: 1px dotted black;
+                    color:red;
+                    bgcolor:gray;
+                    text-align:center;
+                    border-collapse: collapse;
+                    table-layout: auto;
+                    }}
+                #statuspass{{
+                    border: 1px dotted black;
+                    color:green;
+                    bgcolor:gray;
+                    text-align:center;
+                    border-collapse: collapse;
+                    table-layout: auto;
+                    }}
+            </style>
+            <table id="demo" style="width:100%">
+                <tr>
+                    <th style="width:10%">Event</th>
+                    <th style="width:10%">Keyword</th>
+                    <th style="width:10%">Args</th>
+                    <th style="width:10%">Doc</th>
+                    <th style="width:10%">Status</th>
+                </tr>
+                <tr>
+                    <td style="text-align:center">Completed</td>
+                    <td style="text-align:center">{keyword_item.name}</td>
+                    <td style="text-align:center">{"   ".join([safe_str(a) for a in keyword_item.args])}</td>
+                    <td style="text-align:center">{keyword_item.doc}</td>
+                    <td id="status{keyword_item.result.status.lower()}">{keyword_item.result.status}</td>
+                </tr>
+            </table>
+
+            """
+
+
+def legacy_render(keyword_item):
+    """the start+end tables as they were rendered before the log renderer"""
+    return legacy_start(keyword_item) + legacy_end(keyword_item)
+
+
+def renderer_render(renderer):
+    """returns a callable rendering start+end messages with the given renderer"""
+
+    def _render(keyword_item):
+        return renderer.render_start(keyword_item) + renderer.render_end(keyword_item)
+
+    return _render
+
+
+class LegacyRenderer(CoroutineLogRenderer):
+    """renders like the library did before `CoroutineLogRenderer` was introduced"""
+
+    def write_style(self) -> None:
+        pass
+
+    def start_keyword(self, keyword_item) -> None:
+        BuiltIn().log(legacy_start(keyword_item), html=True)
+
+    def end_keyword(self, keyword_item) -> None:
+        BuiltIn().log(legacy_end(keyword_item), html=True)
+
+
+def run_suite(log_level: str, coroutines: int):
+    """runs a bundle with robot, returns elapsed seconds and output.xml size"""
+    with tempfile.TemporaryDirectory() as tmp:
+        suite = os.path.join(tmp, "bundle.robot")
+        output = os.path.join(tmp, "output.xml")
+        with open(suite, "w", encoding="utf-8") as suite_file:
+            suite_file.write(SUITE)
+        factory = (
+            LegacyRenderer if log_level == "legacy" else CoroutineLogRenderer
+        )
+        with mock.patch("GeventLibrary.execution.CoroutineLogRenderer", factory):
+            started = time.perf_counter()
+            robot.run(
+                suite,
+                output=output,
+                log=None,
+                report=None,
+                stdout=StringIO(),
+                variable=[
+                    f"COROUTINES:{coroutines}",
+                    f"LOG_LEVEL:{'FULL' if log_level == 'legacy' else log_level}",
+                ],
+            )
+            elapsed = time.perf_counter() - started
+        return elapsed, os.path.getsize(output)
+
+
+def main(number: int = 100_000, coroutines: int = 2_000):
+    """prints per keyword time and log size of every rendering mode"""
+    print("rendering only")
+    modes = {
+        "legacy": legacy_render,
+        "FULL": renderer_render(CoroutineLogRenderer("FULL")),
+        "ONELINE": renderer_render(CoroutineLogRenderer("ONELINE")),
+    }
+    print(f"{'mode':<10}{'usec/keyword':>15}{'bytes/keyword':>15}")
+    for name, render in modes.items():
+        seconds = timeit.timeit(lambda r=render: r(KEYWORD_ITEM), number=number)
+        size = len(render(KEYWORD_ITEM).encode())
+        print(f"{name:<10}{seconds / number * 1e6:>15.2f}{size:>15}")
+    print(f"{'NONE':<10}{0:>15.2f}{0:>15}")
+
+    print(f"\nrobot run, bundle of {coroutines} coroutines")
+    print(f"{'mode':<10}{'usec/keyword':>15}{'output bytes':>15}")
+    for log_level in ("legacy", "NESTED", "FULL", "ONELINE", "NONE"):
+        elapsed, size = run_suite(log_level, coroutines)
+        print(f"{log_level:<10}{elapsed / coroutines * 1e6:>15.2f}{size:>15}")
+
+
+if __name__ == "__main__":
+    main()
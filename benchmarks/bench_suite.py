@@ -0,0 +1,446 @@
+"""Reproducible benchmarks of the coroutine scheduling and logging overhead.
+
+Measures:
+    spawn_join  - `Run Coroutines` overhead per coroutine of a keyword doing nothing,
+                  robot itself is mocked out so only the library cost is measured
+    http        - time per coroutine of a GET request against a local stand-in server,
+                  which replaces remote services so network noise does not creep in
+    http_pooled - the same requests added by `Add HTTP Coroutine`, sent over kept connections
+    memory      - peak memory allocated per coroutine while a bundle is running
+    logging     - per coroutine time of routing and logging the start and end events
+                  of its keyword in every log level (NONE included, the overhead of a level
+                  is its difference to NONE), the output itself is a no-op,
+                  see bench_log_rendering.py for the cost of robot writing the log
+
+Every measurement is repeated for bundles of 10 coroutines up to ``--max-coroutines``
+and the best of ``--repeat`` runs is kept. Results are written as json
+(``benchmarks/results/latest.json`` by default) and can be compared
+to the results of a previous release, kept in ``benchmarks/results/<version>.json``,
+slower measurements are reported as regressions,
+every measurement of the previous release must be positive.
+``--revision`` measures the sources of another git revision instead of the working tree,
+measurements its library does not support are skipped, to record the results of a release.
+
+    python benchmarks/bench_suite.py
+    python benchmarks/bench_suite.py --max-coroutines 1000 --compare benchmarks/results/0.7.0.json
+    python benchmarks/bench_suite.py --revision <release> --output benchmarks/results/<version>.json
+"""
+# the library is imported once the sources to measure are on the path
+# and the standard library is patched
+# pylint: disable=wrong-import-position,import-outside-toplevel
+import argparse
+import gc
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from importlib import metadata
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import gevent
+import robot
+from gevent.pywsgi import WSGIServer
+
+from bench_import import extract_sources
+
+DISTRIBUTION = "robotframework-gevent"
+SIZES = (10, 100, 1_000, 10_000, 100_000)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+# the keyword logged by the logging measurement, as robot passes it to the output
+KEYWORD_ITEM = SimpleNamespace(
+    name="GET",
+    args=("https://jsonplaceholder.typicode.com/posts/1", "expected_status=200"),
+    doc="Sends a GET request.",
+    result=SimpleNamespace(status="PASS"),
+)
+
+
+class StandInServer:
+    """A local http server answering every request with a small json body"""
+
+    BODY = b'{"userId": 1, "id": 1, "title": "stand in"}'
+
+    def __init__(self) -> None:
+        self._server = WSGIServer(("127.0.0.1", 0), self._application, log=None)
+
+    def _application(self, _environ, start_response):
+        start_response(
+            "200 OK",
+            [
+                ("Content-Type", "application/json"),
+                ("Content-Length", str(len(self.BODY))),
+            ],
+        )
+        return [self.BODY]
+
+    @property
+    def url(self) -> str:
+        """url of the server"""
+        return f"http://127.0.0.1:{self._server.server_port}/posts/1"
+
+    def __enter__(self) -> "StandInServer":
+        self._server.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.stop()
+
+
+def _get(url: str) -> int:
+    from urllib.request import urlopen
+
+    with urlopen(url, timeout=10) as response:
+        response.read()
+        return response.status
+
+
+KEYWORDS: Dict[str, Callable[..., Any]] = {
+    "No Operation": lambda: None,
+    "GET": _get,
+}
+
+
+def _run_keyword(keyword_name: str, *args: Any) -> Any:
+    return KEYWORDS[keyword_name](*args)
+
+
+def _context() -> mock.MagicMock:
+    """robot's execution context, the stacks forked for every coroutine are plain lists
+    as they are in a robot run, so forking them is not measured as mock calls"""
+    context = mock.MagicMock()
+    del context.step_types
+    context.steps = []
+    context.user_keywords = []
+    context.variables._scopes = []  # pylint: disable=protected-access
+    context.variables._variables_set._scopes = []  # pylint: disable=protected-access
+    return context
+
+
+def load_library(src: str) -> None:
+    """puts the sources to measure first on the path and patches the standard library,
+    so urllib is cooperative, as the measured library patches it"""
+    sys.path.insert(0, src)
+    try:
+        from GeventLibrary.patching import MonkeyPatching
+    except ImportError:
+        # releases before the patching moments patched when the library was imported
+        import GeventLibrary.gevent_library  # pylint: disable=unused-import
+    else:
+        MonkeyPatching().patch()
+
+
+def _run(library: Any, pool_size: int = 0) -> None:
+    """runs the bundle without logging the keywords of its coroutines"""
+    try:
+        from GeventLibrary.execution import RunSettings
+    except ImportError:
+        # releases without log levels, their mocked keywords log nothing
+        library.run_coroutines(gevent_pool_size=pool_size)
+    else:
+        library.run_coroutines(
+            gevent_pool_size=pool_size, settings=RunSettings(log_level="NONE")
+        )
+
+
+def run_bundle(size: int, keyword_name: str, *args: Any, pool_size: int = 0) -> float:
+    """runs a bundle with robot mocked out, returns elapsed seconds of `Run Coroutines`"""
+    from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+    with mock.patch(
+        "robot.libraries.BuiltIn.BuiltIn.run_keyword", side_effect=_run_keyword
+    ), mock.patch("robot.running.context.ExecutionContexts.current", _context()):
+        library = GeventKeywords()
+        library.create_gevent_bundle()
+        if hasattr(library, "add_coroutines"):
+            library.add_coroutines(keyword_name, *args, count=size)
+        else:
+            for _ in range(size):
+                library.add_coroutine(keyword_name, *args)
+        started = time.perf_counter()
+        _run(library, pool_size)
+        return time.perf_counter() - started
+
+
+def run_http_bundle(size: int, url: str, per_host: int = 100) -> float:
+    """runs a bundle of HTTP coroutines, returns elapsed seconds of `Run Coroutines`"""
+    from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+    with mock.patch("robot.running.context.ExecutionContexts.current", _context()):
+        library = GeventKeywords(http_connections_per_host=per_host)
+        library.create_gevent_bundle()
+        for _ in range(size):
+            library.add_http_coroutine("GET", url)
+        started = time.perf_counter()
+        _run(library)
+        elapsed = time.perf_counter() - started
+        library._resources.close()  # pylint: disable=protected-access
+        return elapsed
+
+
+def best_of(repeat: int, function: Callable[[], float]) -> float:
+    """the fastest of the given number of runs, garbage is collected between runs"""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        timings.append(function())
+    return min(timings)
+
+
+def measure_memory(size: int) -> float:
+    """peak bytes allocated per coroutine while a bundle of `No Operation` is running"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run_bundle(size, "No Operation")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / size
+
+
+class NullOutput:
+    """robot output that drops everything"""
+
+    def start_keyword(self, keyword_item) -> None:
+        """drops the event"""
+
+    def end_keyword(self, keyword_item) -> None:
+        """drops the event"""
+
+
+def _log_keywords(output: Any, size: int) -> float:
+    """elapsed seconds of starting and ending one keyword in each of size greenlets"""
+
+    def _keyword():
+        output.start_keyword(KEYWORD_ITEM)
+        output.end_keyword(KEYWORD_ITEM)
+
+    started = time.perf_counter()
+    gevent.joinall([gevent.spawn(_keyword) for _ in range(size)])
+    return time.perf_counter() - started
+
+
+def measure_logging(size: int, log_level: str) -> float:
+    """elapsed seconds of routing and logging one keyword in each of size coroutines"""
+    from GeventLibrary.execution import CoroutineLogRenderer, CoroutineOutputRouter
+
+    output = NullOutput()
+    renderer = CoroutineLogRenderer(log_level)
+
+    def _keyword():
+        output.start_keyword(KEYWORD_ITEM)
+        output.end_keyword(KEYWORD_ITEM)
+
+    with mock.patch("robot.api.logger.write", lambda *args, **kwargs: None):
+        router = CoroutineOutputRouter.acquire(output)
+        try:
+            started = time.perf_counter()
+            gevent.joinall(
+                [router.spawn(gevent.spawn, renderer, _keyword) for _ in range(size)]
+            )
+            return time.perf_counter() - started
+        finally:
+            router.release()
+
+
+def measure_legacy_logging(size: int) -> float:
+    """elapsed seconds of logging one keyword in each of size coroutines
+    by releases logging an html table per keyword event"""
+    from GeventLibrary.keywords.gevent_keywords import monkey_patch_robot_ctx
+
+    context = mock.MagicMock()
+    context.output = NullOutput()
+    with mock.patch(
+        "robot.running.context.ExecutionContexts.current", context
+    ), mock.patch("robot.libraries.BuiltIn.BuiltIn.log"), monkey_patch_robot_ctx():
+        return _log_keywords(context.output, size)
+
+
+def run_benchmarks(
+    max_coroutines: int, max_requests: int, repeat: int
+) -> Dict[str, Any]:
+    """runs all the benchmarks the measured library supports,
+    returns the results keyed by measurement name"""
+    from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+    sizes = [size for size in SIZES if size <= max_coroutines]
+    pooled = hasattr(GeventKeywords, "add_http_coroutine")
+    results: Dict[str, Dict[str, float]] = {
+        "spawn_join_usec": {},
+        "http_usec": {},
+        "memory_bytes": {},
+        "logging_usec": {},
+    }
+    if pooled:
+        results["http_pooled_usec"] = {}
+    run_bundle(sizes[0], "No Operation")  # warm up imports and caches
+    for size in sizes:
+        elapsed = best_of(repeat, lambda s=size: run_bundle(s, "No Operation"))
+        results["spawn_join_usec"][str(size)] = elapsed / size * 1e6
+        results["memory_bytes"][str(size)] = measure_memory(size)
+        print(f"spawn/join {size:>7}: {elapsed / size * 1e6:10.2f} usec/coroutine")
+
+    with StandInServer() as server:
+        for size in [size for size in sizes if size <= max_requests]:
+            elapsed = best_of(
+                repeat, lambda s=size: run_bundle(s, "GET", server.url, pool_size=100)
+            )
+            results["http_usec"][str(size)] = elapsed / size * 1e6
+            print(f"http       {size:>7}: {elapsed / size * 1e6:10.2f} usec/coroutine")
+            if pooled:
+                elapsed = best_of(repeat, lambda s=size: run_http_bundle(s, server.url))
+                results["http_pooled_usec"][str(size)] = elapsed / size * 1e6
+                print(
+                    f"http pool  {size:>7}: {elapsed / size * 1e6:10.2f} usec/coroutine"
+                )
+
+    logging_size = min(max_coroutines, 10_000)
+    try:
+        from GeventLibrary.execution import (
+            CoroutineLogRenderer,
+        )  # pylint: disable=unused-import
+    except ImportError:
+        # releases logging an html table per keyword event, the FULL level of later releases
+        levels = {"FULL": lambda: measure_legacy_logging(logging_size)}
+    else:
+        levels = {
+            log_level: lambda l=log_level: measure_logging(logging_size, l)
+            for log_level in ("NONE", "NESTED", "FULL", "ONELINE")
+        }
+    for log_level, measurement in levels.items():
+        elapsed = best_of(repeat, measurement)
+        results["logging_usec"][log_level] = elapsed / logging_size * 1e6
+        print(
+            f"logging {log_level:>10}: "
+            f"{results['logging_usec'][log_level]:10.2f} usec/coroutine"
+        )
+    return results
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=ROOT, check=True, capture_output=True, text=True
+    ).stdout
+
+
+def library_version(revision: Optional[str]) -> str:
+    """the version of the measured library: of the project file at the given revision,
+    otherwise of the installed distribution, or of the project file of the working tree"""
+    if revision is None:
+        try:
+            return metadata.version(DISTRIBUTION)
+        except metadata.PackageNotFoundError:
+            with open(
+                os.path.join(ROOT, "pyproject.toml"), encoding="utf-8"
+            ) as project:
+                project_file = project.read()
+    else:
+        project_file = _git("show", f"{revision}:pyproject.toml")
+    return re.search(r'^version = "(.+)"$', project_file, re.MULTILINE).group(1)
+
+
+def environment(revision: Optional[str]) -> Dict[str, str]:
+    """versions the results were measured with"""
+    return {
+        "library": library_version(revision),
+        "revision": _git("rev-parse", revision or "HEAD").strip()
+        + ("" if revision else " + working tree"),
+        "python": platform.python_version(),
+        "gevent": gevent.__version__,
+        "robotframework": robot.version.VERSION,
+        "platform": platform.platform(),
+        "cpus": str(os.cpu_count()),
+    }
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """lists the measurements that are slower (or bigger) than the baseline by more than threshold,
+    measurements missing from the baseline are skipped"""
+    regressions = []
+    for name, values in results.items():
+        for key, value in values.items():
+            previous = baseline.get(name, {}).get(key)
+            if previous is None:
+                continue
+            if previous <= 0:
+                raise ValueError(
+                    f"Baseline of {name}[{key}] must be a positive value, got {previous}"
+                )
+            ratio = value / previous
+            if ratio > 1 + threshold:
+                regressions.append(
+                    f"{name}[{key}]: {previous:.2f} -> {value:.2f} ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def main(argv=None) -> int:
+    """runs the suite, stores the results and compares them to a baseline"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-coroutines", type=int, default=SIZES[-1])
+    parser.add_argument("--max-requests", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default=os.path.join(RESULTS_DIR, "latest.json"))
+    parser.add_argument("--compare", help="results file of a previous run")
+    parser.add_argument(
+        "--revision",
+        help="git revision of the library to measure, the working tree by default",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative slowdown reported as a regression",
+    )
+    options = parser.parse_args(argv)
+
+    # the baseline is read before anything is written, it is never overwritten by the results
+    baseline = None
+    if options.compare:
+        if os.path.abspath(options.compare) == os.path.abspath(options.output):
+            parser.error("--output must not be the --compare file")
+        with open(options.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+
+    with tempfile.TemporaryDirectory() as directory:
+        load_library(
+            extract_sources(_git("rev-parse", options.revision).strip(), directory)
+            if options.revision
+            else os.path.join(ROOT, "src")
+        )
+        results = run_benchmarks(
+            options.max_coroutines, options.max_requests, options.repeat
+        )
+    os.makedirs(os.path.dirname(os.path.abspath(options.output)), exist_ok=True)
+    with open(options.output, "w", encoding="utf-8") as results_file:
+        json.dump(
+            {"environment": environment(options.revision), "results": results},
+            results_file,
+            indent=2,
+        )
+    print(f"results written to {options.output}")
+
+    if baseline is not None:
+        try:
+            regressions = compare(results, baseline, options.threshold)
+        except ValueError as error:
+            parser.error(str(error))
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,19 @@
 # pylint: disable=missing-module-docstring
 # pylint: disable=invalid-name
-from .gevent_library import GeventLibrary
+# the library is imported on first use of its name, so ``GeventLibrary.patching``
+# and ``python -m GeventLibrary`` patch before robot itself is imported
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .gevent_library import GeventLibrary
+
+__all__ = ["GeventLibrary"]
+
+
+def __getattr__(name: str) -> Any:
+    if name != "GeventLibrary":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from .gevent_library import GeventLibrary  # pylint: disable=import-outside-toplevel
+
+    globals()[name] = GeventLibrary
+    return GeventLibrary
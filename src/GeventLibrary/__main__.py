@@ -0,0 +1,19 @@
+"""runs robot after gevent patched the standard library
+
+    python -m GeventLibrary [robot options] path/to/tests
+
+modules imported by robot itself (and by listeners, pre-run modifiers or variable files)
+get the cooperative versions, the subsystems are configured by
+the ``GEVENT_LIBRARY_PATCH_SUBSYSTEMS`` environment variable.
+"""
+# genevt monkey patch should be placed at the top
+# pylint: disable=wrong-import-position
+# pylint: disable=wrong-import-order
+from GeventLibrary.patching import MonkeyPatching
+
+MonkeyPatching().patch()
+
+from robot import run_cli
+
+if __name__ == "__main__":
+    run_cli()
@@ -11,3 +11,54 @@ class BundleHasNoCoroutines(Exception):
 
 class AliasAlreadyCreated(Exception):
     """exception bundle alias already exists"""
+
+
+class NoPendingCoroutines(Exception):
+    """exception when all values of a bundle were already returned"""
+
+
+class CoroutinesFailed(Exception):
+    """exception when one or more coroutines of a bundle failed"""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        details = "\n".join(
+            f"    {type(error).__name__}: {error}" for error in self.errors
+        )
+        super().__init__(f"{len(self.errors)} coroutine(s) failed:\n{details}")
+
+
+class CoroutinesTimedOut(Exception):
+    """exception when coroutines of a bundle did not complete within the timeout"""
+
+    def __init__(self, timeout, stragglers, survivors=()):
+        self.timeout = timeout
+        self.stragglers = list(stragglers)
+        # coroutines that were still running once the grace period after killing them ended
+        self.survivors = list(survivors)
+        details = "\n".join(
+            f"    {record.spec.keyword_name}    {'    '.join(str(arg) for arg in record.spec.args)}"
+            + (
+                "    (never started)"
+                if record.elapsed is None
+                else f"    (ran for {record.elapsed:.3f}s)"
+            )
+            + ("    (still running after being killed)" if record in self.survivors else "")
+            for record in self.stragglers
+        )
+        super().__init__(
+            f"{len(self.stragglers)} coroutine(s) did not complete within {timeout} seconds:\n"
+            f"{details}"
+        )
+
+
+class PoolAlreadyCreated(Exception):
+    """exception pool name already exists"""
+
+
+class BundleIsTemplate(Exception):
+    """exception when coroutines are added to a bundle kept as a template"""
+
+
+class UnsupportedRobotVersion(Exception):
+    """exception when robot's internals the library builds on may differ from the supported versions"""
@@ -0,0 +1,94 @@
+# pylint: disable=missing-module-docstring
+# the modules are imported on first use of their names, suites do not pay for
+# the backends and monitors they never use
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .adaptive import AdaptiveConcurrency, ConcurrencyLimiter
+    from .asyncio_bridge import AsyncioBridge
+    from .background import BackgroundBundle
+    from .blocking_monitor import BlockingMonitor, HubBlock
+    from .bundle_run import BundleRun, RobotContext, acquire_robot_ctx, keyword_names
+    from .context_stacks import CoroutineContextStacks, GreenletLocalStack
+    from .dependencies import DependencyGraph
+    from .fail_fast import FailFast
+    from .http_pool import HttpConnectionPool, HttpResponse
+    from .keyword_cache import KeywordRunnerCache
+    from .kills import KILL_GRACE_PERIOD
+    from .log_renderer import LOG_LEVELS, CoroutineLogRenderer
+    from .output_router import CoroutineOutputRouter
+    from .process_backend import BACKENDS, ProcessBackend, resolve_invocation
+    from .progress import ProgressReporter, ProgressReporting
+    from .records import (
+        CoroutineRecord,
+        CoroutineRecords,
+        CoroutineSpec,
+        SpecBatch,
+        common_specs,
+        queued_on_submit,
+        with_retry_policy,
+    )
+    from .remote_backend import RemoteBackend
+    from .result_buffer import CoroutineResultBuffer
+    from .retry import RetryPolicy
+    from .run_settings import RunSettings
+    from .scheduling import SpawnScheduler, TokenBucket
+    from .statistics import BundleStatistics
+    from .stream import CoroutineStream
+    from .thread_offload import ThreadOffload
+
+_MODULES = {
+    "AdaptiveConcurrency": "adaptive",
+    "ConcurrencyLimiter": "adaptive",
+    "AsyncioBridge": "asyncio_bridge",
+    "KILL_GRACE_PERIOD": "kills",
+    "BackgroundBundle": "background",
+    "BlockingMonitor": "blocking_monitor",
+    "HubBlock": "blocking_monitor",
+    "BundleRun": "bundle_run",
+    "RobotContext": "bundle_run",
+    "acquire_robot_ctx": "bundle_run",
+    "keyword_names": "bundle_run",
+    "CoroutineContextStacks": "context_stacks",
+    "GreenletLocalStack": "context_stacks",
+    "DependencyGraph": "dependencies",
+    "FailFast": "fail_fast",
+    "HttpConnectionPool": "http_pool",
+    "HttpResponse": "http_pool",
+    "KeywordRunnerCache": "keyword_cache",
+    "LOG_LEVELS": "log_renderer",
+    "CoroutineLogRenderer": "log_renderer",
+    "CoroutineOutputRouter": "output_router",
+    "BACKENDS": "process_backend",
+    "ProcessBackend": "process_backend",
+    "resolve_invocation": "process_backend",
+    "ProgressReporter": "progress",
+    "ProgressReporting": "progress",
+    "CoroutineRecord": "records",
+    "CoroutineRecords": "records",
+    "CoroutineSpec": "records",
+    "SpecBatch": "records",
+    "common_specs": "records",
+    "queued_on_submit": "records",
+    "with_retry_policy": "records",
+    "RemoteBackend": "remote_backend",
+    "CoroutineResultBuffer": "result_buffer",
+    "RetryPolicy": "retry",
+    "RunSettings": "run_settings",
+    "SpawnScheduler": "scheduling",
+    "TokenBucket": "scheduling",
+    "BundleStatistics": "statistics",
+    "CoroutineStream": "stream",
+    "ThreadOffload": "thread_offload",
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_MODULES[name]}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,129 @@
+"""adaptive concurrency of a bundle run, from the latency and failures of its coroutines"""
+from time import monotonic
+from typing import Callable, List, Optional, Tuple
+
+from gevent import Greenlet
+from gevent.event import Event
+
+from .kills import failed
+
+# weight of the latest latency in the smoothed latency
+SMOOTHING = 0.2
+
+
+class AdaptiveConcurrency:  # pylint: disable=too-few-public-methods
+    """Settings of the adaptive concurrency of bundle runs, every run adapts a limiter of its own.
+
+    ``initial``             - coroutines running at once when the run starts
+    ``minimum``             - the limit never goes below
+    ``maximum``             - the limit never goes above
+    ``latency_tolerance``   - smoothed latency, relative to the lowest latency seen,
+                              considered as overload
+    ``backoff``             - factor the limit is multiplied by on overload or failure
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        *,
+        minimum: int = 1,
+        maximum: int = 1000,
+        latency_tolerance: float = 2.0,
+        backoff: float = 0.5,
+    ) -> None:
+        if minimum < 1:
+            raise ValueError(f"'minimum' must be a positive value, got {minimum}")
+        if maximum < minimum:
+            raise ValueError(f"'maximum' must not be less than 'minimum', got {maximum}")
+        if not minimum <= initial <= maximum:
+            raise ValueError(
+                f"'initial' must be between 'minimum' and 'maximum', got {initial}"
+            )
+        if latency_tolerance <= 1:
+            raise ValueError(
+                f"'latency_tolerance' must be greater than 1, got {latency_tolerance}"
+            )
+        if not 0 < backoff < 1:
+            raise ValueError(f"'backoff' must be between 0 and 1, got {backoff}")
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+
+    def limiter(self) -> "ConcurrencyLimiter":
+        """a limiter for a single run"""
+        return ConcurrencyLimiter(self)
+
+
+class ConcurrencyLimiter:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """Limits the coroutines running at once by additive increase, multiplicative decrease.
+
+    Every completed coroutine adapts the limit by its latency (spawn to completion)
+    and whether it failed. A failure, or a smoothed latency beyond the tolerance over
+    the lowest latency seen, multiplies the limit by the backoff. Only coroutines spawned
+    after the previous decrease can decrease it again, the coroutines that were already
+    running reflect the previous limit. Otherwise the limit grows by one per completion
+    until the first decrease (slow start), and by one per limit completions afterwards.
+    Killed coroutines only free their slot, their latency and kill say nothing of the load.
+    Every change of the limit is kept in ``history`` with the seconds since the run started.
+    """
+
+    def __init__(self, settings: AdaptiveConcurrency) -> None:
+        self._settings = settings
+        self.limit = float(settings.initial)
+        self._running = 0
+        self._slot = Event()
+        self._started = monotonic()
+        self._last_decrease: Optional[float] = None
+        self._min_latency: Optional[float] = None
+        self._latency: Optional[float] = None
+        self.history: List[Tuple[float, int]] = [(0.0, settings.initial)]
+
+    def wrap(self, spawn_callable: Callable[..., Greenlet]) -> Callable[..., Greenlet]:
+        """wraps a spawn callable, so every spawn waits for the limit to allow it"""
+
+        def _spawn(function, *args):
+            while self._running >= int(self.limit):
+                self._slot.clear()
+                self._slot.wait()
+            self._running += 1
+            spawned = monotonic()
+            greenlet = spawn_callable(function, *args)
+            greenlet.link(lambda done: self._completed(done, spawned))
+            return greenlet
+
+        return _spawn
+
+    def _completed(self, greenlet: Greenlet, spawned: float) -> None:
+        self._running -= 1
+        if greenlet.exception is not None and not failed(greenlet):
+            self._slot.set()
+            return
+        now = monotonic()
+        latency = now - spawned
+        if self._min_latency is None or latency < self._min_latency:
+            self._min_latency = latency
+        self._latency = (
+            latency
+            if self._latency is None
+            else self._latency + SMOOTHING * (latency - self._latency)
+        )
+        overloaded = (
+            failed(greenlet)
+            or self._latency > self._min_latency * self._settings.latency_tolerance
+        )
+        previous = int(self.limit)
+        if overloaded:
+            if self._last_decrease is None or spawned >= self._last_decrease:
+                self.limit = max(
+                    self._settings.minimum, self.limit * self._settings.backoff
+                )
+                self._last_decrease = now
+        elif self._last_decrease is None:
+            self.limit = min(self._settings.maximum, self.limit + 1)
+        else:
+            self.limit = min(self._settings.maximum, self.limit + 1 / self.limit)
+        if int(self.limit) != previous:
+            self.history.append((now - self._started, int(self.limit)))
+        self._slot.set()
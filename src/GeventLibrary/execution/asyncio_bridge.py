@@ -0,0 +1,102 @@
+"""running the coroutines of async keywords on an asyncio loop driven by the gevent hub"""
+import asyncio
+import inspect
+from asyncio import events
+from typing import Any, Coroutine, Optional
+
+from gevent import Greenlet, getcurrent, spawn
+from gevent.event import AsyncResult
+from gevent.selectors import GeventSelector
+from robot.running.context import EXECUTION_CONTEXTS
+
+
+class _HubSelector(GeventSelector):
+    """Waits for asyncio's events cooperatively.
+
+    asyncio marks the running loop per thread, while the loop's greenlet waits
+    other greenlets run on the same thread, maybe running loops of their own.
+    The loop is marked as running only while its greenlet runs,
+    the loop marked by the other greenlets is restored meanwhile.
+    """
+
+    loop: Optional[asyncio.AbstractEventLoop] = None
+    outer: Optional[asyncio.AbstractEventLoop] = None
+
+    def select(self, timeout=None):
+        events._set_running_loop(self.outer)  # pylint: disable=protected-access
+        try:
+            return super().select(timeout)
+        finally:
+            self.outer = events._get_running_loop()  # pylint: disable=protected-access
+            events._set_running_loop(self.loop)  # pylint: disable=protected-access
+
+
+class AsyncioBridge:
+    """Runs the coroutines returned by ``async def`` keywords on a single asyncio loop.
+
+    The loop runs forever in its own greenlet and waits for its events through the gevent hub,
+    so a greenlet awaiting a coroutine yields to the other greenlets of the bundle
+    and thousands of async keywords are awaited concurrently on the one loop.
+    It replaces the loop robot uses for async keywords (robotframework 6.1 and newer),
+    which is run to completion by every keyword and cannot be shared by concurrent greenlets.
+    """
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._greenlet: Optional[Greenlet] = None
+
+    @classmethod
+    def install(cls, context) -> None:
+        """replaces robot's asyncio loop of the given execution context, if robot has one"""
+        current = getattr(context, "asynchronous", None)
+        if current is None or isinstance(current, cls):
+            return
+        bridge = cls()
+        context.asynchronous = bridge
+        # pylint: disable=protected-access
+        if current is getattr(EXECUTION_CONTEXTS, "_asynchronous", None):
+            # contexts of child suites are created with the shared instance
+            EXECUTION_CONTEXTS._asynchronous = bridge
+            current.close_loop()
+
+    @property
+    def event_loop(self) -> asyncio.AbstractEventLoop:
+        """the shared loop, started on first use"""
+        if self._loop is None:
+            selector = _HubSelector()
+            self._loop = selector.loop = asyncio.SelectorEventLoop(selector)
+            self._greenlet = spawn(self._run_forever, selector)
+        return self._loop
+
+    def _run_forever(self, selector: _HubSelector) -> None:
+        # a loop run by another greenlet may be marked as running while it waits
+        selector.outer = events._get_running_loop()  # pylint: disable=protected-access
+        events._set_running_loop(None)  # pylint: disable=protected-access
+        try:
+            self._loop.run_forever()
+        finally:
+            events._set_running_loop(selector.outer)  # pylint: disable=protected-access
+
+    def is_loop_required(self, obj: Any) -> bool:
+        """whether the keyword returned a coroutine that still has to be awaited"""
+        return inspect.iscoroutine(obj) and getcurrent() is not self._greenlet
+
+    def run_until_complete(self, coroutine: Coroutine) -> Any:
+        """awaits the coroutine on the shared loop, only the calling greenlet waits for it"""
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.event_loop)
+        result = AsyncResult()
+        future.add_done_callback(result.set)
+        try:
+            return result.get().result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def close_loop(self) -> None:
+        """stops and closes the shared loop"""
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._greenlet.join()
+        self._loop.close()
+        self._loop = self._greenlet = None
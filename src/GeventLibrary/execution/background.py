@@ -0,0 +1,155 @@
+"""bundles running in the background while the test goes on"""
+from itertools import zip_longest
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from gevent import Greenlet, Timeout, joinall, spawn
+from robot.api import logger
+
+from GeventLibrary.exceptions import CoroutinesTimedOut, NoPendingCoroutines
+
+from .kills import KILL_GRACE_PERIOD
+from .log_renderer import CoroutineLogRenderer
+from .records import CoroutineRecord
+from .statistics import BundleStatistics
+
+if TYPE_CHECKING:
+    from .bundle_run import RobotContext
+
+
+class BackgroundBundle:  # pylint: disable=too-many-instance-attributes
+    """Handle of a bundle started by `Start Coroutines`.
+
+    The coroutines are spawned by a feeder greenlet, so neither a full pool
+    nor a paced scheduler block the caller. While the bundle is running the output router
+    yields to the gevent hub between keywords of the regular robot flow,
+    so the coroutines progress alongside synchronous keywords.
+    Buffered results are written once the bundle is waited for or cancelled.
+    """
+
+    # whether waiting returns the values, or only the number of coroutines by status
+    keep_values = True
+    # seconds given to the killed coroutines to finish their cleanup
+    kill_grace_period = KILL_GRACE_PERIOD
+
+    def __init__(
+        self,
+        alias: str,
+        robot_ctx: "RobotContext",
+        renderer: CoroutineLogRenderer,
+        records: List[CoroutineRecord],
+    ) -> None:
+        self.alias = alias
+        self._robot_ctx: Optional["RobotContext"] = robot_ctx
+        self._renderer = renderer
+        self._records = records
+        self._jobs: List[Greenlet] = []
+        self._feeder: Optional[Greenlet] = None
+
+    def __repr__(self) -> str:
+        state = "finished" if self.finished else f"{self.running} running"
+        return f"<BackgroundBundle alias={self.alias} coroutines={len(self._records)} {state}>"
+
+    @property
+    def finished(self) -> bool:
+        """whether the bundle was already waited for or cancelled"""
+        return self._robot_ctx is None
+
+    @property
+    def running(self) -> int:
+        """number of coroutines that were spawned and did not complete yet"""
+        return sum(1 for job in self._jobs if not job.ready())
+
+    def start(
+        self,
+        spawn_callable: Callable[..., Greenlet],
+        calls: Iterable[Tuple[Callable, Tuple]],
+    ) -> None:
+        """spawns the calls from a feeder greenlet"""
+        self._robot_ctx.router.yield_between_keywords(True)
+        self._feeder = spawn(self._feed, spawn_callable, calls)
+
+    def _feed(self, spawn_callable, calls) -> None:
+        for function, args in calls:
+            self._jobs.append(
+                self._robot_ctx.router.spawn(
+                    spawn_callable, self._renderer, function, *args, defer_flush=True
+                )
+            )
+
+    def wait(self, timeout: float) -> Union[List[Any], Dict[str, int]]:
+        """waits for all the coroutines and returns their values by order
+        (or their number by status when values are not kept),
+        raises the first exception of a failed coroutine,
+        or `CoroutinesTimedOut` after killing the coroutines that did not complete in time"""
+        self._check_not_finished()
+        deadline = monotonic() + timeout
+        with Timeout(timeout, False):
+            self._feeder.join()
+        joinall(self._jobs, timeout=max(0, deadline - monotonic()))
+        completed = [job for job in self._jobs if job.ready()]
+        stragglers = [
+            record
+            for record, job in zip_longest(self._records, self._jobs)
+            if job is None or not job.ready()
+        ]
+        survivors = self._stop()
+
+        for job in completed:
+            if job.exception:
+                raise job.exception
+        if stragglers:
+            raise CoroutinesTimedOut(
+                timeout,
+                stragglers,
+                [
+                    record
+                    for record, job in zip(self._records, self._jobs)
+                    if job in survivors
+                ],
+            )
+        if not self.keep_values:
+            return BundleStatistics(self._records).statuses
+        return [job.value for job in self._jobs]
+
+    def cancel(self) -> int:
+        """kills the coroutines that did not complete yet,
+        returns the number of coroutines that were killed or never started,
+        coroutines still running after the kill grace period are reported as a warning"""
+        self._check_not_finished()
+        cancelled = len(self._records) - sum(1 for job in self._jobs if job.ready())
+        survivors = self._stop()
+        if survivors:
+            details = "\n".join(
+                f"    {record.spec.keyword_name}    "
+                + "    ".join(str(arg) for arg in record.spec.args)
+                for record, job in zip(self._records, self._jobs)
+                if job in survivors
+            )
+            logger.warn(
+                f"{len(survivors)} coroutine(s) of bundle {self.alias} were still running "
+                f"{self.kill_grace_period} seconds after being cancelled:\n{details}"
+            )
+        return cancelled
+
+    def _stop(self) -> List[Greenlet]:
+        # returns the greenlets that are still running after the kill grace period
+        self._feeder.kill()
+        running = [job for job in self._jobs if not job.ready()]
+        survivors = (
+            CoroutineRecord.kill(running, self.kill_grace_period) if running else []
+        )
+        router = self._robot_ctx.router
+        router.settle(self._jobs)
+        for job in self._jobs:
+            router.flush(job)
+        router.yield_between_keywords(False)
+        self._robot_ctx.release()
+        self._robot_ctx = None
+        return survivors
+
+    def _check_not_finished(self) -> None:
+        if self.finished:
+            raise NoPendingCoroutines(
+                f"Coroutines of bundle {self.alias} were already waited for or cancelled"
+            )
@@ -0,0 +1,203 @@
+"""detection of coroutines blocking the gevent hub"""
+import sys
+import threading
+import traceback
+import warnings
+from types import FrameType
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+import gevent
+import greenlet
+from gevent.monkey import get_original
+
+from .records import CoroutineRecord
+
+# innermost frames kept of the stack of a blocking coroutine
+STACK_LIMIT = 8
+
+
+class HubBlock(NamedTuple):
+    """a coroutine that did not yield to the hub for ``blocked`` seconds"""
+
+    keyword_name: str
+    args: Sequence[Any]
+    blocked: float
+    stack: str
+
+
+class _SwitchTracer:
+    """Counts the switches between the greenlets of the thread it is created in,
+    with greenlet's public trace function, the trace function it replaces is still called."""
+
+    def __init__(self) -> None:
+        self.switches = 0
+        self.active: Optional[Any] = greenlet.getcurrent()
+        self._killed = False
+        # the bound method given to greenlet, to tell whether it is still the trace function
+        self._function = self._trace
+        self._previous = greenlet.settrace(self._function)
+
+    def _trace(self, event: str, args: Tuple[Any, Any]) -> None:
+        if event in ("switch", "throw") and not self._killed:
+            self.switches += 1
+            self.active = args[1]
+        if self._previous is not None:
+            self._previous(event, args)
+
+    def did_block(self, hub: Any) -> Optional[Any]:
+        """the greenlet that did not switch since the previous call,
+        None when the thread switched meanwhile or the hub is waiting for events"""
+        switches, self.switches = self.switches, 0
+        active = self.active
+        if switches or active is None or active is hub:
+            return None
+        return active
+
+    def kill(self) -> None:
+        """stops counting, the replaced trace function is restored unless another one
+        was set on top of this one meanwhile, which keeps calling it"""
+        self._killed = True
+        if greenlet.gettrace() is self._function:
+            greenlet.settrace(self._previous)
+
+
+class _Monitoring:
+    """The monitoring shared by all the started monitors of the process: the tracer counting
+    the switches of the greenlets of the monitored thread, gevent's monitoring thread
+    and the monitors the blocks are reported to. A monitor is started by every run
+    using it, blocks are reported to it until each of its starts was stopped."""
+
+    def __init__(self) -> None:
+        self.active: List["BlockingMonitor"] = []
+        self.tracer: Optional[_SwitchTracer] = None
+        self.thread: Optional[Any] = None
+        self.thread_ident: Optional[int] = None
+
+    def start(self, monitor: "BlockingMonitor") -> None:
+        """starts reporting blocks to the monitor"""
+        gevent.config.monitor_thread = True
+        self.active.append(monitor)
+        self.update_period()
+        with warnings.catch_warnings():
+            # memory usage is not monitored, there is no need for psutil
+            warnings.simplefilter("ignore")
+            thread = gevent.get_hub().start_periodic_monitoring_thread()
+        if self.thread is not thread:
+            self.thread = thread
+            thread.add_monitoring_function(self.check, gevent.config.max_blocking_time)
+            thread.add_monitoring_function(thread.monitor_blocking, None)
+        if self.tracer is None:
+            # the tracer counts the switches of the greenlets of the current thread
+            self.tracer = _SwitchTracer()
+            self.thread_ident = threading.get_ident()
+
+    def stop(self, monitor: "BlockingMonitor") -> None:
+        """stops reporting blocks to the monitor, for one of its starts"""
+        if monitor not in self.active:
+            return
+        self.active.remove(monitor)
+        self.update_period()
+        if not self.active:
+            self.tracer.kill()
+            self.tracer = None
+
+    def update_period(self) -> None:
+        """the first monitoring function of the thread follows the configured blocking time,
+        without monitors the thread keeps its period and its checks do nothing
+        (gevent takes a zero blocking time for unset, which ends the thread)"""
+        if self.active:
+            gevent.config.max_blocking_time = min(
+                monitor.threshold for monitor in self.active
+            )
+
+    def check(self, hub) -> None:
+        """called periodically in the monitoring thread"""
+        tracer = self.tracer
+        if tracer is None:
+            return
+        blocking = tracer.did_block(hub)
+        record = CoroutineRecord.running.get(blocking)
+        period = gevent.config.max_blocking_time
+        if record is not None:
+            record.blocked += period
+        frame = (
+            sys._current_frames().get(self.thread_ident)  # pylint: disable=protected-access
+            if record is not None
+            else None
+        )
+        for monitor in list(self.active):
+            monitor.add(blocking, record, period, frame)
+
+
+_monitoring = _Monitoring()
+
+
+class BlockingMonitor:
+    """Detects coroutines blocking the gevent hub for longer than ``threshold`` seconds.
+
+    Built on gevent's monitoring thread, which checks every ``threshold`` seconds whether
+    the running greenlet switched since the previous check, the switches are counted by
+    a trace function of greenlet. A greenlet that did not switch
+    between consecutive checks is blocking every other greenlet, its blocks are attributed
+    to the coroutine running in it (other greenlets, like the regular robot flow, are ignored)
+    together with its stack, the blocked time of the coroutine's record accumulates.
+    The check replaces gevent's own, which prints the whole greenlet tree of every block,
+    it is shared by all the started monitors and runs with the smallest threshold among them.
+    The checks of the monitoring thread do nothing once the last monitor is stopped.
+    Blocks are detected in the monitoring thread, robot can log them only from the main thread,
+    so they are kept, behind a lock of a native thread, until they are taken by the library.
+    """
+
+    def __init__(self, threshold: float) -> None:
+        if threshold <= 0:
+            raise ValueError(
+                f"'blocking_threshold' must be a positive value, got {threshold}"
+            )
+        self.threshold = threshold
+        self._blocks: List[HubBlock] = []
+        self._last: Optional[Any] = None
+        # the monitoring thread adds the blocks while the hub's thread takes them
+        self._lock = get_original("threading", "Lock")()
+
+    def start(self) -> None:
+        """starts monitoring the hub of the current thread, once per call"""
+        _monitoring.start(self)
+
+    def stop(self) -> None:
+        """stops monitoring for one of the calls to `start`,
+        blocks are no longer detected once every call was stopped"""
+        _monitoring.stop(self)
+
+    def add(
+        self,
+        blocking: Any,
+        record: Optional[CoroutineRecord],
+        period: float,
+        frame: Optional[FrameType],
+    ) -> None:
+        """adds the block of a check of the monitoring thread, a greenlet that did not switch
+        since the previous check extends its block"""
+        if record is None:
+            with self._lock:
+                self._last = None
+            return
+        stack = (
+            "".join(traceback.format_stack(frame, limit=STACK_LIMIT)) if frame else ""
+        )
+        with self._lock:
+            if self._last is blocking and self._blocks:
+                self._blocks[-1] = self._blocks[-1]._replace(
+                    blocked=self._blocks[-1].blocked + period
+                )
+                return
+            self._last = blocking
+            self._blocks.append(
+                HubBlock(record.spec.keyword_name, record.spec.args, period, stack)
+            )
+
+    def take(self) -> List[HubBlock]:
+        """the blocks detected since the previous call"""
+        with self._lock:
+            blocks, self._blocks = self._blocks, []
+            self._last = None
+        return blocks
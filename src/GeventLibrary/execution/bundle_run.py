@@ -0,0 +1,412 @@
+"""a single run of the coroutines of a bundle"""
+from contextlib import ExitStack, contextmanager, nullcontext
+from functools import partial
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from gevent import Greenlet, Timeout, get_hub, joinall
+from robot.api import logger
+from robot.running.context import EXECUTION_CONTEXTS
+
+from GeventLibrary.exceptions import CoroutinesFailed, CoroutinesTimedOut
+
+from .asyncio_bridge import AsyncioBridge
+from .context_stacks import CoroutineContextStacks
+from .dependencies import DependencyGraph
+from .fail_fast import FailFast
+from .keyword_cache import KeywordRunnerCache
+from .kills import KILL_GRACE_PERIOD
+from .log_renderer import CoroutineLogRenderer
+from .output_router import CoroutineOutputRouter
+from .records import CoroutineRecord, CoroutineRecords, CoroutineSpec
+from .scheduling import SpawnScheduler
+from .thread_offload import ThreadOffload
+
+if TYPE_CHECKING:
+    from .adaptive import ConcurrencyLimiter
+    from .background import BackgroundBundle
+    from .blocking_monitor import BlockingMonitor
+    from .process_backend import ProcessBackend
+    from .progress import ProgressReporter
+    from .stream import CoroutineStream
+
+# the process backend, the streams and the background bundles are imported on first use
+# pylint: disable=import-outside-toplevel
+
+
+def keyword_names(
+    specs: Iterable[CoroutineSpec], result_keyword: Optional[str]
+) -> List[str]:
+    """the distinct keyword names run by the coroutines, including the result keyword"""
+    names = {spec.keyword_name: None for spec in specs if spec.run_keyword is None}
+    if result_keyword:
+        names[result_keyword] = None
+    return list(names)
+
+
+def _invocations(
+    records: Sequence[CoroutineRecord], run_keyword: Callable
+) -> Iterator[Tuple[Callable, Tuple]]:
+    """the function and arguments of the greenlet of every record, as the feeder pulls them,
+    records without a keyword runner of their own are run by ``run_keyword``"""
+    for record in records:
+        yield record.run, (
+            record.spec.run_keyword or run_keyword,
+            record.spec.keyword_name,
+            *record.spec.args,
+        )
+
+
+class RobotContext(NamedTuple):
+    """robot's execution context prepared for the greenlets of a bundle,
+    to be released once the bundle is done, the blocking monitor watches the hub meanwhile
+    and the library keywords of blocking coroutines are offloaded to threads when ``offload``"""
+
+    router: CoroutineOutputRouter
+    stacks: CoroutineContextStacks
+    keywords: KeywordRunnerCache
+    monitor: Optional["BlockingMonitor"] = None
+    offload: bool = False
+
+    def release(self) -> None:
+        """restores robot's context, in the reverse order of its preparation"""
+        if self.monitor is not None:
+            self.monitor.stop()
+        if self.offload:
+            ThreadOffload.release()
+        self.keywords.release()
+        self.stacks.release()
+        self.router.release()
+
+
+def acquire_robot_ctx(
+    names: Sequence[str],
+    monitor: Optional["BlockingMonitor"] = None,
+    offload: bool = False,
+) -> RobotContext:
+    """prepares robot's execution context for running the greenlets of the bundle,
+    the given blocking monitor is started once the context is ready"""
+    ctx = EXECUTION_CONTEXTS.current
+    AsyncioBridge.install(ctx)
+    # whatever was acquired is released when a later step fails,
+    # the router must not stay installed on robot's output
+    with ExitStack() as acquired:
+        router = CoroutineOutputRouter.acquire(ctx.output)
+        acquired.callback(router.release)
+        stacks = CoroutineContextStacks.acquire(ctx)
+        acquired.callback(stacks.release)
+        keywords = KeywordRunnerCache.acquire(ctx.namespace, names)
+        acquired.callback(keywords.release)
+        if offload:
+            ThreadOffload.acquire()
+            acquired.callback(ThreadOffload.release)
+        if monitor is not None:
+            monitor.start()
+        acquired.pop_all()
+    return RobotContext(router, stacks, keywords, monitor, offload)
+
+
+@contextmanager
+def monkey_patch_robot_ctx(
+    names: Sequence[str],
+    monitor: Optional["BlockingMonitor"] = None,
+    offload: bool = False,
+):
+    """provides a context manager for safe and succinct coroutine execution context,
+    keyword events of bundle greenlets are routed to their bundle's renderer,
+    every bundle greenlet gets its own copy of robot's keyword stacks,
+    the keywords of the bundle are resolved once
+    and async keywords are awaited on a loop shared by all greenlets"""
+    robot_ctx = acquire_robot_ctx(names, monitor, offload)
+    try:
+        yield robot_ctx
+    finally:
+        robot_ctx.release()
+
+
+def _watched(spawn_callable, guard: FailFast):
+    """wraps a spawn callable so every spawned greenlet is watched by the fail fast guard"""
+
+    def _spawn(function, *args):
+        return guard.watch(spawn_callable(function, *args))
+
+    return _spawn
+
+
+class BundleRun:  # pylint: disable=too-many-instance-attributes
+    """Runs the records of a bundle, the keywords only parse their arguments into a run.
+
+    ``on_hub`` and ``in_processes`` run the coroutines to completion and return their values
+    by bundle order, ``streamed`` and ``in_background`` start them from a feeder greenlet.
+    On the hub the coroutines are started by the order of their dependencies, paced by
+    the scheduler, and limited by the adaptive limiter, the fail fast guard and the timeout.
+    Coroutines still running at the timeout are killed. The run raises the errors
+    of the fail fast guard, the first failure or a `CoroutinesTimedOut` error, in this order.
+    """
+
+    # kills the remaining coroutines as soon as one fails, None to let all of them run
+    guard: Optional[FailFast] = None
+    # adapts the number of coroutines running at once, None for no limit
+    limiter: Optional["ConcurrencyLimiter"] = None
+    # reports the progress while the coroutines run, None for no reports
+    reporter: Optional["ProgressReporter"] = None
+    # keyword every value is handed to, resolved with the keywords of the coroutines
+    result_keyword: Optional[str] = None
+    # seconds given to the killed coroutines to finish their cleanup
+    kill_grace_period: float = KILL_GRACE_PERIOD
+    # distinct keyword names of a bundle kept as a template, None to collect them from the records
+    template_keyword_names: Optional[List[str]] = None
+    # reports the coroutines blocking the hub while the run goes on, None for no monitoring
+    monitor: Optional["BlockingMonitor"] = None
+
+    def __init__(self, records: CoroutineRecords, scheduler: SpawnScheduler) -> None:
+        self._records = records
+        self._scheduler = scheduler
+        # coroutines are started by bundle order, unless they are named or depend on others
+        self._graph: Optional[DependencyGraph] = None
+        if records.named():
+            specs = [records.spec_at(index) for index in range(len(records))]
+            self._graph = DependencyGraph(
+                [spec.name for spec in specs], [spec.depends_on for spec in specs]
+            )
+        # index of the coroutine being spawned on the hub
+        self._spawning = 0
+
+    def check_backend(self, backend: str) -> None:
+        """raises for the settings of the run that the given process or remote backend does not support"""
+        if self._graph and self._graph.active:
+            raise ValueError(
+                f"Dependencies between coroutines are not supported by the {backend} backend"
+            )
+        if self._scheduler.active:
+            raise ValueError(
+                f"'rate', 'ramp_up' and 'jitter' are not supported by the {backend} backend"
+            )
+        if any(spec.retry_policy for spec in self._records.common_specs()):
+            raise ValueError(f"Retry policies are not supported by the {backend} backend")
+        if self.result_keyword:
+            raise ValueError(f"'result_keyword' is not supported by the {backend} backend")
+        if self.limiter:
+            raise ValueError(
+                f"'adaptive_concurrency' is not supported by the {backend} backend"
+            )
+        if self.reporter:
+            raise ValueError(f"'progress' is not supported by the {backend} backend")
+        if any(spec.run_keyword for spec in self._records.common_specs()):
+            raise ValueError(f"HTTP coroutines are not supported by the {backend} backend")
+
+    def in_processes(self, backend: "ProcessBackend", timeout: float) -> List:
+        """runs the coroutines with the process or remote backend, the messages logged by
+        the keywords in the worker processes are logged here in bundle order"""
+        from .process_backend import resolve_invocation
+
+        ctx = EXECUTION_CONTEXTS.current
+        resolved = [
+            resolve_invocation(ctx, record.spec.keyword_name, record.spec.args)
+            for record in self._records
+        ]
+        results = backend.run(resolved, self._records, timeout)
+        for result in results:
+            for message, level, html in result.messages if result else ():
+                logger.write(message, level, html)
+        for result in results:
+            if result is not None and result.status == "FAIL":
+                raise result.value
+        stragglers = [
+            record for record, result in zip(self._records, results) if result is None
+        ]
+        if stragglers:
+            raise CoroutinesTimedOut(timeout, stragglers)
+        return [result.value for result in results]
+
+    def on_hub(
+        self,
+        spawn_callable: Callable[..., Greenlet],
+        renderer: CoroutineLogRenderer,
+        run_keyword: Callable,
+        timeout: float,
+    ) -> List:
+        """runs the coroutines on the current gevent hub, records without a keyword runner
+        of their own are run by ``run_keyword``"""
+        jobs: List[Optional[Greenlet]] = [None] * len(self._records)
+        deadline = monotonic() + timeout
+        with monkey_patch_robot_ctx(*self._robot_ctx_settings()) as (
+            router,
+            stacks,
+            *_,
+        ), self.reporter or nullcontext():
+            # spawning blocks while the pool or the adaptive limit is full, while the scheduler
+            # paces the starts or while coroutines wait for their dependencies,
+            # it is limited by the timeout as well
+            with Timeout(timeout, False):
+                self._spawn(
+                    jobs,
+                    partial(
+                        router.spawn,
+                        self._wrap(stacks.wrap(self._tracked(jobs, spawn_callable))),
+                        renderer,
+                    ),
+                    run_keyword,
+                )
+            started = [job for job in jobs if job is not None]
+            # timers count from the loop's cached time, which is stale after spawning,
+            # the coroutines would be killed before the deadline otherwise
+            get_hub().loop.update_now()
+            greenlets = joinall(started, timeout=max(0, deadline - monotonic()))
+            stragglers = [
+                record
+                for record, job in zip(self._records, jobs)
+                if job is None or not job.ready()
+            ]
+            survivors: Set[Greenlet] = set()
+            if stragglers:
+                survivors.update(
+                    CoroutineRecord.kill(
+                        [job for job in started if not job.ready()],
+                        self.kill_grace_period,
+                    )
+                )
+                router.settle(started)
+        self._raise_errors(
+            greenlets,
+            stragglers,
+            [record for record, job in zip(self._records, jobs) if job in survivors],
+            timeout,
+        )
+        return [job.value for job in jobs]
+
+    def streamed(
+        self,
+        spawn_callable: Callable[..., Greenlet],
+        renderer: CoroutineLogRenderer,
+        run_keyword: Callable,
+    ) -> "CoroutineStream":
+        """starts the coroutines from a feeder greenlet and returns the stream
+        handing back their values by completion order"""
+        from .stream import CoroutineStream
+
+        robot_ctx = acquire_robot_ctx(*self._robot_ctx_settings())
+        stream = CoroutineStream(robot_ctx, len(self._records))
+        stream.kill_grace_period = self.kill_grace_period
+        stream.feed(
+            partial(
+                robot_ctx.router.spawn,
+                robot_ctx.stacks.wrap(self._wrap(spawn_callable)),
+                renderer,
+                defer_flush=True,
+            ),
+            _invocations(self._records, run_keyword),
+        )
+        return stream
+
+    def in_background(
+        self,
+        alias: str,
+        spawn_callable: Callable[..., Greenlet],
+        renderer: CoroutineLogRenderer,
+        run_keyword: Callable,
+    ) -> "BackgroundBundle":
+        """starts the coroutines from a feeder greenlet and returns the handle of the running bundle"""
+        from .background import BackgroundBundle
+
+        robot_ctx = acquire_robot_ctx(*self._robot_ctx_settings())
+        handle = BackgroundBundle(alias, robot_ctx, renderer, self._records)
+        handle.kill_grace_period = self.kill_grace_period
+        handle.start(
+            robot_ctx.stacks.wrap(self._wrap(spawn_callable)),
+            _invocations(self._records, run_keyword),
+        )
+        return handle
+
+    def _robot_ctx_settings(
+        self,
+    ) -> Tuple[List[str], Optional["BlockingMonitor"], bool]:
+        # robot's library keyword runner is patched only for bundles with blocking coroutines
+        offload = any(
+            spec.threadpool is not None for spec in self._records.common_specs()
+        )
+        return self._keyword_names(), self.monitor, offload
+
+    def _keyword_names(self) -> List[str]:
+        if self.template_keyword_names is not None:
+            return self.template_keyword_names
+        return keyword_names(self._records.common_specs(), self.result_keyword)
+
+    def _wrap(self, spawn_callable: Callable[..., Greenlet]) -> Callable[..., Greenlet]:
+        if self.reporter:
+            spawn_callable = self.reporter.wrap(spawn_callable)
+        if self.guard:
+            spawn_callable = _watched(spawn_callable, self.guard)
+        if self.limiter:
+            spawn_callable = self.limiter.wrap(spawn_callable)
+        if self._scheduler.active:
+            spawn_callable = self._scheduler.wrap(spawn_callable)
+        return spawn_callable
+
+    def _tracked(
+        self, jobs: List[Optional[Greenlet]], spawn_callable: Callable[..., Greenlet]
+    ) -> Callable[..., Greenlet]:
+        """wraps the spawn callable creating the greenlets, so the greenlet of a coroutine
+        is among the jobs as soon as it exists, the timeout interrupting the wrappers
+        returning it would leave it running otherwise, neither awaited nor killed"""
+
+        def _spawn(function, *args):
+            greenlet = spawn_callable(function, *args)
+            jobs[self._spawning] = greenlet
+            return greenlet
+
+        return _spawn
+
+    def _spawn(
+        self,
+        jobs: List[Optional[Greenlet]],
+        spawn_callable: Callable[..., Greenlet],
+        run_keyword: Callable,
+    ) -> None:
+        graph = self._graph
+        ready = (
+            graph.ready() if graph else ((index, ()) for index in range(len(jobs)))
+        )
+        for index, inputs in ready:
+            if self.guard and self.guard.failed:
+                break
+            # the record is created as the coroutine is pulled
+            record = self._records[index]
+            self._spawning = index
+            greenlet = spawn_callable(
+                record.run,
+                record.spec.run_keyword or run_keyword,
+                record.spec.keyword_name,
+                *record.spec.arguments(inputs),
+            )
+            jobs[index] = graph.watch(index, greenlet) if graph else greenlet
+
+    def _raise_errors(
+        self,
+        greenlets: List[Greenlet],
+        stragglers: List[CoroutineRecord],
+        survivors: List[CoroutineRecord],
+        timeout: float,
+    ) -> None:
+        if self.guard and self.guard.failed:
+            errors = self.guard.errors
+            raise CoroutinesFailed(errors) from errors[0]
+
+        # check for exceptions...
+        for greenlet in greenlets:
+            if greenlet.exception:
+                raise greenlet.exception
+
+        if stragglers:
+            raise CoroutinesTimedOut(timeout, stragglers, survivors)
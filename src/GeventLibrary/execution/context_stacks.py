@@ -0,0 +1,149 @@
+"""greenlet local copies of the stacks kept by robot's execution context"""
+from collections.abc import MutableSequence
+from typing import Any, Callable, Dict, List, Tuple
+
+from gevent import Greenlet, getcurrent
+
+from GeventLibrary.exceptions import UnsupportedRobotVersion
+
+from .robot_internals import check_robot_version
+
+# the stack of started steps is ``steps`` since robot 6.1, ``step_types`` before
+STEP_STACKS = ("steps", "step_types")
+
+
+class GreenletLocalStack(MutableSequence):  # pylint: disable=too-many-ancestors
+    """A list every forked greenlet has a private copy of,
+    any other greenlet (the regular robot flow) works on the shared list."""
+
+    def __init__(self, shared: list) -> None:
+        self.shared = shared
+        self._local: Dict[Greenlet, list] = {}
+
+    @property
+    def _list(self) -> list:
+        return self._local.get(getcurrent(), self.shared)
+
+    def fork(self, greenlet: Greenlet) -> None:
+        """the greenlet gets a copy of the stack of the current greenlet"""
+        self._local[greenlet] = list(self._list)
+        greenlet.rawlink(self._forget)
+
+    def _forget(self, greenlet: Greenlet) -> None:
+        self._local.pop(greenlet, None)
+
+    def __getitem__(self, index):
+        return self._list[index]
+
+    def __setitem__(self, index, value) -> None:
+        self._list[index] = value
+
+    def __delitem__(self, index) -> None:
+        del self._list[index]
+
+    def __len__(self) -> int:
+        return len(self._list)
+
+    def __iter__(self):
+        return iter(self._list)
+
+    def __reversed__(self):
+        return reversed(self._list)
+
+    def __add__(self, other) -> list:
+        return self._list + list(other)
+
+    def __radd__(self, other) -> list:
+        return list(other) + self._list
+
+    def insert(self, index: int, value: Any) -> None:
+        self._list.insert(index, value)
+
+    def append(self, value: Any) -> None:
+        self._list.append(value)
+
+    def pop(self, index: int = -1) -> Any:
+        return self._list.pop(index)
+
+
+class CoroutineContextStacks:
+    """Replaces the stacks robot's execution context keeps per started keyword
+    (started steps, running user keywords and variable scopes) with greenlet local stacks.
+
+    Robot expects keywords to start and end one inside the other, keywords of concurrent
+    greenlets interleave instead, so each bundle greenlet gets its own copy of the stacks
+    as they were when it was spawned. This keeps the regular robot flow and
+    the coroutines from seeing each other's local variables, and keeps the number of
+    concurrent coroutines from counting towards robot's limit of nested keywords.
+    The stacks are installed while bundles of the context run, only on the robot versions
+    they were checked against, the original lists are restored after the last release.
+    """
+
+    _installed: Dict[int, "CoroutineContextStacks"] = {}
+
+    def __init__(self, context) -> None:
+        self._context = context
+        variables = context.variables
+        self._owners: List[Tuple[Any, str]] = [
+            (context, name) for name in STEP_STACKS if hasattr(context, name)
+        ]
+        self._owners += [
+            (context, "user_keywords"),
+            (variables, "_scopes"),
+            (getattr(variables, "_variables_set", None), "_scopes"),
+        ]
+        self._stacks: List[GreenletLocalStack] = []
+        self._users = 0
+
+    @classmethod
+    def acquire(cls, context) -> "CoroutineContextStacks":
+        """returns the stacks of the given context, installing them if needed"""
+        stacks = cls._installed.get(id(context))
+        if stacks is None:
+            check_robot_version("Running the keywords of coroutines side by side")
+            stacks = cls(context)
+            stacks._install()
+            cls._installed[id(context)] = stacks
+        stacks._users += 1
+        return stacks
+
+    def _install(self) -> None:
+        # every stack is checked before any of them is replaced
+        for owner, name in self._owners:
+            if not hasattr(owner, name):
+                raise UnsupportedRobotVersion(
+                    f"Running the keywords of coroutines side by side relies on "
+                    f"the '{name}' stack of {type(owner).__name__}, "
+                    "which this robotframework version does not keep"
+                )
+        for owner, name in self._owners:
+            stack = GreenletLocalStack(getattr(owner, name))
+            setattr(owner, name, stack)
+            self._stacks.append(stack)
+
+    def release(self) -> None:
+        """releases the stacks, the original lists are restored after the last release"""
+        self._users -= 1
+        if self._users > 0:
+            return
+        for (owner, name), stack in zip(self._owners, self._stacks):
+            # a stack robot replaced meanwhile is left as robot set it
+            if getattr(owner, name, None) is stack:
+                setattr(owner, name, stack.shared)
+        self._stacks.clear()
+        self._installed.pop(id(self._context), None)
+
+    def fork(self, greenlet: Greenlet) -> None:
+        """gives the greenlet its own copy of every stack"""
+        for stack in self._stacks:
+            stack.fork(greenlet)
+
+    def wrap(self, spawn_callable: Callable[..., Greenlet]) -> Callable[..., Greenlet]:
+        """wraps a spawn callable so every spawned greenlet is forked"""
+
+        def _spawn(function, *args):
+            greenlet = spawn_callable(function, *args)
+            self.fork(greenlet)
+            return greenlet
+
+        return _spawn
@@ -0,0 +1,111 @@
+"""dependencies between the coroutines of a bundle"""
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from gevent import Greenlet, GreenletExit
+from gevent.queue import Queue
+
+
+def _succeeded(greenlet: Greenlet) -> bool:
+    # gevent counts a greenlet killed by GreenletExit as successful
+    return greenlet.successful() and not isinstance(greenlet.value, GreenletExit)
+
+
+class DependencyGraph:
+    """Orders the start of the coroutines of a bundle by their dependencies.
+
+    A coroutine is started as soon as all the coroutines it depends on completed successfully,
+    their values are handed to it as inputs, by the order of its dependencies.
+    Coroutines depending on a failed coroutine are never started.
+    Without dependencies the coroutines are started by their order in the bundle.
+    """
+
+    def __init__(
+        self, names: Sequence[Optional[str]], depends_on: Sequence[Sequence[str]]
+    ) -> None:
+        self._indexes: Dict[str, int] = {}
+        for index, name in enumerate(names):
+            if name is None:
+                continue
+            if name in self._indexes:
+                raise ValueError(f"Coroutine name {name} is used more than once")
+            self._indexes[name] = index
+        self._dependencies: List[List[int]] = []
+        for dependencies in depends_on:
+            try:
+                self._dependencies.append([self._indexes[name] for name in dependencies])
+            except KeyError as ex:
+                raise LookupError(
+                    f"Coroutine with name {ex.args[0]} was not found"
+                ) from ex
+        self._dependents: List[List[int]] = [[] for _ in self._dependencies]
+        for index, dependencies in enumerate(self._dependencies):
+            for dependency in dependencies:
+                self._dependents[dependency].append(index)
+        self._check_acyclic(names)
+        self._waiting_for = [len(set(deps)) for deps in self._dependencies]
+        self._greenlets: List[Optional[Greenlet]] = [None] * len(self._dependencies)
+        self._ready: Queue = Queue()
+        self._unresolved = len(self._dependencies)
+
+    @property
+    def active(self) -> bool:
+        """whether any coroutine depends on another"""
+        return any(self._dependencies)
+
+    def _check_acyclic(self, names: Sequence[Optional[str]]) -> None:
+        waiting_for = [len(set(deps)) for deps in self._dependencies]
+        ready = [index for index, count in enumerate(waiting_for) if count == 0]
+        for index in ready:  # ready grows while iterating
+            for dependent in set(self._dependents[index]):
+                waiting_for[dependent] -= 1
+                if waiting_for[dependent] == 0:
+                    ready.append(dependent)
+        if len(ready) < len(waiting_for):
+            cycle = [
+                str(names[index]) for index, count in enumerate(waiting_for) if count
+            ]
+            raise ValueError(
+                f"Dependencies of coroutines {', '.join(cycle)} form a cycle"
+            )
+
+    def ready(self) -> Iterator[Tuple[int, List[Any]]]:
+        """yields the index and inputs of every coroutine that can be started,
+        waits cooperatively while coroutines depend on running ones"""
+        for index, count in enumerate(self._waiting_for):
+            if count == 0:
+                self._unresolved -= 1
+                yield index, []
+        while self._unresolved > 0:
+            index = self._ready.get()
+            if index is None:  # a coroutine was skipped
+                continue
+            self._unresolved -= 1
+            yield index, [
+                self._greenlets[dependency].value
+                for dependency in self._dependencies[index]
+            ]
+
+    def watch(self, index: int, greenlet: Greenlet) -> Greenlet:
+        """registers the greenlet of a coroutine, its dependents are released once it completes"""
+        self._greenlets[index] = greenlet
+        if self._dependents[index]:
+            greenlet.rawlink(partial(self._complete, index))
+        return greenlet
+
+    def _complete(self, index: int, greenlet: Greenlet) -> None:
+        if not _succeeded(greenlet):
+            self._skip(index)
+            return
+        for dependent in set(self._dependents[index]):
+            self._waiting_for[dependent] -= 1
+            if self._waiting_for[dependent] == 0:
+                self._ready.put(dependent)
+
+    def _skip(self, index: int) -> None:
+        for dependent in set(self._dependents[index]):
+            if self._waiting_for[dependent] > 0:
+                self._waiting_for[dependent] = -1  # never started
+                self._unresolved -= 1
+                self._ready.put(None)
+                self._skip(dependent)
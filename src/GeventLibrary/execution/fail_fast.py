@@ -0,0 +1,53 @@
+"""cancellation of a bundle once one of its coroutines failed"""
+from typing import List, Set
+
+from gevent import Greenlet
+
+from .kills import failed
+from .records import CoroutineRecord
+
+
+class FailFast:
+    """Kills all the watched greenlets as soon as one of them fails.
+
+    The failure is detected by a link callback, running in the hub right after the
+    failed greenlet has ended, so the rest of the bundle is cancelled without waiting
+    for the bundle's timeout. Killed pool greenlets release their pool slots.
+    """
+
+    def __init__(self) -> None:
+        self._greenlets: List[Greenlet] = []
+        self._killed: Set[Greenlet] = set()
+        self.failed = False
+
+    @property
+    def errors(self) -> List[BaseException]:
+        """errors of the watched greenlets that failed by themselves,
+        the greenlets killed by the guard or by anything else are left out"""
+        return [
+            greenlet.exception
+            for greenlet in self._greenlets
+            if greenlet not in self._killed and failed(greenlet)
+        ]
+
+    def watch(self, greenlet: Greenlet) -> Greenlet:
+        """watches a greenlet of the bundle, greenlets watched after a failure are killed"""
+        self._greenlets.append(greenlet)
+        if self.failed:
+            self._kill(greenlet)
+        else:
+            greenlet.rawlink(self._on_complete)
+        return greenlet
+
+    def _on_complete(self, greenlet: Greenlet) -> None:
+        if self.failed or not failed(greenlet):
+            return
+        self.failed = True
+        for other in self._greenlets:
+            if not other.dead:
+                self._kill(other)
+
+    def _kill(self, greenlet: Greenlet) -> None:
+        self._killed.add(greenlet)
+        CoroutineRecord.mark_killed([greenlet])
+        greenlet.kill(block=False)
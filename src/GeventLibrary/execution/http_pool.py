@@ -0,0 +1,198 @@
+"""keep-alive HTTP connections shared by the HTTP coroutines"""
+import http.client
+from collections import defaultdict
+from json import dumps, loads
+from ssl import PROTOCOL_TLS_CLIENT
+from time import monotonic
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlsplit
+
+from gevent import socket
+from gevent.lock import BoundedSemaphore
+from gevent.ssl import SSLContext
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+# methods whose request may be sent again, the server cannot tell a failed request
+# on a kept connection from a request it received before the connection failed
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE", "PUT", "DELETE")
+
+
+class HttpResponse(NamedTuple):
+    """the response of an HTTP coroutine, read as a whole,
+    ``elapsed`` counts the seconds from sending the request to reading the response,
+    the wait for a free connection is left out.
+    The values of a header sent more than once are joined with commas."""
+
+    method: str
+    url: str
+    status_code: int
+    reason: str
+    headers: Dict[str, str]
+    content: bytes
+    elapsed: float
+
+    @property
+    def text(self) -> str:
+        """the content decoded as utf-8"""
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """the content parsed as json"""
+        return loads(self.content)
+
+
+def _joined_headers(pairs: Iterable[Tuple[str, str]]) -> Dict[str, str]:
+    # header names are case insensitive, the first spelling of a repeated header is kept
+    headers: Dict[str, str] = {}
+    names: Dict[str, str] = {}
+    for name, value in pairs:
+        kept = names.setdefault(name.lower(), name)
+        headers[kept] = f"{headers[kept]}, {value}" if kept in headers else value
+    return headers
+
+
+def _check_status(response: HttpResponse, expected_status: Union[int, str, None]) -> None:
+    if isinstance(expected_status, str) and expected_status.lower() == "any":
+        return
+    if expected_status is None:
+        if response.status_code >= 400:
+            raise AssertionError(
+                f"{response.status_code} {response.reason} for {response.method} {response.url}"
+            )
+    elif response.status_code != int(expected_status):
+        raise AssertionError(
+            f"Expected status {expected_status} but got {response.status_code} "
+            f"{response.reason} for {response.method} {response.url}"
+        )
+
+
+class HttpConnectionPool:
+    """Sends the requests of HTTP coroutines over keep-alive connections.
+
+    Connections are kept per scheme, host and port and reused by the following requests,
+    at most ``per_host`` requests to the same host are sent at once, the others wait
+    for a free connection. Requests are sent by the greenlet of their coroutine with gevent's
+    sockets, whether the standard library is patched or not. An idempotent request failing on
+    a kept connection, which the server may have closed meanwhile, is sent again
+    on another connection, other requests fail as they may have reached the server.
+    """
+
+    def __init__(self, per_host: int = 10, timeout: float = 30) -> None:
+        if per_host <= 0:
+            raise ValueError(
+                f"'http_connections_per_host' must be a positive value, got {per_host}"
+            )
+        self.per_host = per_host
+        self.timeout = timeout
+        self._idle: DefaultDict[Tuple[str, str, int], List[http.client.HTTPConnection]] = (
+            defaultdict(list)
+        )
+        self._slots: Dict[Tuple[str, str, int], BoundedSemaphore] = {}
+        self._ssl_context: Optional[SSLContext] = None
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: Union[str, bytes, None] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        expected_status: Union[int, str, None] = None,
+    ) -> HttpResponse:
+        """sends the request and reads the response, fails on an error status
+        unless it is expected, ``any`` (in any case) accepts every status"""
+        parts = urlsplit(url)
+        if parts.scheme not in DEFAULT_PORTS or not parts.hostname:
+            raise ValueError(f"'url' must be an http or https url, got {url}")
+        key = (parts.scheme, parts.hostname, parts.port or DEFAULT_PORTS[parts.scheme])
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        headers = dict(headers or {})
+        if json is not None:
+            body = dumps(json)
+            headers.setdefault("Content-Type", "application/json")
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        slots = self._slots.get(key)
+        if slots is None:
+            slots = self._slots[key] = BoundedSemaphore(self.per_host)
+        with slots:
+            started = monotonic()
+            response, content = self._send(key, method, path, body=body, headers=headers)
+            result = HttpResponse(
+                method,
+                url,
+                response.status,
+                response.reason,
+                _joined_headers(response.getheaders()),
+                content,
+                monotonic() - started,
+            )
+        _check_status(result, expected_status)
+        return result
+
+    def _send(
+        self,
+        key: Tuple[str, str, int],
+        method: str,
+        path: str,
+        *,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+    ) -> Tuple[http.client.HTTPResponse, bytes]:
+        idle = self._idle[key]
+        retried = method.upper() in IDEMPOTENT_METHODS
+        while True:
+            reused = bool(idle)
+            connection = idle.pop() if reused else self._connect(key)
+            try:
+                connection.request(method, path, body, headers)
+                response = connection.getresponse()
+                content = response.read()
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                if reused and retried:
+                    continue
+                raise
+            except BaseException:
+                # killed or timed out in the middle of the exchange
+                connection.close()
+                raise
+            if response.will_close:
+                connection.close()
+            else:
+                idle.append(connection)
+            return response, content
+
+    def _connect(self, key: Tuple[str, str, int]) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        connection: http.client.HTTPConnection
+        if scheme == "https":
+            if self._ssl_context is None:
+                # the client defaults of ssl.create_default_context, with gevent's cooperative context
+                self._ssl_context = SSLContext(PROTOCOL_TLS_CLIENT)
+                self._ssl_context.load_default_certs()
+            connection = http.client.HTTPSConnection(
+                host, port, timeout=self.timeout, context=self._ssl_context
+            )
+        else:
+            connection = http.client.HTTPConnection(host, port, timeout=self.timeout)
+        connection._create_connection = socket.create_connection  # type: ignore  # pylint: disable=protected-access
+        return connection
+
+    def close(self) -> None:
+        """closes the kept connections"""
+        for connections in self._idle.values():
+            for connection in connections:
+                connection.close()
+        self._idle.clear()
@@ -0,0 +1,100 @@
+"""resolving the keywords of a bundle once per run"""
+from inspect import signature
+from typing import Any, Callable, Dict, Iterable, Set
+
+from gevent import getcurrent
+
+from .records import CoroutineRecord
+
+# methods of robot's namespace changing how names are resolved, the cache is emptied by them
+INVALIDATING_METHODS = ("set_search_order", "import_library", "import_resource")
+
+
+class KeywordRunnerCache:
+    """Caches the runners robot's namespace resolves for the keywords of a bundle.
+
+    Robot searches the suite file, the resources and every imported library for the
+    name of a keyword each time it is run, identical coroutines of a bundle repeat
+    the very same search. The names of the bundle are resolved once when it is run,
+    every coroutine then gets the resolved runner (with its argument spec) from the cache.
+    Other names, and every name run outside of the coroutines, are searched by the namespace
+    as before. Changing the library search order or importing a library or a resource
+    empties the cache, the names are resolved again when they are next run.
+    The cache is installed once per namespace, it is removed and forgotten after the last release.
+    ``recommend_on_failure`` is passed on only to namespaces accepting it (robotframework 6.0 and newer).
+    """
+
+    _installed: Dict[int, "KeywordRunnerCache"] = {}
+
+    def __init__(self, namespace) -> None:
+        self._namespace = namespace
+        self._get_runner = namespace.get_runner
+        self._recommends = (
+            "recommend_on_failure" in signature(self._get_runner).parameters
+        )
+        self._invalidating: Dict[str, Callable] = {
+            name: getattr(namespace, name)
+            for name in INVALIDATING_METHODS
+            if hasattr(namespace, name)
+        }
+        self._names: Set[str] = set()
+        self._runners: Dict[str, Any] = {}
+        self._users = 0
+
+    @classmethod
+    def acquire(cls, namespace, names: Iterable[str]) -> "KeywordRunnerCache":
+        """returns the cache of the given namespace, installing it if needed,
+        and resolves the given keyword names"""
+        cache = cls._installed.get(id(namespace))
+        if cache is None:
+            cache = cls._installed[id(namespace)] = cls(namespace)
+            cache._install()
+        cache._users += 1
+        cache.resolve(names)
+        return cache
+
+    def _install(self) -> None:
+        self._namespace.get_runner = self.get_runner
+        for name, method in self._invalidating.items():
+            setattr(self._namespace, name, self._emptied_by(method))
+
+    def _emptied_by(self, method: Callable) -> Callable:
+        def _call(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._runners.clear()
+
+        return _call
+
+    def resolve(self, names: Iterable[str]) -> None:
+        """resolves the names that are not cached yet"""
+        for name in names:
+            self._names.add(name)
+            if name not in self._runners:
+                self._runners[name] = self._get_runner(name)
+
+    def get_runner(self, name: str, recommend_on_failure: bool = True) -> Any:
+        """the cached runner of a name of the bundles run by a coroutine,
+        or the one resolved by the namespace"""
+        if name in self._names and getcurrent() in CoroutineRecord.running:
+            runner = self._runners.get(name)
+            if runner is None:
+                runner = self._runners[name] = self._get_runner(name)
+            return runner
+        if self._recommends:
+            return self._get_runner(name, recommend_on_failure)
+        return self._get_runner(name)
+
+    def __len__(self) -> int:
+        return len(self._runners)
+
+    def release(self) -> None:
+        """releases the cache, the namespace resolves every name again after the last release"""
+        self._users -= 1
+        if self._users > 0:
+            return
+        self._namespace.get_runner = self._get_runner
+        for name, method in self._invalidating.items():
+            setattr(self._namespace, name, method)
+        self._installed.pop(id(self._namespace), None)
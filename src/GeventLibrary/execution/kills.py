@@ -0,0 +1,31 @@
+"""recognizing the kills of coroutine greenlets"""
+from typing import List, Optional
+
+from gevent import Greenlet, GreenletExit
+
+# seconds given to greenlets that are killed to finish their cleanup
+KILL_GRACE_PERIOD = 5
+
+
+def wraps_kill(error: Optional[BaseException]) -> bool:
+    """whether the error is the kill of a greenlet or wraps one,
+    robot reports a killed keyword as a failure raised while handling the ``GreenletExit``"""
+    pending: List[Optional[BaseException]] = [error]
+    seen = set()
+    while pending:
+        error = pending.pop()
+        if error is None or id(error) in seen:
+            continue
+        if isinstance(error, GreenletExit):
+            return True
+        seen.add(id(error))
+        nested = getattr(error, "error", None)
+        if isinstance(nested, BaseException):
+            pending.append(nested)
+        pending += [error.__cause__, error.__context__]
+    return False
+
+
+def failed(greenlet: Greenlet) -> bool:
+    """whether the greenlet ended with an error of its own, rather than by being killed"""
+    return greenlet.exception is not None and not wraps_kill(greenlet.exception)
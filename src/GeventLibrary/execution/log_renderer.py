@@ -0,0 +1,132 @@
+"""rendering of coroutine keyword events into the robot log"""
+from functools import lru_cache
+from typing import Any, Iterable, Tuple
+from weakref import WeakSet
+
+from robot.api import logger
+from robot.output import LOGGER
+from robot.running.context import EXECUTION_CONTEXTS
+from robot.utils import html_escape, safe_str
+
+LOG_LEVELS = ("NESTED", "FULL", "ONELINE", "NONE")
+
+_STYLE = """<style>
+table.gevent-kw, table.gevent-kw th, table.gevent-kw td {
+    border: 1px dotted black;
+    border-collapse: collapse;
+    table-layout: auto;
+}
+table.gevent-kw th {width: 10%;}
+table.gevent-kw td {text-align: center;}
+table.gevent-kw td.status-fail {color: red;}
+table.gevent-kw td.status-pass {color: green;}
+</style>"""
+
+_START_TABLE = (
+    '<table class="gevent-kw" style="width:100%%">'
+    "<tr><th>Event</th><th>Keyword</th><th>Args</th><th>Doc</th></tr>"
+    "<tr><td>Started</td>%s</tr></table>"
+)
+
+_END_TABLE = (
+    '<table class="gevent-kw" style="width:100%%">'
+    "<tr><th>Event</th><th>Keyword</th><th>Args</th><th>Doc</th><th>Status</th></tr>"
+    '<tr><td>Completed</td>%s<td class="status-%s">%s</td></tr></table>'
+)
+
+
+def _join_args(args: Iterable[Any]) -> str:
+    return "   ".join([safe_str(arg) for arg in args])
+
+
+# robot outputs the stylesheet was written to, it is written once per output
+_styled_outputs: "WeakSet[Any]" = WeakSet()
+
+
+@lru_cache(maxsize=256)
+def _escaped_keyword(name: str, doc: str) -> Tuple[str, str]:
+    return html_escape(name), html_escape(doc)
+
+
+def _html_cells(keyword_item) -> str:
+    """the escaped name and doc are cached, bundles tend to repeat the same keywords,
+    the arguments are escaped every time, they are neither kept alive nor required to be hashable"""
+    name, doc = _escaped_keyword(keyword_item.name, keyword_item.doc)
+    return f"<td>{name}</td><td>{html_escape(_join_args(keyword_item.args))}</td><td>{doc}</td>"
+
+
+class CoroutineLogRenderer:
+    """Writes start/end events of keywords running inside a bundle to the robot log
+
+    ``level`` controls the amount of logging:
+        NESTED  - the keywords are not rendered, each coroutine is written to the output
+                  as a nested keyword by the output router, see `CoroutineResultBuffer`
+        FULL    - an html table per event, the stylesheet is written once per robot output,
+                  before its first table
+        ONELINE - a single plain text line per event
+        NONE    - nothing is logged
+    """
+
+    def __init__(self, level: str = "FULL") -> None:
+        level = str(level).upper()
+        if level not in LOG_LEVELS:
+            raise ValueError(
+                f"'log_level' must be one of {', '.join(LOG_LEVELS)}, got {level}"
+            )
+        self._level = level
+
+    @property
+    def level(self) -> str:
+        """the selected log level"""
+        return self._level
+
+    @property
+    def enabled(self) -> bool:
+        """whether keyword events are logged at all"""
+        return self._level in ("FULL", "ONELINE")
+
+    @property
+    def nested(self) -> bool:
+        """whether coroutines are written to the output as nested keywords"""
+        return self._level == "NESTED"
+
+    def write_style(self) -> None:
+        """writes the table stylesheet in FULL level, once per robot output
+        (robot's logger outside of a robot run)"""
+        if self._level != "FULL":
+            return
+        ctx = EXECUTION_CONTEXTS.current
+        output = LOGGER if ctx is None else ctx.output
+        if output in _styled_outputs:
+            return
+        _styled_outputs.add(output)
+        logger.write(_STYLE, html=True)
+
+    def render_start(self, keyword_item) -> str:
+        """renders the message for a starting keyword"""
+        if self._level == "FULL":
+            return _START_TABLE % _html_cells(keyword_item)
+        return f"Started {keyword_item.name}    {_join_args(keyword_item.args)}"
+
+    def render_end(self, keyword_item) -> str:
+        """renders the message for an ending keyword"""
+        status = keyword_item.result.status
+        if self._level == "FULL":
+            return _END_TABLE % (_html_cells(keyword_item), status.lower(), status)
+        return (
+            f"Completed {keyword_item.name}    {_join_args(keyword_item.args)}    {status}"
+        )
+
+    def start_keyword(self, keyword_item) -> None:
+        """listener for starting a keyword"""
+        if self.enabled:
+            self.write_style()
+            logger.write(
+                self.render_start(keyword_item), html=self._level == "FULL"
+            )
+
+    def end_keyword(self, keyword_item) -> None:
+        """listener for ending a keyword"""
+        if self.enabled:
+            self.write_style()
+            logger.write(self.render_end(keyword_item), html=self._level == "FULL")
@@ -0,0 +1,163 @@
+"""routing of robot output events raised from within bundle greenlets"""
+from typing import Any, Callable, Dict, Iterable, Set, Union
+
+from gevent import Greenlet, get_hub, getcurrent, sleep
+from robot.output import LOGGER
+
+from .log_renderer import CoroutineLogRenderer
+from .result_buffer import CoroutineResultBuffer
+from .robot_internals import check_robot_version
+
+_Sink = Union[CoroutineLogRenderer, CoroutineResultBuffer]
+
+
+class CoroutineOutputRouter:  # pylint: disable=too-many-instance-attributes
+    """Replaces `start_keyword` and `end_keyword` of robot's output while bundles are running.
+
+    Events raised by a registered bundle greenlet are handed to the sink of that greenlet,
+    events of any other greenlet (the regular robot flow) are forwarded to the original output.
+    In NESTED log level every greenlet gets its own result buffer, which also receives
+    the messages logged by the greenlet, and the buffer is written to the output
+    once the greenlet is done (or once its value is handed back, when flushing is deferred).
+    In other log levels the events are handed to the bundle's renderer.
+    While bundles run in the background, the regular robot flow yields to the gevent hub
+    whenever one of its keywords ends, so the background greenlets progress between synchronous keywords.
+    A single router is installed per output, it is removed once its last user released it.
+
+    Robot has no public hook for the messages logged by keywords: its logger switches
+    its ``log_message`` to its private ``_log_message`` whenever a keyword starts,
+    so the router shadows ``_log_message`` while it is installed.
+    """
+
+    _routers: Dict[int, "CoroutineOutputRouter"] = {}
+
+    def __init__(self, output) -> None:
+        self._output = output
+        self._start_keyword = output.start_keyword
+        self._end_keyword = output.end_keyword
+        self._log_message = LOGGER._log_message  # pylint: disable=protected-access
+        # the bound method installed on robot's logger, to recognize it there
+        self._routed_message = self.log_message
+        self._sinks: Dict[Greenlet, _Sink] = {}
+        self._finished: Dict[Greenlet, CoroutineResultBuffer] = {}
+        self._deferred: Set[Greenlet] = set()
+        self._users = 0
+        self._background = 0
+
+    @classmethod
+    def acquire(cls, output) -> "CoroutineOutputRouter":
+        """returns the router of the given output, installing it if needed"""
+        router = cls._routers.get(id(output))
+        if router is None:
+            check_robot_version("Logging the keywords of coroutines")
+            router = cls._routers[id(output)] = cls(output)
+            router._install()
+        router._users += 1
+        return router
+
+    def release(self) -> None:
+        """releases the router, the original output is restored after the last release"""
+        self._users -= 1
+        if self._users > 0:
+            return
+        self._output.start_keyword = self._start_keyword
+        self._output.end_keyword = self._end_keyword
+        # robot swaps `log_message` between `message` and `_log_message`
+        # as keywords start and end, the instance attribute shadows the latter meanwhile
+        LOGGER.__dict__.pop("_log_message", None)
+        if LOGGER.log_message is self._routed_message:
+            LOGGER.log_message = self._log_message
+        self._finished.clear()
+        self._deferred.clear()
+        self._routers.pop(id(self._output), None)
+
+    def _install(self) -> None:
+        self._output.start_keyword = self.start_keyword
+        self._output.end_keyword = self.end_keyword
+        # pylint: disable=protected-access
+        if getattr(LOGGER.log_message, "__func__", None) is type(LOGGER)._log_message:
+            LOGGER.log_message = self._routed_message
+        LOGGER._log_message = self._routed_message
+
+    def yield_between_keywords(self, enabled: bool) -> None:
+        """enables yielding to the hub whenever a keyword of the regular robot flow ends,
+        calls are counted, yielding stops once every enabling call was disabled"""
+        self._background += 1 if enabled else -1
+
+    def _yield_to_hub(self) -> None:
+        if self._background and getcurrent() is not get_hub():
+            sleep(0)
+
+    def spawn(
+        self,
+        spawn_callable: Callable[..., Greenlet],
+        renderer: CoroutineLogRenderer,
+        function: Callable,
+        *args: Any,
+        defer_flush: bool = False,
+    ) -> Greenlet:
+        """spawns a greenlet whose keyword events are logged according to the given renderer,
+        with ``defer_flush`` the buffered results are written only by `flush`"""
+        greenlet = spawn_callable(function, *args)
+        if renderer.nested:
+            self._sinks[greenlet] = CoroutineResultBuffer()
+            if defer_flush:
+                self._deferred.add(greenlet)
+            greenlet.rawlink(self._complete)
+        else:
+            self._sinks[greenlet] = renderer
+            greenlet.rawlink(self._unregister)
+        return greenlet
+
+    def flush(self, greenlet: Greenlet) -> None:
+        """writes the buffered results of a completed greenlet to the output"""
+        buffer = self._finished.pop(greenlet, None)
+        if buffer is not None:
+            self._replay(buffer)
+
+    def settle(self, greenlets: Iterable[Greenlet]) -> None:
+        """writes the buffered results of the given greenlets that are already dead,
+        gevent notifies the links of killed greenlets only on a later loop iteration"""
+        for greenlet in greenlets:
+            if greenlet.dead:
+                self._complete(greenlet)
+
+    def _unregister(self, greenlet: Greenlet) -> None:
+        self._sinks.pop(greenlet, None)
+
+    def _complete(self, greenlet: Greenlet) -> None:
+        buffer = self._sinks.pop(greenlet, None)
+        if greenlet in self._deferred:
+            self._deferred.discard(greenlet)
+            if buffer is not None:
+                self._finished[greenlet] = buffer
+        elif isinstance(buffer, CoroutineResultBuffer):
+            self._replay(buffer)
+
+    def _replay(self, buffer: CoroutineResultBuffer) -> None:
+        buffer.replay(self._start_keyword, self._end_keyword, self._log_message)
+
+    def start_keyword(self, keyword_item) -> None:
+        """listener for starting a keyword"""
+        sink = self._sinks.get(getcurrent())
+        if sink is None:
+            self._start_keyword(keyword_item)
+        else:
+            sink.start_keyword(keyword_item)
+
+    def end_keyword(self, keyword_item) -> None:
+        """listener for ending a keyword"""
+        sink = self._sinks.get(getcurrent())
+        if sink is None:
+            self._end_keyword(keyword_item)
+            self._yield_to_hub()
+        else:
+            sink.end_keyword(keyword_item)
+
+    def log_message(self, message, *args, **kwargs) -> None:
+        """listener for messages logged by libraries"""
+        sink = self._sinks.get(getcurrent())
+        if isinstance(sink, CoroutineResultBuffer):
+            sink.log_message(message)
+        else:
+            self._log_message(message, *args, **kwargs)
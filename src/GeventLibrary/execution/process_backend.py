@@ -0,0 +1,160 @@
+"""process backend, runs bundle coroutines in worker processes to use multiple cores"""
+import os
+import pickle
+import sys
+from time import monotonic
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+from gevent import Greenlet, joinall, spawn
+from gevent.subprocess import PIPE, Popen
+
+from .records import CoroutineRecord
+from .robot_internals import check_robot_version
+
+BACKENDS = ("gevent", "process", "remote")
+
+
+class ProcessInvocation(NamedTuple):
+    """a picklable call of a library keyword, arguments are already resolved"""
+
+    library: str
+    library_source: Optional[str]
+    library_args: Tuple[Any, ...]
+    library_kwargs: Tuple[Tuple[str, Any], ...]
+    method: str
+    args: Tuple[Any, ...]
+    kwargs: Tuple[Tuple[str, Any], ...]
+
+
+class WorkerResult(NamedTuple):
+    """outcome of a single invocation in a worker process"""
+
+    index: int
+    status: str
+    value: Any
+    messages: List[Tuple[str, str, bool]]
+    started: float
+    elapsed: float
+
+
+def resolve_invocation(context, keyword_name: str, args: Sequence[Any]) -> ProcessInvocation:
+    """resolves a keyword and its arguments in the current robot context,
+    only library keywords can be executed by a worker process"""
+    # the handler of a library keyword and its method name are private to robot
+    check_robot_version("The process backend")
+    runner = context.namespace.get_runner(keyword_name)
+    handler = getattr(runner, "_handler", None)
+    library = getattr(handler, "library", None)
+    if library is None or not hasattr(handler, "resolve_arguments"):
+        raise ValueError(
+            f"'{keyword_name}' is not a library keyword, "
+            "only library keywords can run with the process backend"
+        )
+    positional, named = handler.resolve_arguments(list(args), context.variables)
+    return ProcessInvocation(
+        library=library.orig_name,
+        library_source=library.source,
+        library_args=tuple(library.positional_args),
+        library_kwargs=tuple(library.named_args),
+        method=handler._handler_name,  # pylint: disable=protected-access
+        args=tuple(positional),
+        kwargs=tuple(named),
+    )
+
+
+class ProcessBackend:  # pylint: disable=too-few-public-methods
+    """Partitions a bundle between worker processes, each worker runs its slice
+    concurrently on its own gevent hub. Results are merged back in bundle order.
+
+    Workers are started with the current ``sys.path`` so they import the same libraries,
+    waiting for them is cooperative and does not block the event loop.
+    """
+
+    def __init__(self, workers: int = 0) -> None:
+        if workers < 0:
+            raise ValueError(
+                f"'process_workers' must be a non negative value, got {workers}"
+            )
+        self._workers = workers or os.cpu_count() or 1
+
+    def run(
+        self,
+        invocations: Sequence[ProcessInvocation],
+        records: Sequence[CoroutineRecord],
+        timeout: float,
+    ) -> List[Optional[WorkerResult]]:
+        """runs the invocations, returns their results by order,
+        None for invocations that did not complete within the timeout"""
+        count = min(self._workers, len(invocations))
+        slices = [list(enumerate(invocations))[worker::count] for worker in range(count)]
+        workers: List[Any] = []
+        jobs: List[Greenlet] = []
+        # whatever happens, no worker is left running once the run returns or raises
+        try:
+            for worker in range(count):
+                workers.append(self._start(worker))
+            launched = monotonic()
+            for record in records:
+                record.queued = launched
+            jobs = [
+                spawn(self._communicate, worker, invocation_slice)
+                for worker, invocation_slice in zip(workers, slices)
+            ]
+            # the first failing slice is raised at once, the other workers are aborted below
+            joinall(jobs, timeout=timeout, raise_error=True)
+            return self._collect(jobs, records, launched, len(invocations))
+        finally:
+            for index, worker in enumerate(workers):
+                if index < len(jobs) and jobs[index].successful():
+                    continue
+                if index < len(jobs):
+                    jobs[index].kill(block=False)
+                self._abort(worker)
+
+    @staticmethod
+    def _collect(
+        jobs: List[Greenlet],
+        records: Sequence[CoroutineRecord],
+        launched: float,
+        size: int,
+    ) -> List[Optional[WorkerResult]]:
+        results: List[Optional[WorkerResult]] = [None] * size
+        for job in jobs:
+            if not job.ready():
+                continue
+            for result in job.value:
+                results[result.index] = result
+                record = records[result.index]
+                record.started = launched + result.started
+                record.ended = record.started + result.elapsed
+                record.status = result.status
+                record.attempts = 1
+        return results
+
+    def _start(self, worker: int) -> Popen:  # pylint: disable=unused-argument
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+        return Popen(
+            [sys.executable, "-m", "GeventLibrary.execution.process_worker"],
+            stdin=PIPE,
+            stdout=PIPE,
+            stderr=PIPE,
+            env=env,
+        )
+
+    def _communicate(
+        self, worker: Popen, invocation_slice: List[Tuple[int, ProcessInvocation]]
+    ) -> List[WorkerResult]:
+        stdout, stderr = worker.communicate(pickle.dumps(invocation_slice))
+        if worker.returncode != 0:
+            raise RuntimeError(
+                f"Worker process exited with code {worker.returncode}:\n"
+                f"{stderr.decode(errors='replace')}"
+            )
+        return pickle.loads(stdout)
+
+    @staticmethod
+    def _abort(worker: Popen) -> None:
+        # the killed process is reaped, it would be left as a zombie otherwise
+        worker.kill()
+        worker.wait()
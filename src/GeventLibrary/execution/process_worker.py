@@ -0,0 +1,131 @@
+"""worker process of the process backend, runs a slice of a bundle on its own gevent hub
+
+reads a pickled list of ``(index, ProcessInvocation)`` from stdin
+and writes a pickled list of ``WorkerResult`` to stdout.
+"""
+# genevt monkey patch should be placed at the top
+# pylint: disable=wrong-import-position
+# pylint: disable=wrong-import-order
+from gevent import monkey
+
+monkey.patch_all(thread=False)
+
+import pickle
+import sys
+from time import monotonic
+from typing import Any, Dict, List, Tuple
+
+from gevent import getcurrent, joinall
+from gevent.pool import Group
+from robot.errors import DataError
+from robot.api import logger
+from robot.utils import Importer
+
+from GeventLibrary.execution.process_backend import ProcessInvocation, WorkerResult
+
+_libraries: Dict[Tuple, Any] = {}
+_messages: Dict[Any, List[Tuple[str, str, bool]]] = {}
+
+
+def _collect_message(msg, level="INFO", html=False):
+    _messages.setdefault(getcurrent(), []).append((str(msg), level, html))
+
+
+def _library_instance(invocation: ProcessInvocation) -> Any:
+    key = (
+        invocation.library,
+        invocation.library_source,
+        invocation.library_args,
+        invocation.library_kwargs,
+    )
+    if key not in _libraries:
+        importer = Importer("library")
+        try:
+            libcode = importer.import_class_or_module(invocation.library)
+        except DataError:
+            if not invocation.library_source:
+                raise
+            libcode = importer.import_class_or_module_by_path(
+                invocation.library_source
+            )
+        if isinstance(libcode, type):
+            libcode = libcode(
+                *invocation.library_args, **dict(invocation.library_kwargs)
+            )
+        _libraries[key] = libcode
+    return _libraries[key]
+
+
+def _call(invocation: ProcessInvocation) -> Any:
+    instance = _library_instance(invocation)
+    method = getattr(instance, invocation.method, None)
+    if method is None and hasattr(instance, "run_keyword"):
+        # dynamic library
+        return instance.run_keyword(
+            invocation.method, list(invocation.args), dict(invocation.kwargs)
+        )
+    return method(*invocation.args, **dict(invocation.kwargs))
+
+
+def _picklable(result: WorkerResult) -> WorkerResult:
+    try:
+        pickle.dumps(result)
+        return result
+    except Exception as ex:  # pylint: disable=broad-except
+        return result._replace(
+            status="FAIL",
+            value=RuntimeError(
+                f"The coroutine's value cannot be sent back from the worker process: {ex}"
+            ),
+        )
+
+
+def _run(index: int, invocation: ProcessInvocation, launched: float) -> WorkerResult:
+    started = monotonic()
+    try:
+        status, value = "PASS", _call(invocation)
+    except Exception as ex:  # pylint: disable=broad-except
+        status, value = "FAIL", ex
+    return _picklable(
+        WorkerResult(
+            index=index,
+            status=status,
+            value=value,
+            messages=_messages.pop(getcurrent(), []),
+            started=started - launched,
+            elapsed=monotonic() - started,
+        )
+    )
+
+
+def start_slice(
+    invocation_slice: List[Tuple[int, ProcessInvocation]], group: Group
+) -> List[Any]:
+    """spawns all the invocations of the slice in the group, a full pool blocks the spawning,
+    the value of each returned greenlet is its ``WorkerResult``"""
+    launched = monotonic()
+    return [
+        group.spawn(_run, index, invocation, launched)
+        for index, invocation in invocation_slice
+    ]
+
+
+def collect_messages() -> None:
+    """messages logged by the keywords are sent back with their results"""
+    logger.write = _collect_message
+
+
+def main() -> None:
+    """runs all the invocations read from stdin concurrently"""
+    output = sys.stdout.buffer
+    # anything printed by keywords must not corrupt the results
+    sys.stdout = sys.stderr
+    collect_messages()
+    jobs = start_slice(pickle.load(sys.stdin.buffer), Group())
+    joinall(jobs)
+    pickle.dump([job.value for job in jobs], output)
+    output.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""live progress reporting of a bundle run"""
+import json
+from time import monotonic
+from typing import Any, Callable, Dict, Optional, TextIO
+
+import gevent
+from gevent import Greenlet
+from robot.api import logger
+from robot.utils import Importer
+
+from .kills import failed
+
+
+def _resolve_listener(listener: Any) -> Any:
+    # a listener given by name is imported like robot imports listeners, classes are instantiated
+    if isinstance(listener, str):
+        return Importer("listener").import_class_or_module(
+            listener, instantiate_with_args=()
+        )
+    return listener
+
+
+def _format_eta(eta: Optional[float]) -> str:
+    if eta is None:
+        return "-"
+    minutes, seconds = divmod(int(eta), 60)
+    return f"{minutes}m{seconds:02d}s" if minutes else f"{seconds}s"
+
+
+class ProgressReporting:  # pylint: disable=too-few-public-methods
+    """Settings of the progress reporting of bundle runs, every run reports with a reporter of its own.
+
+    ``interval``    - seconds between reports
+    ``console``     - whether reports are written to robot's console
+    ``path``        - JSON lines file every report is appended to
+    ``listener``    - object, or name of a class or module imported like a robot listener,
+                      whose ``bundle_progress`` method is called with every report
+    """
+
+    def __init__(
+        self,
+        interval: float = 5,
+        console: bool = True,
+        path: Optional[str] = None,
+        listener: Any = None,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError(f"'interval' must be a positive value, got {interval}")
+        self.interval = interval
+        self.console = console
+        self.path = path
+        self.listener = _resolve_listener(listener)
+        if self.listener is not None and not callable(
+            getattr(self.listener, "bundle_progress", None)
+        ):
+            raise ValueError(
+                f"'listener' must have a 'bundle_progress' method, got {listener}"
+            )
+
+    def reporter(self, alias: str, total: int) -> "ProgressReporter":
+        """a reporter for a single run"""
+        return ProgressReporter(self, alias, total)
+
+
+class ProgressReporter:  # pylint: disable=too-many-instance-attributes
+    """Reports the progress of a run every interval, and once more when the run ends.
+
+    Greenlets of the run are counted when they are spawned and when they complete,
+    by a link to their completion, so the coroutines themselves pay for two increments.
+    The reports are made by a greenlet of their own: the number of completed, failed,
+    running and pending coroutines (killed coroutines are completed, not failed), the throughput (completions per second) since the
+    previous report (over the whole run for the final report) and the estimated seconds
+    left at that throughput.
+    Used as a context manager, the reports are made while the context is entered.
+    """
+
+    def __init__(self, settings: ProgressReporting, alias: str, total: int) -> None:
+        self._settings = settings
+        self._alias = alias
+        self._total = total
+        self._started = 0
+        self._completed = 0
+        self._failed = 0
+        self._start_time = monotonic()
+        self._last_time = self._start_time
+        self._last_completed = 0
+        self._periodic: Optional[Greenlet] = None
+        self._file: Optional[TextIO] = None
+
+    def wrap(self, spawn_callable: Callable[..., Greenlet]) -> Callable[..., Greenlet]:
+        """wraps a spawn callable, so every spawned greenlet is counted"""
+
+        def _spawn(function, *args):
+            greenlet = spawn_callable(function, *args)
+            self._started += 1
+            greenlet.rawlink(self._count)
+            return greenlet
+
+        return _spawn
+
+    def _count(self, greenlet: Greenlet) -> None:
+        self._completed += 1
+        if failed(greenlet):
+            self._failed += 1
+
+    def snapshot(self, final: bool = False) -> Dict[str, Any]:
+        """the progress of the run, the throughput since the previous snapshot
+        or over the whole run for the final one"""
+        now = monotonic()
+        if final:
+            self._last_time, self._last_completed = self._start_time, 0
+        period = now - self._last_time
+        throughput = (self._completed - self._last_completed) / period if period else 0.0
+        self._last_time = now
+        self._last_completed = self._completed
+        left = self._total - self._completed
+        return {
+            "alias": self._alias,
+            "elapsed": now - self._start_time,
+            "total": self._total,
+            "completed": self._completed,
+            "failed": self._failed,
+            "running": self._started - self._completed,
+            "pending": self._total - self._started,
+            "throughput": throughput,
+            "eta": left / throughput if throughput else (0.0 if not left else None),
+        }
+
+    def report(self, final: bool = False) -> None:
+        """reports a snapshot of the progress to the configured outputs"""
+        progress = self.snapshot(final)
+        if self._settings.console:
+            logger.console(
+                f"[{progress['alias']}] {progress['completed']}/{progress['total']} completed, "
+                f"{progress['failed']} failed, {progress['running']} running, "
+                f"{progress['throughput']:.1f}/s, ETA {_format_eta(progress['eta'])}"
+            )
+        if self._file is not None:
+            self._file.write(json.dumps(progress) + "\n")
+            self._file.flush()
+        if self._settings.listener is not None:
+            self._settings.listener.bundle_progress(progress)
+
+    def _report_periodically(self) -> None:
+        while True:
+            gevent.sleep(self._settings.interval)
+            self.report()
+
+    def __enter__(self) -> "ProgressReporter":
+        if self._settings.path:
+            # pylint: disable=consider-using-with
+            self._file = open(self._settings.path, "a", encoding="utf-8")
+        self._start_time = self._last_time = monotonic()
+        self._periodic = gevent.spawn(self._report_periodically)
+        return self
+
+    def __exit__(self, *_) -> None:
+        self._periodic.kill()
+        try:
+            self.report(final=True)
+        finally:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,265 @@
+"""bookkeeping of a single coroutine run"""
+from bisect import bisect_right
+from itertools import accumulate
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from gevent import Greenlet, Timeout, getcurrent, killall
+
+from .kills import KILL_GRACE_PERIOD, wraps_kill
+from .retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from gevent.threadpool import ThreadPool
+
+
+class CoroutineSpec(NamedTuple):
+    """What a coroutine runs: its keyword and arguments, the retry policy of its failures
+    and the reducer replacing its value as soon as it completes,
+    so the greenlet holds on to the reduced value only.
+    The library keywords of a coroutine with a thread pool are run on its threads.
+    A coroutine given ``run_keyword`` is run by it instead of robot's ``BuiltIn.run_keyword``,
+    with the same arguments.
+    The last ``named`` arguments are named arguments in robot's ``name=value`` format,
+    the values of the coroutines it depends on are inserted before them."""
+
+    keyword_name: str
+    args: Sequence[Any] = ()
+    retry_policy: Optional[RetryPolicy] = None
+    reducer: Optional[Callable[[Any], Any]] = None
+    threadpool: Optional["ThreadPool"] = None
+    run_keyword: Optional[Callable[..., Any]] = None
+    name: Optional[str] = None
+    depends_on: Sequence[str] = ()
+    named: int = 0
+
+    def arguments(self, inputs: Sequence[Any] = ()) -> Sequence[Any]:
+        """the arguments of the keyword, the inputs inserted after the positional arguments"""
+        if not inputs:
+            return self.args
+        split = len(self.args) - self.named
+        return [*self.args[:split], *inputs, *self.args[split:]]
+
+
+class SpecBatch(NamedTuple):
+    """The specs of a batch of coroutines running the same keyword, created on access.
+    Every coroutine runs the common spec with the arguments and the number of named
+    arguments given by ``arguments`` for its index in the batch,
+    all of them run the common spec as is without it."""
+
+    spec: CoroutineSpec
+    size: int
+    arguments: Optional[Callable[[int], Tuple[Sequence[Any], int]]] = None
+
+
+def with_retry_policy(
+    spec: Union[CoroutineSpec, SpecBatch], retry_policy: RetryPolicy
+) -> Union[CoroutineSpec, SpecBatch]:
+    """the spec or batch with the given retry policy, unless it has a policy of its own"""
+    if isinstance(spec, SpecBatch):
+        return spec._replace(spec=with_retry_policy(spec.spec, retry_policy))
+    if spec.retry_policy is not None:
+        return spec
+    return spec._replace(retry_policy=retry_policy)
+
+
+class CoroutineRecord:
+    """Records when a coroutine was queued (submitted to its pool), started and ended
+    running inside its greenlet,
+    the status it ended with: PASS, FAIL, KILLED or NOT RUN if it never started,
+    and the number of attempts when it is retried by a retry policy.
+    The seconds the coroutine blocked the gevent hub are counted by the blocking monitor."""
+
+    __slots__ = (
+        "spec",
+        "queued",
+        "started",
+        "ended",
+        "status",
+        "attempts",
+        "blocked",
+    )
+
+    # records of the coroutines that are running, by their greenlet
+    running: Dict[Greenlet, "CoroutineRecord"] = {}
+
+    def __init__(self, spec: CoroutineSpec) -> None:
+        self.spec = spec
+        self.queued = monotonic()
+        self.started: Optional[float] = None
+        self.ended: Optional[float] = None
+        self.status = "NOT RUN"
+        self.attempts = 0
+        self.blocked = 0.0
+
+    @classmethod
+    def mark_killed(cls, greenlets: Iterable[Greenlet]) -> None:
+        """marks the records of the given running greenlets as killed by the library,
+        to be called before killing them"""
+        for greenlet in greenlets:
+            record = cls.running.get(greenlet)
+            if record is not None:
+                record.status = "KILLED"
+
+    @classmethod
+    def kill(
+        cls, greenlets: Sequence[Greenlet], timeout: Optional[float] = None
+    ) -> List[Greenlet]:
+        """marks and kills the given greenlets, waiting at most ``timeout`` seconds
+        (the kill grace period by default) for them to finish their cleanup,
+        returns the greenlets that are still alive"""
+        cls.mark_killed(greenlets)
+        try:
+            killall(
+                greenlets, timeout=KILL_GRACE_PERIOD if timeout is None else timeout
+            )
+        except Timeout:
+            pass
+        return [greenlet for greenlet in greenlets if not greenlet.dead]
+
+    def _is_killed(self) -> bool:
+        return self.status == "KILLED"
+
+    def _set_attempts(self, attempts: int) -> None:
+        self.attempts = attempts
+
+    def run(self, function: Callable, *args: Any) -> Any:
+        """runs the function, to be used as the target of the greenlet"""
+        self.started = monotonic()
+        self.status = "RUNNING"
+        greenlet = getcurrent()
+        self.running[greenlet] = self
+        try:
+            if self.spec.retry_policy:
+                value = self.spec.retry_policy.call(
+                    function,
+                    *args,
+                    on_attempt=self._set_attempts,
+                    cancelled=self._is_killed,
+                )
+            else:
+                self.attempts = 1
+                value = function(*args)
+            if self.spec.reducer:
+                value = self.spec.reducer(value)
+        except BaseException as error:
+            # robot wraps the kill of the greenlet in a keyword failure
+            self.status = "KILLED" if self._is_killed() or wraps_kill(error) else "FAIL"
+            raise
+        finally:
+            self.ended = monotonic()
+            self.running.pop(greenlet, None)
+        self.status = "PASS"
+        return value
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        """seconds the coroutine has been running, None if it never started"""
+        if self.started is None:
+            return None
+        return (self.ended or monotonic()) - self.started
+
+    @property
+    def queue_wait(self) -> Optional[float]:
+        """seconds the coroutine waited for a pool slot, None if it never started"""
+        if self.started is None:
+            return None
+        return self.started - self.queued
+
+
+def common_specs(
+    specs: Iterable[Union[CoroutineSpec, SpecBatch]]
+) -> Iterator[CoroutineSpec]:
+    """the given specs, with the common spec of every batch"""
+    for spec in specs:
+        yield spec.spec if isinstance(spec, SpecBatch) else spec
+
+
+def stamp_queued(function: Callable) -> None:
+    """stamps the record whose ``run`` is the given function as queued from now"""
+    record = getattr(function, "__self__", None)
+    if isinstance(record, CoroutineRecord):
+        record.queued = monotonic()
+
+
+def queued_on_submit(spawn_callable: Callable[..., Greenlet]) -> Callable[..., Greenlet]:
+    """wraps the spawn callable of a pool, so every record is stamped as queued
+    right when it is submitted to the pool, pacing and dependency waits happen before"""
+
+    def _spawn(function, *args):
+        stamp_queued(function)
+        return spawn_callable(function, *args)
+
+    return _spawn
+
+
+class CoroutineRecords(Sequence[CoroutineRecord]):
+    """The records of a run by bundle order, every record is created from its spec
+    when it is first accessed, so the coroutines of a batch get their records
+    only as the pool pulls them. Coroutines and batches are given as specs and spec batches."""
+
+    def __init__(self, specs: Sequence[Union[CoroutineSpec, SpecBatch]]) -> None:
+        self.specs = specs
+        # index after the last coroutine of every spec or batch
+        self._ends = list(
+            accumulate(
+                spec.size if isinstance(spec, SpecBatch) else 1 for spec in specs
+            )
+        )
+        self._records: List[Optional[CoroutineRecord]] = [None] * (
+            self._ends[-1] if self._ends else 0
+        )
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[position] for position in range(len(self))[index]]
+        index = range(len(self))[index]
+        record = self._records[index]
+        if record is None:
+            record = self._records[index] = CoroutineRecord(self.spec_at(index))
+        return record
+
+    def __iter__(self) -> Iterator[CoroutineRecord]:
+        for index in range(len(self._records)):
+            yield self[index]
+
+    def common_specs(self) -> Iterator[CoroutineSpec]:
+        """the spec of every coroutine and the common spec of every batch"""
+        return common_specs(self.specs)
+
+    def named(self) -> bool:
+        """whether any coroutine is named or depends on another, batches never are"""
+        return any(
+            spec.name is not None or spec.depends_on
+            for spec in self.specs
+            if isinstance(spec, CoroutineSpec)
+        )
+
+    def spec_at(self, index: int) -> CoroutineSpec:
+        """the spec of the coroutine at the given index, without creating its record"""
+        position = bisect_right(self._ends, index)
+        spec = self.specs[position]
+        if not isinstance(spec, SpecBatch):
+            return spec
+        if spec.arguments is None:
+            return spec.spec
+        args, named = spec.arguments(
+            index - (self._ends[position - 1] if position else 0)
+        )
+        return spec.spec._replace(args=args, named=named)
@@ -0,0 +1,164 @@
+"""remote backend, runs bundle coroutines on worker nodes reached over TCP"""
+import hmac
+import os
+import pickle
+import struct
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+from gevent import socket
+
+from .process_backend import ProcessBackend, ProcessInvocation, WorkerResult
+
+# environment variable of the key shared by the suite and the worker nodes
+KEY_VARIABLE = "GEVENT_LIBRARY_REMOTE_KEY"
+# messages are pickled, prefixed by their length and by their signature with the shared key
+_HEADER = struct.Struct("!Q")
+_DIGEST = "sha256"
+_DIGEST_SIZE = 32
+# the worker opens every connection with a random nonce, the coordinator proves it has the key
+# by signing it before anything is unpickled, and every message is signed along with the nonce
+_NONCE_SIZE = 32
+_ACCEPTED = b"\x01"
+
+
+def shared_key(key: Optional[str] = None) -> bytes:
+    """the given key, or the key of the ``GEVENT_LIBRARY_REMOTE_KEY`` environment variable"""
+    key = key or os.environ.get(KEY_VARIABLE)
+    if not key:
+        raise ValueError(
+            f"The remote backend needs a shared key, please set the {KEY_VARIABLE} "
+            "environment variable of the suite and of the worker nodes"
+        )
+    return key.encode()
+
+
+def _sign(key: bytes, *parts: bytes) -> bytes:
+    return hmac.new(key, b"".join(parts), _DIGEST).digest()
+
+
+def send_message(sock: socket.socket, obj: Any, key: bytes, label: bytes) -> None:
+    """sends a pickled object signed with the key, the label binds the signature
+    to the connection and to the direction of the message"""
+    payload = pickle.dumps(obj)
+    sock.sendall(_HEADER.pack(len(payload)) + _sign(key, label, payload) + payload)
+
+
+def receive_message(sock: socket.socket, key: bytes, label: bytes) -> Any:
+    """receives an object sent by `send_message`, it is unpickled only if its signature is valid,
+    raises EOFError if the connection is closed first and PermissionError for a wrong signature"""
+    (length,) = _HEADER.unpack(_receive_exactly(sock, _HEADER.size))
+    signature = _receive_exactly(sock, _DIGEST_SIZE)
+    payload = _receive_exactly(sock, length)
+    if not hmac.compare_digest(signature, _sign(key, label, payload)):
+        raise PermissionError("The message is not signed with the shared key")
+    return pickle.loads(payload)
+
+
+def offer_handshake(sock: socket.socket, key: bytes) -> Optional[bytes]:
+    """opens a connection on the worker side, returns its nonce once the coordinator
+    proved it has the key, None if it did not"""
+    nonce = os.urandom(_NONCE_SIZE)
+    sock.sendall(nonce)
+    try:
+        proof = _receive_exactly(sock, _DIGEST_SIZE)
+    except EOFError:
+        return None
+    if not hmac.compare_digest(proof, _sign(key, b"coordinator", nonce)):
+        return None
+    sock.sendall(_ACCEPTED)
+    return nonce
+
+
+def answer_handshake(sock: socket.socket, key: bytes) -> bytes:
+    """opens a connection on the coordinator side, returns its nonce,
+    raises PermissionError if the worker rejects the key"""
+    try:
+        nonce = _receive_exactly(sock, _NONCE_SIZE)
+        sock.sendall(_sign(key, b"coordinator", nonce))
+        if _receive_exactly(sock, len(_ACCEPTED)) == _ACCEPTED:
+            return nonce
+    except EOFError:
+        pass
+    raise PermissionError("The remote worker rejected the shared key")
+
+
+def _receive_exactly(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise EOFError("The connection was closed")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def parse_addresses(addresses: Union[str, Sequence[str]]) -> List[Tuple[str, int]]:
+    """parses ``host:port`` addresses, a list or a comma separated string"""
+    if isinstance(addresses, str):
+        addresses = [address.strip() for address in addresses.split(",")]
+    parsed = []
+    for address in addresses:
+        host, _, port = address.rpartition(":")
+        if not host or not port.isdigit():
+            raise ValueError(
+                f"'remote_workers' must be addresses of the form host:port, got {address}"
+            )
+        parsed.append((host, int(port)))
+    if not parsed:
+        raise ValueError("'remote_workers' must be given with the remote backend")
+    return parsed
+
+
+class RemoteBackend(ProcessBackend):  # pylint: disable=too-few-public-methods
+    """Partitions a bundle between remote worker nodes, each node runs its slice
+    concurrently on its own gevent hub and pool. Results are merged back in bundle order.
+
+    Nodes are started with ``python -m GeventLibrary.execution.remote_worker``,
+    they must import the same libraries as the suite. Invocations and results are pickled,
+    every connection is authenticated and every message is signed with the key shared
+    by the suite and the nodes, given or taken from ``GEVENT_LIBRARY_REMOTE_KEY``.
+    Each slice is sent over a connection of its own, closing it kills the coroutines
+    of the slice on the node.
+    """
+
+    def __init__(
+        self, addresses: Union[str, Sequence[str]], key: Optional[str] = None
+    ) -> None:
+        self._addresses = parse_addresses(addresses)
+        self._key = shared_key(key)
+        super().__init__(len(self._addresses))
+
+    def _start(self, worker: int) -> socket.socket:  # type: ignore[override]
+        host, port = self._addresses[worker]
+        try:
+            return socket.create_connection((host, port))
+        except OSError as ex:
+            raise ConnectionError(
+                f"Remote worker {host}:{port} is not reachable: {ex}"
+            ) from ex
+
+    def _communicate(  # type: ignore[override]
+        self,
+        worker: socket.socket,
+        invocation_slice: List[Tuple[int, ProcessInvocation]],
+    ) -> List[WorkerResult]:
+        with worker:
+            host, port = worker.getpeername()[:2]
+            try:
+                nonce = answer_handshake(worker, self._key)
+            except PermissionError:
+                raise PermissionError(
+                    f"Remote worker {host}:{port} rejected the shared key"
+                ) from None
+            send_message(worker, invocation_slice, self._key, nonce + b"request")
+            try:
+                return receive_message(worker, self._key, nonce + b"results")
+            except EOFError:
+                raise RuntimeError(
+                    f"Remote worker {host}:{port} closed the connection without results"
+                ) from None
+
+    @staticmethod
+    def _abort(worker: socket.socket) -> None:  # type: ignore[override]
+        worker.close()
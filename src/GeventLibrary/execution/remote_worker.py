@@ -0,0 +1,100 @@
+"""worker node of the remote backend, serves slices of bundles on its own gevent hub
+
+    GEVENT_LIBRARY_REMOTE_KEY=... python -m GeventLibrary.execution.remote_worker --host 10.0.0.5 --port 8271
+
+listens on 127.0.0.1 unless given another interface. Every connection proves it has the key
+shared with the suite, then sends a signed pickled list of ``(index, ProcessInvocation)``
+and receives a signed pickled list of ``WorkerResult``.
+"""
+# genevt monkey patch should be placed at the top
+# pylint: disable=wrong-import-position
+# pylint: disable=wrong-import-order
+from gevent import monkey
+
+monkey.patch_all(thread=False)
+
+import argparse
+from typing import Optional
+
+from gevent import GreenletExit, getcurrent, spawn
+from gevent.pool import Pool
+from gevent.server import StreamServer
+
+from GeventLibrary.execution.process_worker import collect_messages, start_slice
+from GeventLibrary.execution.remote_backend import (
+    offer_handshake,
+    receive_message,
+    send_message,
+    shared_key,
+)
+
+DEFAULT_PORT = 8271
+
+
+def _watch(sock, handler) -> None:
+    # the coordinator sends nothing more, it closes the connection when it gives up
+    sock.recv(1)
+    handler.kill(block=False)
+
+
+class RemoteWorker(StreamServer):
+    """serves slices of bundles to coordinators having the key,
+    at most ``pool_size`` coroutines run at once if given"""
+
+    def __init__(self, address, key: bytes, pool_size: int = 0) -> None:
+        super().__init__(address, self.handle_slice)
+        self.pool_size = pool_size
+        self._key = key
+
+    def handle_slice(self, sock, _) -> None:
+        """runs a slice of a bundle and sends back its results,
+        connections without the key are closed before anything is unpickled"""
+        nonce = offer_handshake(sock, self._key)
+        if nonce is None:
+            return
+        try:
+            invocation_slice = receive_message(sock, self._key, nonce + b"request")
+        except (EOFError, PermissionError):
+            return
+        group = Pool(self.pool_size or None)
+        watcher = spawn(_watch, sock, getcurrent())
+        try:
+            jobs = start_slice(invocation_slice, group)
+            group.join()
+        except GreenletExit:
+            group.kill()
+            return
+        finally:
+            watcher.kill()
+        send_message(sock, [job.value for job in jobs], self._key, nonce + b"results")
+
+
+def main(argv: Optional[list] = None) -> None:
+    """serves until interrupted"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="interface to listen on, only the local one by default",
+    )
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=0,
+        help="maximal number of coroutines running at once, 0 for no limit",
+    )
+    args = parser.parse_args(argv)
+    try:
+        key = shared_key()
+    except ValueError as ex:
+        parser.error(str(ex))
+    collect_messages()
+    server = RemoteWorker((args.host, args.port), key, args.pool_size)
+    server.start()
+    print(f"Serving on {args.host}:{server.server_port}", flush=True)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""buffering of the robot results of a single coroutine"""
+from typing import Any, Callable, List, Tuple
+
+_START = 0
+_END = 1
+_MESSAGE = 2
+
+
+class CoroutineResultBuffer:
+    """Records the keyword events and log messages of a coroutine while it runs.
+
+    Greenlets of a bundle interleave, writing their events to robot's output as they happen
+    would mix keywords of different coroutines. The events are therefore kept aside
+    and replayed in one go once the coroutine is done,
+    so each coroutine ends up as a complete nested keyword in output.xml.
+    """
+
+    __slots__ = ("_events", "_open")
+
+    def __init__(self) -> None:
+        self._events: List[Tuple[int, Any]] = []
+        self._open: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def start_keyword(self, keyword_item) -> None:
+        """listener for starting a keyword"""
+        self._events.append((_START, keyword_item))
+        self._open.append(keyword_item)
+
+    def end_keyword(self, keyword_item) -> None:
+        """listener for ending a keyword"""
+        self._events.append((_END, keyword_item))
+        if self._open:
+            self._open.pop()
+
+    def log_message(self, message) -> None:
+        """listener for messages logged by the keywords"""
+        self._events.append((_MESSAGE, message))
+
+    def replay(
+        self,
+        start_keyword: Callable[[Any], None],
+        end_keyword: Callable[[Any], None],
+        log_message: Callable[[Any], None],
+    ) -> None:
+        """writes the recorded events to the given callables and empties the buffer.
+
+        Keywords that never ended, because their greenlet was killed mid-way,
+        are ended as well, so the written tree stays balanced.
+        """
+        events, self._events = self._events, []
+        still_open, self._open = self._open, []
+        handlers = (start_keyword, end_keyword, log_message)
+        for kind, item in events:
+            handlers[kind](item)
+        for keyword_item in reversed(still_open):
+            end_keyword(keyword_item)
@@ -0,0 +1,99 @@
+"""retrying of failed coroutines inside their greenlet"""
+from fnmatch import fnmatchcase
+from random import uniform
+from typing import Any, Callable, Optional, Sequence, Union
+
+from gevent import sleep
+from robot.api import logger
+
+from .kills import wraps_kill
+
+
+class RetryPolicy:
+    """Defines how a failed coroutine is retried.
+
+    ``max_attempts`` - maximal number of executions, including the first one
+    ``backoff``      - delay in seconds before the first retry, doubled on every retry
+    ``max_backoff``  - upper limit of the delay
+    ``jitter``       - whether the delay is randomized between 0 and the calculated delay
+    ``retry_on``     - glob patterns of errors to retry, matched against the error message
+                       and against ``<type>: <message>``, all errors are retried by default
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 0.1,
+        max_backoff: float = 10,
+        *,
+        jitter: bool = True,
+        retry_on: Optional[Union[str, Sequence[str]]] = None,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError(
+                f"'max_attempts' must be a positive value, got {max_attempts}"
+            )
+        if backoff < 0 or max_backoff < 0:
+            raise ValueError("'backoff' and 'max_backoff' must be non negative values")
+        if isinstance(retry_on, str):
+            retry_on = [retry_on]
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_on = list(retry_on or [])
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, backoff={self.backoff}, "
+            f"max_backoff={self.max_backoff}, jitter={self.jitter}, retry_on={self.retry_on})"
+        )
+
+    def should_retry(self, error: BaseException) -> bool:
+        """whether the error matches the retry patterns"""
+        if not isinstance(error, Exception):
+            return False
+        if not self.retry_on:
+            return True
+        texts = (str(error), f"{type(error).__name__}: {error}")
+        return any(
+            fnmatchcase(text, pattern) for pattern in self.retry_on for text in texts
+        )
+
+    def delay(self, retry: int) -> float:
+        """seconds to wait before the given retry, counted from 1"""
+        delay = min(self.max_backoff, self.backoff * 2 ** (retry - 1))
+        return uniform(0, delay) if self.jitter else delay
+
+    def call(
+        self,
+        function: Callable,
+        *args: Any,
+        on_attempt: Optional[Callable[[int], None]] = None,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Any:
+        """calls the function until it succeeds, the error is not retried
+        or the attempts are exhausted, the last error is raised.
+        Kills (also when robot wraps them) are never retried, neither is anything
+        once ``cancelled`` returns True"""
+        attempt = 1
+        while True:
+            if on_attempt:
+                on_attempt(attempt)
+            try:
+                return function(*args)
+            except Exception as ex:  # pylint: disable=broad-except
+                if (
+                    attempt >= self.max_attempts
+                    or wraps_kill(ex)
+                    or (cancelled and cancelled())
+                    or not self.should_retry(ex)
+                ):
+                    raise
+                delay = self.delay(attempt)
+                logger.info(
+                    f"Attempt {attempt}/{self.max_attempts} failed with '{ex}', "
+                    f"retrying in {delay:.3f} seconds"
+                )
+                sleep(delay)
+                attempt += 1
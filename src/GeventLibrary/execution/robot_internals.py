@@ -0,0 +1,26 @@
+"""the robot versions whose private internals the library builds on"""
+from typing import Tuple
+
+from robot.version import VERSION
+
+from GeventLibrary.exceptions import UnsupportedRobotVersion
+
+# first supported version and first version that is not supported
+SUPPORTED_VERSIONS = ((5, 0), (7, 0))
+
+
+def robot_version() -> Tuple[int, int]:
+    """major and minor version of the running robotframework"""
+    major, minor = VERSION.split(".")[:2]
+    return int(major), int("".join(char for char in minor if char.isdigit()) or 0)
+
+
+def check_robot_version(feature: str) -> None:
+    """raises before a feature relying on robot's private internals touches them,
+    when robot's version is not one the internals were checked against"""
+    first, last = SUPPORTED_VERSIONS
+    if not first <= robot_version() < last:
+        raise UnsupportedRobotVersion(
+            f"{feature} relies on internals of robotframework {first[0]}.{first[1]} "
+            f"up to {last[0]}.{last[1]} (excluded), robotframework {VERSION} is running"
+        )
@@ -0,0 +1,65 @@
+"""settings of a bundle run, grouped so the run keywords take them as a single argument"""
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Union
+
+from .kills import KILL_GRACE_PERIOD
+
+if TYPE_CHECKING:
+    from .adaptive import AdaptiveConcurrency
+    from .process_backend import ProcessBackend
+    from .progress import ProgressReporting
+    from .retry import RetryPolicy
+
+# the backends are imported by the runs using them
+# pylint: disable=import-outside-toplevel
+
+# settings supported by `Run Coroutines` only, with their value when they are not set
+_RUN_COROUTINES_ONLY = (
+    ("fail_fast", False),
+    ("backend", "gevent"),
+    ("adaptive_concurrency", None),
+    ("progress", None),
+)
+
+
+class RunSettings(NamedTuple):
+    """Settings of bundle runs, created by `Create Run Settings`, see its arguments."""
+
+    log_level: str = "NESTED"
+    pool_name: Optional[str] = None
+    fail_fast: bool = False
+    backend: str = "gevent"
+    process_workers: int = 0
+    remote_workers: Union[str, List[str], None] = None
+    rate: float = 0
+    ramp_up: float = 0
+    jitter: float = 0
+    retry_policy: Optional["RetryPolicy"] = None
+    adaptive_concurrency: Optional["AdaptiveConcurrency"] = None
+    progress: Optional["ProgressReporting"] = None
+    kill_grace_period: float = KILL_GRACE_PERIOD
+
+    def check_started_only(self, keyword_name: str) -> None:
+        """raises for the settings that need the run to be waited for by `Run Coroutines`,
+        the given keyword only starts the coroutines"""
+        for name, unset in _RUN_COROUTINES_ONLY:
+            if getattr(self, name) != unset:
+                raise ValueError(
+                    f"'{name}' is supported by `Run Coroutines` only, not by `{keyword_name}`"
+                )
+
+    def worker_backend(self) -> Optional["ProcessBackend"]:
+        """the backend running the coroutines in worker processes or nodes,
+        None when they run on the current gevent hub"""
+        if self.backend == "gevent":
+            return None
+        from .process_backend import BACKENDS, ProcessBackend
+
+        if self.backend not in BACKENDS:
+            raise ValueError(
+                f"'backend' must be one of {', '.join(BACKENDS)}, got {self.backend}"
+            )
+        if self.backend == "remote":
+            from .remote_backend import RemoteBackend
+
+            return RemoteBackend(self.remote_workers or ())
+        return ProcessBackend(self.process_workers)
@@ -0,0 +1,88 @@
+"""pacing of coroutines spawning, to produce controlled load"""
+from random import uniform
+from time import monotonic
+from typing import Any, Callable, Optional
+
+from gevent import Greenlet, sleep
+
+from .records import stamp_queued
+
+
+class TokenBucket:  # pylint: disable=too-few-public-methods
+    """Allows ``rate`` acquisitions per second, with bursts of up to ``burst`` acquisitions"""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self._rate = rate
+        self._capacity = burst
+        self._tokens = float(burst)
+        self._updated = monotonic()
+
+    def acquire(self) -> None:
+        """waits cooperatively until a token is available and takes it"""
+        while True:
+            now = monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            sleep((1 - self._tokens) / self._rate)
+
+
+def _delayed(delay: float, function: Callable, *args: Any) -> Any:
+    sleep(delay)
+    # the jitter is pacing, not a wait for the pool slot the greenlet already holds
+    stamp_queued(function)
+    return function(*args)
+
+
+class SpawnScheduler:
+    """Paces the spawning of the coroutines of a bundle.
+
+    ``rate``     - maximal number of coroutines started per second (token bucket)
+    ``ramp_up``  - seconds over which the starts are spread linearly
+    ``jitter``   - maximal random delay added to the start of every coroutine
+    """
+
+    def __init__(
+        self, count: int, rate: float = 0, ramp_up: float = 0, jitter: float = 0
+    ) -> None:
+        for name, value in (("rate", rate), ("ramp_up", ramp_up), ("jitter", jitter)):
+            if value < 0:
+                raise ValueError(f"'{name}' must be a non negative value, got {value}")
+        self._count = count
+        self._ramp_up = ramp_up
+        self._jitter = jitter
+        self._bucket = TokenBucket(rate) if rate else None
+        self._started: Optional[float] = None
+        self._index = 0
+
+    @property
+    def active(self) -> bool:
+        """whether any pacing is applied"""
+        return bool(self._bucket or self._ramp_up or self._jitter)
+
+    def wrap(self, spawn_callable: Callable[..., Greenlet]) -> Callable[..., Greenlet]:
+        """wraps a spawn callable, so every spawn waits for its turn"""
+
+        def _spawn(function, *args):
+            self._wait()
+            if self._jitter:
+                return spawn_callable(
+                    _delayed, uniform(0, self._jitter), function, *args
+                )
+            return spawn_callable(function, *args)
+
+        return _spawn
+
+    def _wait(self) -> None:
+        if self._started is None:
+            self._started = monotonic()
+        if self._ramp_up:
+            start_at = self._started + self._ramp_up * self._index / self._count
+            sleep(max(0.0, start_at - monotonic()))
+        if self._bucket:
+            self._bucket.acquire()
+        self._index += 1
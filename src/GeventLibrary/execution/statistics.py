@@ -0,0 +1,142 @@
+"""timing and throughput statistics of a bundle run"""
+import csv
+import json
+import math
+from time import monotonic
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .records import CoroutineRecord
+
+CSV_FIELDS = (
+    "keyword",
+    "args",
+    "status",
+    "attempts",
+    "queue_wait",
+    "elapsed",
+    "blocked",
+)
+
+
+def percentile(values: Sequence[float], percent: float) -> Optional[float]:
+    """nearest-rank percentile of sorted values, None for no values"""
+    if not values:
+        return None
+    rank = max(1, math.ceil(percent / 100 * len(values)))
+    return values[rank - 1]
+
+
+def max_concurrency(records: Sequence[CoroutineRecord]) -> int:
+    """the largest number of coroutines that were running at the same time"""
+    events = []
+    for record in records:
+        if record.started is not None:
+            events.append((record.started, 1))
+            events.append((record.ended or monotonic(), -1))
+    # ends sort before starts of the same instant
+    events.sort()
+    running = peak = 0
+    for _, change in events:
+        running += change
+        peak = max(peak, running)
+    return peak
+
+
+class BundleStatistics:
+    """Statistics of the coroutines of a single bundle run.
+
+    Calculated from the coroutines records on demand,
+    so collecting them costs nothing while the bundle is running.
+    Runs with adaptive concurrency report the limit over time, as the seconds
+    since the run started and the limit from then on.
+    """
+
+    def __init__(
+        self,
+        records: Sequence[CoroutineRecord],
+        concurrency: Optional[List[Tuple[float, int]]] = None,
+    ) -> None:
+        self._records = records
+        self.concurrency = concurrency
+        # the run starts with its statistics, the records of a batch are created while it runs
+        self._started = monotonic()
+
+    @property
+    def records(self) -> Sequence[CoroutineRecord]:
+        """records of all the coroutines of the run"""
+        return self._records
+
+    @property
+    def statuses(self) -> Dict[str, int]:
+        """number of coroutines by the status they ended with"""
+        statuses: Dict[str, int] = {}
+        for record in self._records:
+            statuses[record.status] = statuses.get(record.status, 0) + 1
+        return statuses
+
+    def summary(self) -> Dict[str, Any]:
+        """aggregated statistics, durations are in seconds"""
+        elapsed = sorted(
+            record.elapsed for record in self._records if record.ended is not None
+        )
+        queue_waits = [
+            record.queue_wait
+            for record in self._records
+            if record.queue_wait is not None
+        ]
+        ended = [record.ended for record in self._records if record.ended is not None]
+        wall_time = (max(ended) if ended else monotonic()) - self._started
+        return {
+            "count": len(self._records),
+            "completed": len(elapsed),
+            "statuses": self.statuses,
+            "wall_time": wall_time,
+            "throughput": len(elapsed) / wall_time if wall_time > 0 else 0.0,
+            "min": elapsed[0] if elapsed else None,
+            "mean": sum(elapsed) / len(elapsed) if elapsed else None,
+            "max": elapsed[-1] if elapsed else None,
+            "p50": percentile(elapsed, 50),
+            "p95": percentile(elapsed, 95),
+            "p99": percentile(elapsed, 99),
+            "mean_queue_wait": sum(queue_waits) / len(queue_waits)
+            if queue_waits
+            else None,
+            "max_concurrency": max_concurrency(self._records),
+            "retries": sum(max(0, record.attempts - 1) for record in self._records),
+            "blocked": sum(1 for record in self._records if record.blocked),
+            "concurrency": [list(change) for change in self.concurrency]
+            if self.concurrency is not None
+            else None,
+        }
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """a row per coroutine, by the order they were added to the bundle"""
+        return [
+            {
+                "keyword": record.spec.keyword_name,
+                "args": "    ".join(str(arg) for arg in record.spec.args),
+                "status": record.status,
+                "attempts": record.attempts,
+                "queue_wait": record.queue_wait,
+                "elapsed": record.elapsed,
+                "blocked": record.blocked,
+            }
+            for record in self._records
+        ]
+
+    def save(self, path: str) -> None:
+        """writes the statistics to a .json (summary and rows) or .csv (rows) file"""
+        if path.lower().endswith(".csv"):
+            with open(path, "w", newline="", encoding="utf-8") as csv_file:
+                writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDS)
+                writer.writeheader()
+                writer.writerows(self.rows())
+        elif path.lower().endswith(".json"):
+            with open(path, "w", encoding="utf-8") as json_file:
+                json.dump(
+                    {"summary": self.summary(), "coroutines": self.rows()},
+                    json_file,
+                    indent=4,
+                )
+        else:
+            raise ValueError(f"Statistics can be saved as .json or .csv, got {path}")
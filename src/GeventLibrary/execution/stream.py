@@ -0,0 +1,97 @@
+"""values of a running bundle, handed back in completion order"""
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Tuple
+
+from gevent import Greenlet, spawn
+from gevent.queue import Empty, Queue
+from robot.api import logger
+
+from GeventLibrary.exceptions import NoPendingCoroutines
+
+from .kills import KILL_GRACE_PERIOD
+from .records import CoroutineRecord
+
+if TYPE_CHECKING:
+    from .bundle_run import RobotContext
+
+
+class CoroutineStream:
+    """Collects the greenlets of a bundle as they complete.
+
+    A greenlet is referenced only until its value was handed back,
+    so values are released as soon as the caller is done with them.
+    The output router, the context stacks and the keywords cache are released
+    once all values were handed back or the stream is closed.
+    """
+
+    # seconds given to the killed coroutines to finish their cleanup
+    kill_grace_period = KILL_GRACE_PERIOD
+
+    def __init__(self, robot_ctx: "RobotContext", size: int) -> None:
+        self._robot_ctx: Optional["RobotContext"] = robot_ctx
+        self._completed: Queue = Queue()
+        self._running = set()
+        self._pending = size
+        self._feeder: Optional[Greenlet] = None
+
+    @property
+    def pending(self) -> int:
+        """number of values not handed back yet"""
+        return self._pending
+
+    def feed(
+        self,
+        spawn_callable: Callable[..., Greenlet],
+        calls: Iterable[Tuple[Callable, Tuple]],
+    ) -> None:
+        """spawns the calls in a background greenlet, so a full pool does not block the caller"""
+        self._feeder = spawn(self._feed, spawn_callable, calls)
+
+    def _feed(self, spawn_callable, calls) -> None:
+        for function, args in calls:
+            self.add(spawn_callable(function, *args))
+
+    def add(self, greenlet: Greenlet) -> None:
+        """registers a greenlet of the bundle"""
+        self._running.add(greenlet)
+        greenlet.rawlink(self._on_complete)
+
+    def _on_complete(self, greenlet: Greenlet) -> None:
+        self._running.discard(greenlet)
+        self._completed.put(greenlet)
+
+    def next(self, timeout: float = None) -> Any:
+        """waits for the next completed greenlet and returns its value,
+        raises the exception of the greenlet if it failed"""
+        if self._pending <= 0:
+            raise NoPendingCoroutines("All the coroutines values were already returned")
+        try:
+            greenlet = self._completed.get(timeout=timeout)
+        except Empty as ex:
+            raise TimeoutError(
+                f"No coroutine has completed within {timeout} seconds"
+            ) from ex
+        self._pending -= 1
+        # the results of deferred greenlets are written under the keyword handing back the value
+        self._robot_ctx.router.flush(greenlet)
+        if self._pending == 0:
+            self.close()
+        if greenlet.exception:
+            raise greenlet.exception
+        return greenlet.value
+
+    def close(self) -> None:
+        """kills the greenlets that are still running, within the kill grace period,
+        releases the output router, the context stacks and the keywords cache"""
+        if self._robot_ctx is None:
+            return
+        if self._feeder is not None:
+            self._feeder.kill()
+        survivors = CoroutineRecord.kill(list(self._running), self.kill_grace_period)
+        if survivors:
+            logger.warn(
+                f"{len(survivors)} coroutine(s) were still running after being killed"
+            )
+        self._running.clear()
+        self._pending = 0
+        self._robot_ctx.release()
+        self._robot_ctx = None
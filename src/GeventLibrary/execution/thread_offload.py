@@ -0,0 +1,108 @@
+"""running the library keywords of blocking coroutines on native threads"""
+import threading
+from typing import Any, Callable, Dict, List, Tuple
+
+from gevent import getcurrent
+from gevent.threadpool import ThreadPool
+from robot.output import librarylogger
+from robot.running.librarykeywordrunner import LibraryKeywordRunner
+
+from .records import CoroutineRecord
+from .robot_internals import check_robot_version
+
+# libraries running robot's own machinery, their keywords always run on the hub's thread
+NOT_OFFLOADED = ("BuiltIn", "GeventLibrary")
+
+_local = threading.local()
+
+# robot's own implementations, called by the patched ones while they are installed
+_original_runner_for = LibraryKeywordRunner._runner_for  # pylint: disable=protected-access
+_original_write = librarylogger.write
+
+
+def _in_thread(
+    messages: List[Tuple[Any, str, bool]],
+    handler: Callable,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> Any:
+    _local.messages = messages
+    try:
+        return handler(*args, **kwargs)
+    finally:
+        _local.messages = None
+
+
+class ThreadOffload:  # pylint: disable=too-few-public-methods
+    """Runs the library keywords of coroutines marked as blocking on a thread pool.
+
+    Keywords blocking in C extensions, native sockets or subprocesses
+    (SSH, browser drivers) cannot yield to the gevent hub, so they stall the whole bundle.
+    Only the call of the library keyword's python function is handed to a native thread
+    of the coroutine's pool, robot starts, logs and ends the keyword on the hub's thread as usual
+    and the greenlet of the coroutine waits cooperatively for the thread. Robot ignores messages
+    logged outside of its main thread, so the messages of an offloaded keyword are kept
+    and logged once the call returns. User keywords of a blocking coroutine run as usual,
+    the library keywords they call are offloaded.
+    Installed only while bundles with blocking coroutines run, robot's runner and logger
+    are restored after the last release. Library keywords of other greenlets are not affected.
+    """
+
+    _users = 0
+    # robot's runner and logger replaced by the installed ones
+    _replaced: Tuple[Callable, Callable] = (_original_runner_for, _original_write)
+
+    @classmethod
+    def acquire(cls) -> None:
+        """patches robot's library keyword runner and logger, unless a running bundle did"""
+        if cls._users == 0:
+            check_robot_version("Running blocking coroutines on threads")
+            # pylint: disable=protected-access
+            cls._replaced = (LibraryKeywordRunner._runner_for, librarylogger.write)
+            LibraryKeywordRunner._runner_for = cls._runner_for
+            librarylogger.write = cls._write
+        cls._users += 1
+
+    @classmethod
+    def release(cls) -> None:
+        """releases the patches, robot's runner and logger are restored after the last release"""
+        cls._users -= 1
+        if cls._users > 0:
+            return
+        runner_for, write = cls._replaced
+        # pylint: disable=protected-access
+        if LibraryKeywordRunner._runner_for is cls._runner_for:
+            LibraryKeywordRunner._runner_for = runner_for
+        if librarylogger.write is cls._write:
+            librarylogger.write = write
+
+    @staticmethod
+    def _runner_for(runner, context, handler, positional, named):
+        record = CoroutineRecord.running.get(getcurrent())
+        if (
+            record is not None
+            and record.spec.threadpool is not None
+            and runner.libname not in NOT_OFFLOADED
+        ):
+            handler = ThreadOffload._offloaded(record.spec.threadpool, handler)
+        return _original_runner_for(runner, context, handler, positional, named)
+
+    @staticmethod
+    def _offloaded(threadpool: ThreadPool, handler: Callable) -> Callable:
+        def _call(*args, **kwargs):
+            messages: List[Tuple[Any, str, bool]] = []
+            try:
+                return threadpool.apply(_in_thread, (messages, handler, args, kwargs))
+            finally:
+                for message, level, html in messages:
+                    _original_write(message, level, html)
+
+        return _call
+
+    @staticmethod
+    def _write(msg, level, html=False):
+        messages = getattr(_local, "messages", None)
+        if messages is None:
+            return _original_write(msg, level, html)
+        messages.append((msg, level, html))
+        return None
@@ -20,20 +20,13 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-# genevt monkey patch should be placed at the top
-# pylint: disable=wrong-import-position
-# pylint: disable=wrong-import-order
-
-from gevent import monkey # mypy: disable
-
-
-monkey.patch_all(thread=False)
-
-from typing import Any, List
+from typing import Dict, Optional, Sequence, Union
 
+from gevent import monkey
 from robotlibcore import DynamicCore  # type: ignore
 
 from .keywords import GeventKeywords
+from .patching import MonkeyPatching
 
 
 class GeventLibrary(DynamicCore):
@@ -66,20 +59,98 @@ class GeventLibrary(DynamicCore):
     gevent containing code will work properly in a bundle and will be concurrent to the other coroutines.
     === asyncio ===
     asyncio containing code will work properly in a bundle and will be concurrent to the other coroutines.
+    Keywords implemented as ``async def`` functions (robotframework 6.1 and newer) are awaited on
+    a single asyncio loop shared by all the coroutines, thousands of them await concurrently
+    without a new loop or thread per keyword.
+
+    == CPU heavy keywords ==
+    All coroutines of a bundle share a single thread, CPU heavy keywords are executed one after the other.
+    `Run Coroutines` with ``backend=process`` (see `Create Run Settings`) splits the bundle between worker processes,
+    each worker runs its coroutines on its own gevent hub and the values are returned in bundle order.
+    ``backend=remote`` splits it between worker nodes started on other hosts with
+    ``python -m GeventLibrary.execution.remote_worker --host 10.0.0.5 --port 8271``,
+    their addresses are given by ``remote_workers``. Invocations and results are pickled,
+    the suite and the nodes authenticate each other and sign every message with the key
+    of the ``GEVENT_LIBRARY_REMOTE_KEY`` environment variable.
+
+    == Blocking keywords ==
+    Keywords blocking in C extensions, threads or subprocesses stall all the coroutines of the bundle.
+    Import the library with ``blocking_threshold`` to find them, every coroutine not yielding
+    to the gevent hub for longer is reported as a warning with the stack it blocked in.
+    Coroutines added with ``blocking=True`` run their library keywords on a pool of native threads,
+    so they overlap with each other and with the cooperative coroutines.
+
+    == Monkey patching ==
+    gevent patches the standard library (sockets, ssl, time, select, subprocesses...) with cooperative
+    versions when the library is initialized by the suite, modules imported by robot before the library keep
+    the blocking versions. ``python -m GeventLibrary`` runs robot, with the same arguments, after
+    patching, so every module gets the cooperative versions. The moment and the patched
+    subsystems are configured by ``patch_at`` and ``patch_subsystems``, or by the
+    ``GEVENT_LIBRARY_PATCH`` and ``GEVENT_LIBRARY_PATCH_SUBSYSTEMS`` environment variables.
     """
 
-    libraries: List[Any] = [GeventKeywords()]
     ROBOT_LIBRARY_SCOPE = "Global"
     # ROBOT_LISTENER_API_VERSION = 2
 
-    def __init__(self, patch_threads: bool = False):
+    def __init__(
+        self,
+        patch_threads: bool = False,
+        *,
+        pools: Optional[Dict[str, int]] = None,
+        blocking_threshold: float = 0,
+        threadpool_size: int = 10,
+        patch_at: Optional[str] = None,
+        patch_subsystems: Union[str, Sequence[str], None] = None,
+        http_connections_per_host: int = 10,
+    ):
         """
 
         Args:
             patch_threads (bool, optional): This is an experimental flag to solve the issue with robotframework SSH library.
             see - https://github.com/eldaduzman/robotframework-gevent/issues/94. Defaults to False.
+
+            pools (dict, optional): Named gevent pools to create, mapping pool name to pool size.
+            Bundles run with ``pool_name`` share the pool's concurrency limit. Defaults to None.
+
+            | Library    GeventLibrary    pools={'backend': 10, 'database': 2}
+
+            blocking_threshold (float, optional): Seconds a coroutine may run without yielding to
+            the gevent hub, 0 to disable the monitoring. Coroutines blocking longer (in C extensions,
+            threads or subprocesses) are reported as warnings with their stack and counted
+            in `Get Bundle Statistics`. Defaults to 0.
+
+            | Library    GeventLibrary    blocking_threshold=0.1
+
+            threadpool_size (int, optional): Number of native threads running the library keywords
+            of coroutines added with ``blocking=True``. Defaults to 10.
+
+            patch_at (str, optional): When gevent patches the standard library, one of
+            ``init`` (when the library is imported by the suite), ``run`` (right before the first bundle runs)
+            or ``never``. Defaults to the ``GEVENT_LIBRARY_PATCH`` environment variable or ``init``.
+
+            patch_subsystems (str or list, optional): The subsystems to patch, named like the arguments of
+            ``gevent.monkey.patch_all``, a list or a comma separated string. Defaults to the
+            ``GEVENT_LIBRARY_PATCH_SUBSYSTEMS`` environment variable or all but ``thread`` and ``sys``.
+
+            | Library    GeventLibrary    patch_at=run    patch_subsystems=socket,ssl,dns,select,time
+
+            http_connections_per_host (int, optional): Maximal number of requests of `Add HTTP Coroutine`
+            sent to the same host at once, each over a keep-alive connection of its own. Defaults to 10.
+
+        The arguments after ``patch_threads`` are given as named arguments only.
         """
         # self.ROBOT_LIBRARY_LISTENER = self # currently a listener is not needed...
-        DynamicCore.__init__(self, GeventLibrary.libraries)
+        patching = MonkeyPatching(patch_at, patch_subsystems)
+        patching.patch_by("init")
+        self.libraries = [
+            GeventKeywords(
+                pools=pools,
+                blocking_threshold=blocking_threshold,
+                threadpool_size=threadpool_size,
+                patching=patching,
+                http_connections_per_host=http_connections_per_host,
+            )
+        ]
+        DynamicCore.__init__(self, self.libraries)
         if patch_threads:
             monkey.patch_thread()
@@ -0,0 +1,210 @@
+"""coroutines of the bundles, as added by the keywords"""
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from GeventLibrary.exceptions import BundleIsTemplate
+
+if TYPE_CHECKING:
+    from GeventLibrary.execution import CoroutineSpec, RetryPolicy, SpecBatch
+
+
+class RobotKeywordCoroutine:  # pylint: disable=too-many-instance-attributes
+    """Class defining a keywords for coroutine"""
+
+    # retry policy of the coroutine, None to use the bundle's policy
+    retry_policy: Optional["RetryPolicy"] = None
+    # name other coroutines of the bundle may depend on
+    name: Optional[str] = None
+    # names of the coroutines whose values are appended to the positional arguments
+    depends_on: Sequence[str] = ()
+    # whether the library keywords of the coroutine are run on the thread pool
+    blocking = False
+    # callable run instead of robot's keyword, with the keyword name and arguments
+    function: Optional[Callable[..., Any]] = None
+
+    def __init__(self, keyword_name, *args, **kwargs) -> None:
+        self._keyword_name = keyword_name
+        self._args = args
+        self._kwargs = kwargs
+
+    @property
+    def keyword_name(self):
+        """keyword to execute"""
+        return self._keyword_name
+
+    @property
+    def all_args(self):
+        """args and kwargs in robotframework format"""
+        return [
+            *self._args,
+            *[f"{key}={value}" for key, value in self._kwargs.items()],
+        ]
+
+    @property
+    def named_count(self) -> int:
+        """number of named arguments, they come last in ``all_args``"""
+        return len(self._kwargs)
+
+    def overridden(self, override: Union[Sequence, Dict[str, Any]]) -> "RobotKeywordCoroutine":
+        """a copy of the coroutine, its positional arguments replaced by a list
+        or its named arguments updated by a dict"""
+        if isinstance(override, dict):
+            if self.function is not None:
+                raise ValueError(
+                    f"'overrides' of the coroutine {self.name} must be a list of positional arguments"
+                )
+            return self.with_arguments(*self._args, **{**self._kwargs, **override})
+        return self.with_arguments(*override, **self._kwargs)
+
+    def with_arguments(self, *args, **kwargs) -> "RobotKeywordCoroutine":
+        """a copy of the coroutine with the given arguments instead of its own"""
+        coro = RobotKeywordCoroutine(self._keyword_name, *args, **kwargs)
+        coro.retry_policy = self.retry_policy
+        coro.name = self.name
+        coro.depends_on = self.depends_on
+        coro.blocking = self.blocking
+        coro.function = self.function
+        return coro
+
+
+class RobotKeywordCoroutines:
+    """Class defining a batch of coroutines executing the same keyword,
+    the keyword name and common arguments are stored once,
+    the arguments of each coroutine are combined only when it is about to run"""
+
+    # retry policy of the coroutines, None to use the bundle's policy
+    retry_policy: Optional["RetryPolicy"] = None
+    # whether the library keywords of the coroutines are run on the thread pool
+    blocking = False
+
+    def __init__(
+        self, keyword_name, arg_sets: Union[int, Sequence], *args, **kwargs
+    ) -> None:
+        """``arg_sets`` are the arguments of each coroutine,
+        or the number of coroutines running with the common arguments only"""
+        self._keyword_name = keyword_name
+        self._arg_sets = arg_sets
+        self._args = args
+        self._kwargs = kwargs
+        self._common = RobotKeywordCoroutine(keyword_name, *args, **kwargs)
+
+    @property
+    def keyword_name(self):
+        """keyword to execute"""
+        return self._keyword_name
+
+    @property
+    def common(self) -> RobotKeywordCoroutine:
+        """the coroutine running the keyword with the common arguments only"""
+        return self._common
+
+    @property
+    def identical(self) -> bool:
+        """whether all the coroutines run with the common arguments only"""
+        return isinstance(self._arg_sets, int)
+
+    def __len__(self):
+        return self._arg_sets if self.identical else len(self._arg_sets)
+
+    def arguments(self, index: int) -> Tuple[List[Any], int]:
+        """the args and kwargs of the coroutine at the given index in robotframework format,
+        and the number of kwargs, they come last"""
+        if self.identical:
+            return self._common.all_args, self._common.named_count
+        arg_set = self._arg_sets[index]
+        args, kwargs = self._args, self._kwargs
+        if isinstance(arg_set, dict):
+            kwargs = {**kwargs, **arg_set}
+        elif isinstance(arg_set, (list, tuple)):
+            args = (*args, *arg_set)
+        else:
+            args = (*args, arg_set)
+        return [*args, *[f"{key}={value}" for key, value in kwargs.items()]], len(kwargs)
+
+
+class CoroutineBundle:
+    """Class defining the coroutines of a bundle, by the order they were added"""
+
+    # keyword every value is handed to as soon as its coroutine completes, it returns the value to keep
+    result_keyword: Optional[str] = None
+    # whether the values are kept, or only the number of coroutines by status is returned
+    keep_values = True
+    # specs of the items of a template, created once when it is kept as a template
+    specs: Optional[Tuple[Union["CoroutineSpec", "SpecBatch"], ...]] = None
+    # distinct keyword names of the coroutines of a template, with the result keyword
+    keyword_names: Optional[List[str]] = None
+
+    def __init__(self) -> None:
+        self._items: List[Union[RobotKeywordCoroutine, RobotKeywordCoroutines]] = []
+        self._size = 0
+        self._template: Optional[
+            Tuple[Union[RobotKeywordCoroutine, RobotKeywordCoroutines], ...]
+        ] = None
+
+    def append(self, coro: Union[RobotKeywordCoroutine, RobotKeywordCoroutines]):
+        """adds a single coroutine or a batch of coroutines"""
+        if self._template is not None:
+            raise BundleIsTemplate(
+                "Coroutines cannot be added to a bundle kept as a template"
+            )
+        self._items.append(coro)
+        self._size += len(coro) if isinstance(coro, RobotKeywordCoroutines) else 1
+
+    @property
+    def has_dependencies(self) -> bool:
+        """whether any coroutine depends on another, batches never do"""
+        return any(
+            item.depends_on for item in self if isinstance(item, RobotKeywordCoroutine)
+        )
+
+    @property
+    def is_template(self) -> bool:
+        """whether the bundle is kept as a template"""
+        return self._template is not None
+
+    def keep_as_template(self) -> None:
+        """keeps the coroutines and batches, clearing no longer removes them"""
+        self._template = tuple(self._items)
+        self._items.clear()
+
+    def clear(self):
+        """removes all the coroutines, unless the bundle is a template"""
+        if self._template is not None:
+            return
+        self._items.clear()
+        self._size = 0
+
+    def overridden(
+        self, overrides: Dict[str, Any]
+    ) -> List[Union[RobotKeywordCoroutine, RobotKeywordCoroutines]]:
+        """the coroutines and batches of the bundle,
+        the coroutines named in the overrides with their arguments overridden"""
+        names = {getattr(item, "name", None) for item in self}
+        for name in overrides:
+            if name not in names:
+                raise LookupError(f"Coroutine with name {name} was not found")
+        return [
+            item.overridden(overrides[item.name])
+            if isinstance(item, RobotKeywordCoroutine) and item.name in overrides
+            else item
+            for item in self
+        ]
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self) -> Iterator[Union[RobotKeywordCoroutine, RobotKeywordCoroutines]]:
+        """the coroutines and batches of coroutines, by the order they were added"""
+        if self._template is not None:
+            return iter(self._template)
+        return iter(self._items)
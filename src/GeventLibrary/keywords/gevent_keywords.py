@@ -1,175 +1,228 @@
 """gevent keywords"""
-from contextlib import contextmanager
 from collections import OrderedDict
-from copy import copy
-from typing import List, Optional
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from typing import OrderedDict as od
 from uuid import uuid4
 
-from gevent import joinall, spawn, pool
+from gevent import Greenlet, spawn
+from robot.api import logger
 from robot.api.deco import keyword
 from robot.libraries.BuiltIn import BuiltIn
-from robot.running.context import EXECUTION_CONTEXTS
-from robot.utils import safe_str
 
 from GeventLibrary.exceptions import (
     AliasAlreadyCreated,
     BundleHasNoCoroutines,
     NoBundleCreated,
+    NoPendingCoroutines,
+    PoolAlreadyCreated,
 )
+from GeventLibrary.patching import MonkeyPatching
+
+from .bundle import CoroutineBundle, RobotKeywordCoroutine, RobotKeywordCoroutines
+from .resources import LibraryResources
+from .settings_keywords import SettingsKeywords
+
+if TYPE_CHECKING:
+    from gevent.pool import Pool
+
+    from GeventLibrary.execution import (
+        BackgroundBundle,
+        BundleRun,
+        BundleStatistics,
+        CoroutineLogRenderer,
+        CoroutineRecords,
+        CoroutineSpec,
+        CoroutineStream,
+        RetryPolicy,
+        RunSettings,
+        SpecBatch,
+    )
+
+# the execution machinery, pools and thread pools are imported by the keywords using them,
+# importing the library only imports the keywords
+# pylint: disable=import-outside-toplevel
+
+
+def _result_reducer(
+    run_keyword: Callable, result_keyword: Optional[str], keep_values: bool
+) -> Optional[Callable[[Any], Any]]:
+    """the reducer applied to the value of every coroutine of the bundle, None if values are kept as is"""
+    if result_keyword is None and keep_values:
+        return None
+
+    def _reduce(value):
+        if result_keyword is not None:
+            value = run_keyword(result_keyword, value)
+        return value if keep_values else None
 
+    return _reduce
 
-class RobotKeywordCoroutine:
-    """Class defining a keywords for coroutine"""
-
-    def __init__(self, keyword_name, *args, **kwargs) -> None:
-        self._keyword_name = keyword_name
-        self._args = args
-        self._kwargs = kwargs
-
-    @property
-    def keyword_name(self):
-        """keyword to execute"""
-        return self._keyword_name
-
-    @property
-    def all_args(self):
-        """args and kwargs in robotframework format"""
-        return [
-            *self._args,
-            *[f"{key}={value}" for key, value in self._kwargs.items()],
-        ]
-
-
-@contextmanager
-def monkey_patch_robot_ctx():
-    """provides a context manager for safe and succinct coroutine execution context"""
-    built_in = BuiltIn()
-
-    ctx = EXECUTION_CONTEXTS.current
-    ## monkey
-    start_keyword_placer = copy(ctx.output.start_keyword)
-    end_keyword_placer = copy(ctx.output.end_keyword)
-
-    ctx.output.start_keyword = lambda kw: _start_keyword(kw, built_in)
-    ctx.output.end_keyword = lambda kw: _end_keyword(kw, built_in)
-    ## end monkey
-    try:
-        yield built_in
-    finally:
-        # unmonkey
-        ctx.output.start_keyword = start_keyword_placer
-        ctx.output.end_keyword = end_keyword_placer
-    ## end unmonkey
-
-
-def _start_keyword(keyword_item, built_in):
-    """listener for starting a keyword - drop it as HTML table"""
-    html_text = f"""
-            <style>
-                #demo table, #demo th, #demo td{{
-                    border: 1px dotted black;
-                    border-collapse: collapse;
-                    table-layout: auto;
-                }}
-            </style>
-            <table id="demo" style="width:100%">
-                <tr>
-                    <th style="width:10%">Event</th>
-                    <th style="width:10%">Keyword</th>
-                    <th style="width:10%">Args</th>
-                    <th style="width:10%">Doc</th>
-                </tr>
-                <tr>
-                    <td style="text-align:center">Started</td>
-                    <td style="text-align:center">{keyword_item.name}</td>
-                    <td style="text-align:center">{"   ".join([safe_str(a) for a in keyword_item.args])}</td>
-                    <td style="text-align:center">{keyword_item.doc}</td>
-                </tr>
-            </table>
-
-            """
-    built_in.log(html_text, html=True)
-
-
-def _end_keyword(keyword_item, built_in):
-    """listener for ending a keyword - drop it as HTML table"""
-    html_text = f"""
-            <style>
-                #demo table, #demo th, #demo td{{
-                    border: 1px dotted black;
-                    border-collapse: collapse;
-                    table-layout: auto;
-                }}
-                #statusfail{{
-                    border: 1px dotted black;
-                    color:red;
-                    bgcolor:gray;
-                    text-align:center;
-                    border-collapse: collapse;
-                    table-layout: auto;
-                    }}
-                #statuspass{{
-                    border: 1px dotted black;
-                    color:green;
-                    bgcolor:gray;
-                    text-align:center;
-                    border-collapse: collapse;
-                    table-layout: auto;
-                    }}
-            </style>
-            <table id="demo" style="width:100%">
-                <tr>
-                    <th style="width:10%">Event</th>
-                    <th style="width:10%">Keyword</th>
-                    <th style="width:10%">Args</th>
-                    <th style="width:10%">Doc</th>
-                    <th style="width:10%">Status</th>
-                </tr>
-                <tr>
-                    <td style="text-align:center">Completed</td>
-                    <td style="text-align:center">{keyword_item.name}</td>
-                    <td style="text-align:center">{"   ".join([safe_str(a) for a in keyword_item.args])}</td>
-                    <td style="text-align:center">{keyword_item.doc}</td>
-                    <td id="status{keyword_item.result.status.lower()}">{keyword_item.result.status}</td>
-                </tr>
-            </table>
-
-            """
-    built_in.log(html_text, html=True)
-
-
-class GeventKeywords:
+
+def _check_no_dependencies(coros: CoroutineBundle) -> None:
+    """coroutines are ordered by their dependencies only by `Run Coroutines`"""
+    if coros.has_dependencies:
+        raise ValueError(
+            "Dependencies between coroutines are supported only by `Run Coroutines`"
+        )
+
+
+class GeventKeywords(SettingsKeywords):
     """class defining gevent keywords"""
 
     ROBOT_LIBRARY_SCOPE = "GLOBAL"
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        pools: Optional[Dict[str, int]] = None,
+        *,
+        blocking_threshold: float = 0,
+        threadpool_size: int = 10,
+        patching: Optional[MonkeyPatching] = None,
+        http_connections_per_host: int = 10,
+    ) -> None:
         self._active_gevent_bundles: od[
-            str, List[RobotKeywordCoroutine]
+            str, CoroutineBundle
         ] = OrderedDict()
+        self._streams: Dict[str, "CoroutineStream"] = {}
+        self._pools: Dict[str, "Pool"] = {}
+        self._statistics: Dict[str, "BundleStatistics"] = {}
+        self._background: Dict[str, "BackgroundBundle"] = {}
+        for name, size in (pools or {}).items():
+            self.create_gevent_pool(name, size)
+        self._resources = LibraryResources(
+            threadpool_size, http_connections_per_host, blocking_threshold
+        )
+        self._patching = patching
 
     @keyword
-    def create_gevent_bundle(self, alias: str = None):
+    def create_gevent_bundle(
+        self, alias: str = None, result_keyword: str = None, keep_values: bool = True
+    ):
         """this methods creates a bundle for coroutines to run,
         once the bundle is created you can attach keywords to it
         these keywords will be executed asynchronously when `Run Coroutines` is called
+
+        Large values (responses, file contents) of massive bundles can be reduced
+        as soon as each coroutine completes with ``result_keyword``, or dropped with ``keep_values``,
+        so the memory used by the bundle stays flat.
         Examples:
 
         |     Create Gevent Bundle
         |     Create Gevent Bundle    alias=alias1
+        |     Create Gevent Bundle    alias=alias1    result_keyword=Get Status Code
+        |     Create Gevent Bundle    alias=alias1    keep_values=False
 
         Args:
 
             ``alias`` <str, optional> Name of alias. Defaults to None.
 
+            ``result_keyword`` <str, optional> Keyword called with the value of every coroutine inside
+                                its greenlet, its return value replaces the value. Defaults to None.
+
+            ``keep_values`` <bool, optional> Whether the values are kept, otherwise `Run Coroutines`
+                                and `Wait For Coroutines` return the number of coroutines by status
+                                and `Get Next Result` returns None. Defaults to True.
+
         """
         alias = alias or str(uuid4())
         if alias in self._active_gevent_bundles:
             raise AliasAlreadyCreated(
                 f"An alias with name {alias} has already been created."
             )
-        self._active_gevent_bundles[alias] = []
+        bundle = self._active_gevent_bundles[alias] = CoroutineBundle()
+        bundle.result_keyword = result_keyword
+        bundle.keep_values = keep_values
+
+    @keyword
+    def freeze_gevent_bundle(self, alias: str = None):
+        """Keeps the coroutines of a bundle as a template, so the bundle can be run repeatedly
+        without adding its coroutines again.
+        If no bundle alias is given, the last created bundle will be used by default
+
+        Runs no longer remove the coroutines of a frozen bundle, the coroutines, the batches added
+        by `Add Coroutines` and their keywords are prepared once, for all the runs,
+        and no coroutines can be added to it anymore. A bundle without coroutines cannot be frozen.
+        Arguments of named coroutines can be changed for a single run
+        by the ``overrides`` of `Run Coroutines`. `Clear Bundle` removes the bundle as usual.
+        Examples:
+
+        |     Add Coroutine    Login    user1    coroutine_name=login
+        |     Add Coroutine    Get Orders
+        |     Freeze Gevent Bundle
+        |     FOR    ${user}    IN    @{users}
+        |         ${values}    Run Coroutines    overrides=${{ {"login": [$user]} }}
+        |     END
+
+        Args:
+
+            ``alias``               <str, optional> Name of alias. Defaults to None.
+        """
+        from GeventLibrary.execution import common_specs, keyword_names
+
+        coros = self[alias]
+        if len(coros) == 0:
+            raise BundleHasNoCoroutines(
+                "The given bundle has no coroutines, add them before freezing the bundle"
+            )
+        coros.keep_as_template()
+        reducer = _result_reducer(
+            BuiltIn().run_keyword, coros.result_keyword, coros.keep_values
+        )
+        coros.specs = tuple(self._create_specs(coros, reducer))
+        coros.keyword_names = keyword_names(
+            common_specs(coros.specs), coros.result_keyword
+        )
+
+    @keyword
+    def create_gevent_pool(self, name: str, size: int):
+        """Creates a named gevent pool that lives until it is removed,
+        bundles run with ``pool_name`` share its concurrency limit,
+        so the pool caps the concurrency across bundles and tests.
+        Pools can also be created when importing the library with the ``pools`` argument.
+
+        Examples:
+
+        |     Create Gevent Pool    backend    10
+        |     ${settings}    Create Run Settings    pool_name=backend
+        |     ${values}    Run Coroutines    alias=alias1    settings=${settings}
+
+        Args:
+
+            ``name``                <str> Name of the pool
+
+            ``size``                <int> Maximal number of coroutines running in the pool at once
+        """
+        if size <= 0:
+            raise ValueError(f"'size' must be a positive value, got {size}")
+        if name in self._pools:
+            raise PoolAlreadyCreated(f"A pool with name {name} has already been created.")
+        from gevent.pool import Pool
+
+        self._pools[name] = Pool(size)
+
+    @keyword
+    def remove_gevent_pool(self, name: str):
+        """Removes a named gevent pool, coroutines still running in it are killed
+
+        Args:
+
+            ``name``                <str> Name of the pool
+        """
+        try:
+            self._pools.pop(name).kill()
+        except KeyError as ex:
+            raise LookupError(f"Pool with name {name} was not found") from ex
 
     @keyword
     def add_coroutine(
@@ -177,15 +230,31 @@ class GeventKeywords:
         keyword_name: str,
         *args,
         alias: str = None,
+        retry_policy: Optional["RetryPolicy"] = None,
+        coroutine_name: str = None,
+        depends_on: Union[str, List[str], None] = None,
+        blocking: bool = False,
         **kwargs,
     ):
         """Adding a new keyword to be a coroutine of the bundle,
         If no bundle alias is given, the last created bundle will be used by default
+
+        A coroutine given ``depends_on`` is started by `Run Coroutines` only once
+        the coroutines it depends on completed, their values are appended to its positional arguments
+        by the order they are listed. It is not started if one of them failed.
+
+        A ``blocking`` coroutine runs the python code of its library keywords on a native thread
+        of the library's thread pool, for keywords that block without yielding to the gevent hub
+        (SSHLibrary, SeleniumLibrary and other libraries using threads, subprocesses or C extensions).
+        The other coroutines of the bundle keep running meanwhile.
         Examples:
 
         |       Add Coroutine    Sleep    1s
         |       Add Coroutine    Sleep    1s    alias=alias1
         |       Add Coroutine    Convert To Lower Case    UPPER
+        |       Add Coroutine    Get Token    coroutine_name=login
+        |       Add Coroutine    Get Orders    depends_on=login
+        |       Add Coroutine    Execute Command    uptime    blocking=True
         Args:
 
             ``keyword_name``            <str> Explicit robotframework keyword name
@@ -194,13 +263,163 @@ class GeventKeywords:
 
             ``alias``                   <str, optional> Name of alias. Defaults to None.
 
+            ``retry_policy``            <RetryPolicy, optional> Policy created by `Create Retry Policy`,
+                                        overrides the policy of `Create Run Settings`. Defaults to None.
+
+            ``coroutine_name``          <str, optional> Name other coroutines of the bundle depend on,
+                                        unique within the bundle. Defaults to None.
+
+            ``depends_on``              <str or list, optional> Names of the coroutines this one depends on,
+                                        a list or a comma separated string. Defaults to None.
+
+            ``blocking``                <bool, optional> Run the library keywords of the coroutine
+                                        on the thread pool. Defaults to False.
+
             ``**kwargs``                <kwargs> all keyword arguments of the keywords
         """
-        self[alias].append(RobotKeywordCoroutine(keyword_name, *args, **kwargs))
+        coro = RobotKeywordCoroutine(keyword_name, *args, **kwargs)
+        coro.retry_policy = retry_policy
+        coro.name = coroutine_name
+        coro.blocking = blocking
+        if depends_on:
+            if isinstance(depends_on, str):
+                depends_on = [name.strip() for name in depends_on.split(",")]
+            coro.depends_on = tuple(depends_on)
+        self[alias].append(coro)
+
+    @keyword
+    def add_coroutines(
+        self,
+        keyword_name: str,
+        *args,
+        count: Optional[int] = None,
+        arg_sets: Optional[list] = None,
+        alias: str = None,
+        retry_policy: Optional["RetryPolicy"] = None,
+        blocking: bool = False,
+        **kwargs,
+    ):
+        """Adding many coroutines of the same keyword to the bundle at once,
+        either ``count`` identical coroutines or a coroutine per item of ``arg_sets``.
+        The keyword is stored once for the whole batch, instead of calling `Add Coroutine` in a loop.
+
+        An item of ``arg_sets`` can be a list of positional arguments,
+        a dictionary of named arguments or a single argument,
+        ``*args`` and ``**kwargs`` are common to all the coroutines of the batch.
+        Examples:
+
+        |       Add Coroutines    GET    https://example.com    count=5000
+        |       Add Coroutines    GET    arg_sets=${urls}    expected_status=200    alias=alias1
+        |       Add Coroutines    Sleep    arg_sets=${{ ['1s', '2s', '3s'] }}
+        Args:
+
+            ``keyword_name``            <str> Explicit robotframework keyword name
+
+            ``*args``                   <args> positional arguments common to all the coroutines
+
+            ``count``                   <int, optional> Number of identical coroutines to add
+
+            ``arg_sets``                <list, optional> Arguments of each coroutine to add
+
+            ``alias``                   <str, optional> Name of alias. Defaults to None.
+
+            ``retry_policy``            <RetryPolicy, optional> Policy created by `Create Retry Policy`
+                                        for all the coroutines of the batch. Defaults to None.
+
+            ``blocking``                <bool, optional> Run the library keywords of the coroutines
+                                        on the thread pool, see `Add Coroutine`. Defaults to False.
+
+            ``**kwargs``                <kwargs> keyword arguments common to all the coroutines
+        """
+        if (count is None) == (arg_sets is None):
+            raise ValueError("Exactly one of 'count' and 'arg_sets' must be given")
+        if count is not None:
+            if count < 0:
+                raise ValueError(f"'count' must be a non negative value, got {count}")
+            arg_sets = count
+        batch = RobotKeywordCoroutines(keyword_name, arg_sets, *args, **kwargs)
+        batch.retry_policy = retry_policy
+        batch.blocking = blocking
+        self[alias].append(batch)
+
+    @keyword
+    def add_http_coroutine(
+        self,
+        method: str,
+        url: str,
+        *,
+        alias: str = None,
+        body: Union[str, bytes, None] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        expected_status: Union[int, str, None] = None,
+        retry_policy: Optional["RetryPolicy"] = None,
+        coroutine_name: str = None,
+    ):
+        """Adding an HTTP request to be a coroutine of the bundle,
+        If no bundle alias is given, the last created bundle will be used by default
+
+        The request is sent by the library itself instead of a keyword, over keep-alive connections
+        shared by all the HTTP coroutines, at most ``http_connections_per_host`` (a library argument)
+        requests to the same host run at once. It is not logged as a keyword.
+        Its value is a response with ``status_code``, ``reason``, ``headers``, ``content``,
+        ``text``, ``elapsed`` (seconds) and a ``json()`` method.
+        The ``headers`` are a dictionary, the values of a header sent more than once
+        are joined with commas. A request failing on a kept connection, which the server may have
+        closed meanwhile, is sent again on another connection only for the idempotent methods
+        (GET, HEAD, OPTIONS, TRACE, PUT and DELETE).
+        Examples:
+
+        |       Add HTTP Coroutine    GET    http://localhost:8080/posts/1
+        |       Add HTTP Coroutine    POST    http://localhost:8080/posts    json=${post}    expected_status=201
+        |       ${responses}    Run Coroutines
+        |       Should Be Equal As Integers    ${responses[0].status_code}    200
+        Args:
+
+            ``method``                  <str> HTTP method of the request
+
+            ``url``                     <str> http or https url of the request
+
+            ``alias``                   <str, optional> Name of alias. Defaults to None.
+
+            ``body``                    <str or bytes, optional> Body of the request. Defaults to None.
+
+            ``json``                    <any, optional> Body of the request, sent as json. Defaults to None.
+
+            ``headers``                 <dict, optional> Headers of the request. Defaults to None.
+
+            ``expected_status``         <int or str, optional> The expected status, ``any`` for any status.
+                                        Defaults to None, failing on statuses 400 and above.
+
+            ``retry_policy``            <RetryPolicy, optional> Policy created by `Create Retry Policy`,
+                                        overrides the policy of `Create Run Settings`. Defaults to None.
+
+            ``coroutine_name``          <str, optional> Name other coroutines of the bundle depend on,
+                                        unique within the bundle. Defaults to None.
+
+        The arguments after ``url`` are given as named arguments only.
+        """
+        coro = RobotKeywordCoroutine(method.upper(), url)
+        coro.function = partial(
+            self._resources.http_pool().request,
+            body=body,
+            json=json,
+            headers=headers,
+            expected_status=expected_status,
+        )
+        coro.retry_policy = retry_policy
+        coro.name = coroutine_name
+        self[alias].append(coro)
 
     @keyword
     def run_coroutines(
-        self, alias: str = None, timeout: int = 200, gevent_pool_size: int = 0
+        self,
+        alias: str = None,
+        timeout: int = 200,
+        gevent_pool_size: int = 0,
+        *,
+        settings: Optional["RunSettings"] = None,
+        overrides: Optional[Dict[str, Any]] = None,
     ) -> List:
         """Runs all the coroutines asynchronously.
 
@@ -209,48 +428,295 @@ class GeventKeywords:
             ``alias``               <str, optional> Name of alias. Defaults to None.
 
             ``timeout``             <int, optional> Coroutines execution timeout in seconds. Defaults to 200.
+                                    Coroutines that did not complete in time are killed
+                                    and reported by a `CoroutinesTimedOut` error.
 
             ``gevent_pool_size``    <int> Size of gevent pool, 0 for using spawn without pooling. Defaults to 0.
 
+            ``settings``            <RunSettings, optional> Settings created by `Create Run Settings`:
+                                    logging, pools, fail fast, backends, pacing, retries,
+                                    adaptive concurrency and progress reports. Defaults to None.
+
+            ``overrides``           <dict, optional> Arguments of named coroutines for this run only,
+                                    by ``coroutine_name``: a list replaces the positional arguments,
+                                    a dict updates the named arguments. Mostly useful with bundles
+                                    kept by `Freeze Gevent Bundle`. Defaults to None.
+
+        ``settings`` and ``overrides`` are given as named arguments only.
 
             |    ${values}    Run Coroutines    alias=alias1
+            |    ${settings}    Create Run Settings    fail_fast=True
+            |    ${values}    Run Coroutines    alias=alias1    settings=${settings}
+            |    ${values}    Run Coroutines    alias=alias1    overrides=${{ {"login": ["user2"]} }}
 
         Returns:
 
-            ``list`` <List[Any]>   all returned values from coroutines by order
+            ``list`` <List[Any]>   all returned values from coroutines by order,
+            ``dict`` <Dict[str, int]> number of coroutines by status when the bundle does not keep values
         """
-        if gevent_pool_size < 0:
-            raise ValueError(
-                f"'gevent_pool_size' must be a non negative value, got {gevent_pool_size}"
-            )
-        coros = self[alias]
-        if len(coros) == 0:
-            raise BundleHasNoCoroutines(
-                "The given bundle has no coroutines, please use `Add Coroutine` keyword"
-            )
-        with monkey_patch_robot_ctx() as built_in:
-            spawn_callable = spawn
-            if gevent_pool_size > 0:
-                spawn_callable = pool.Pool(gevent_pool_size).spawn
-            jobs = [
-                spawn_callable(
-                    built_in.run_keyword,
-                    coro.keyword_name,
-                    *coro.all_args,
+        from GeventLibrary.execution import RunSettings
+
+        settings = settings or RunSettings()
+        backend = settings.worker_backend()
+        renderer, spawn_callable = self._prepare_run(gevent_pool_size, settings)
+        alias = self._resolve_alias(alias)
+        coros = self._get_coroutines_to_run(alias)
+        built_in = BuiltIn()
+        run = self._create_run(alias, coros, settings, built_in, overrides=overrides)
+        if backend is None:
+            try:
+                values = run.on_hub(
+                    spawn_callable, renderer, built_in.run_keyword, timeout
                 )
-                for coro in coros
-            ]
+            finally:
+                self._report_blocking()
+        else:
+            run.check_backend(settings.backend)
+            values = run.in_processes(backend, timeout)
+        coros.clear()
+        return values if coros.keep_values else self._statistics[alias].statuses
 
-            greenlets = joinall(jobs, timeout=timeout)
+    @keyword
+    def run_coroutines_as_completed(
+        self,
+        alias: str = None,
+        callback: str = None,
+        timeout: int = 200,
+        gevent_pool_size: int = 0,
+        *,
+        settings: Optional["RunSettings"] = None,
+    ) -> int:
+        """Starts all the coroutines asynchronously, values are handed back in completion order.
+
+        Without ``callback`` the keyword returns immediately,
+        use `Get Next Result` to wait for the value of the next coroutine to complete.
+        With ``callback`` the keyword waits for all the coroutines,
+        the callback keyword is called with each value as soon as its coroutine completes.
+
+        Either way a value is released as soon as it was handed back,
+        so large bundles do not hold all of their values in memory.
+
+        Args:
 
-        # check for exceptions...
-        for greenlet in greenlets:
-            if greenlet.exception:
-                raise greenlet.exception
+            ``alias``               <str, optional> Name of alias. Defaults to None.
+
+            ``callback``            <str, optional> Keyword called with every value. Defaults to None.
 
+            ``timeout``             <int, optional> Seconds to wait for each value in callback mode. Defaults to 200.
+
+            ``gevent_pool_size``    <int> Size of gevent pool, 0 for using spawn without pooling. Defaults to 0.
+
+            ``settings``            <RunSettings, optional> Settings created by `Create Run Settings`,
+                                    given as a named argument only. Defaults to None.
+
+
+            |    ${count}    Run Coroutines As Completed    alias=alias1
+            |    FOR    ${i}    IN RANGE    ${count}
+            |        ${value}    Get Next Result    alias=alias1
+            |    END
+            |
+            |    Run Coroutines As Completed    alias=alias1    callback=Status Should Be OK
+
+        Returns:
+
+            ``int``   number of coroutines started
+        """
+        from GeventLibrary.execution import RunSettings
+
+        settings = settings or RunSettings()
+        settings.check_started_only("Run Coroutines As Completed")
+        renderer, spawn_callable = self._prepare_run(gevent_pool_size, settings)
+        alias = self._resolve_alias(alias)
+        coros = self._get_coroutines_to_run(alias)
+        _check_no_dependencies(coros)
+        self._close_stream(alias)
+        built_in = BuiltIn()
+        run = self._create_run(alias, coros, settings, built_in)
+        stream = self._streams[alias] = run.streamed(
+            spawn_callable, renderer, built_in.run_keyword
+        )
+        count = len(coros)
         coros.clear()
+        if callback:
+            try:
+                while stream.pending:
+                    built_in.run_keyword(callback, stream.next(timeout))
+            finally:
+                self._close_stream(alias)
+                self._report_blocking()
+        return count
+
+    @keyword
+    def get_next_result(self, alias: str = None, timeout: int = 200):
+        """Waits for the next coroutine started by `Run Coroutines As Completed` to complete
+        and returns its value, the exception of a failed coroutine is raised.
+
+        Args:
+
+            ``alias``               <str, optional> Name of alias. Defaults to None.
+
+            ``timeout``             <int, optional> Seconds to wait for the next value. Defaults to 200.
+
+
+            |    ${value}    Get Next Result    alias=alias1
+
+        Returns:
+
+            the value of the next completed coroutine
+        """
+        alias = self._resolve_alias(alias)
+        if alias not in self._streams:
+            raise NoPendingCoroutines(
+                "No coroutines are running, please use `Run Coroutines As Completed` keyword"
+            )
+        stream = self._streams[alias]
+        try:
+            return stream.next(timeout)
+        finally:
+            if stream.pending == 0:
+                self._streams.pop(alias, None)
+            self._report_blocking()
+
+    @keyword
+    def start_coroutines(
+        self,
+        alias: str = None,
+        gevent_pool_size: int = 0,
+        *,
+        settings: Optional["RunSettings"] = None,
+    ) -> "BackgroundBundle":
+        """Starts all the coroutines in the background and returns a handle to them right away.
+
+        The test goes on with its next keywords while the coroutines run,
+        every time a keyword of the test ends the coroutines are given time to progress.
+        Use `Wait For Coroutines` to collect the values, or `Cancel Coroutines` to stop them.
+        The coroutines are logged under the keyword waiting for or cancelling them.
+
+        Args:
+
+            ``alias``               <str, optional> Name of alias. Defaults to None.
+
+            ``gevent_pool_size``    <int> Size of gevent pool, 0 for using spawn without pooling. Defaults to 0.
+
+            ``settings``            <RunSettings, optional> Settings created by `Create Run Settings`,
+                                    given as a named argument only. Defaults to None.
+
+
+            |    ${handle}    Start Coroutines    alias=polling
+            |    Do Something Else
+            |    ${values}    Wait For Coroutines    ${handle}    timeout=60
+
+        Returns:
+
+            ``BackgroundBundle``   handle of the running coroutines
+        """
+        from GeventLibrary.execution import RunSettings
+
+        settings = settings or RunSettings()
+        settings.check_started_only("Start Coroutines")
+        renderer, spawn_callable = self._prepare_run(gevent_pool_size, settings)
+        alias = self._resolve_alias(alias)
+        coros = self._get_coroutines_to_run(alias)
+        _check_no_dependencies(coros)
+        self._cancel_background(alias)
+        built_in = BuiltIn()
+        run = self._create_run(alias, coros, settings, built_in)
+        handle = self._background[alias] = run.in_background(
+            alias, spawn_callable, renderer, built_in.run_keyword
+        )
+        handle.keep_values = coros.keep_values
+        coros.clear()
+        return handle
+
+    @keyword
+    def wait_for_coroutines(
+        self, handle: "BackgroundBundle", timeout: int = 200
+    ) -> Union[List, Dict[str, int]]:
+        """Waits for the coroutines started by `Start Coroutines` and returns their values.
+
+        Coroutines that did not complete in time are killed and reported by a `CoroutinesTimedOut` error,
+        the exception of a failed coroutine is raised as is.
+
+        Args:
+
+            ``handle``              <BackgroundBundle> Handle returned by `Start Coroutines`.
+
+            ``timeout``             <int, optional> Seconds to wait for the coroutines. Defaults to 200.
+
+
+            |    ${values}    Wait For Coroutines    ${handle}
+
+        Returns:
+
+            ``list`` <List[Any]>   all returned values from coroutines by order,
+            ``dict`` <Dict[str, int]> number of coroutines by status when the bundle does not keep values
+        """
+        try:
+            return handle.wait(timeout)
+        finally:
+            self._forget_background(handle)
+            self._report_blocking()
+
+    @keyword
+    def cancel_coroutines(self, handle: "BackgroundBundle") -> int:
+        """Kills the coroutines started by `Start Coroutines` that did not complete yet.
+        Coroutines still running once the ``kill_grace_period`` of the run (see `Create Run Settings`)
+        is over are reported as a warning.
+
+        Args:
+
+            ``handle``              <BackgroundBundle> Handle returned by `Start Coroutines`.
+
+
+            |    Cancel Coroutines    ${handle}
+
+        Returns:
+
+            ``int``   number of coroutines killed or never started
+        """
+        try:
+            return handle.cancel()
+        finally:
+            self._forget_background(handle)
+            self._report_blocking()
+
+    @keyword
+    def get_bundle_statistics(self, alias: str = None) -> Dict[str, Any]:
+        """Returns timing statistics of the last run of a bundle,
+        calling it while the bundle is running returns the statistics so far.
+
+        The returned dictionary contains:
+        ``count``, ``completed``, ``statuses`` (count per PASS, FAIL, KILLED, NOT RUN),
+        ``wall_time``, ``throughput`` (completed coroutines per second),
+        ``min``, ``mean``, ``max``, ``p50``, ``p95``, ``p99`` of the coroutines durations,
+        ``mean_queue_wait`` (time waiting for a pool slot), ``max_concurrency``
+        and ``blocked`` (coroutines that blocked the gevent hub, see the library's ``blocking_threshold``).
+        All times are in seconds.
 
-        return [job.value for job in jobs]
+        |    ${stats}    Get Bundle Statistics    alias=alias1
+        |    Should Be True    ${stats}[p95] < 0.5
+
+        Args:
+
+            ``alias``               <str, optional> Name of alias. Defaults to None.
+        """
+        return self._get_statistics(alias).summary()
+
+    @keyword
+    def save_bundle_statistics(self, path: str, alias: str = None):
+        """Saves timing statistics of the last run of a bundle,
+        a ``.json`` file contains the summary and a row per coroutine,
+        a ``.csv`` file contains a row per coroutine.
+
+        |    Save Bundle Statistics    ${OUTPUT_DIR}/bundle-stats.json    alias=alias1
+
+        Args:
+
+            ``path``                <str> Path of the .json or .csv file
+
+            ``alias``               <str, optional> Name of alias. Defaults to None.
+        """
+        self._get_statistics(alias).save(path)
 
     @keyword
     def clear_bundle(self, alias: str = None):
@@ -263,6 +729,9 @@ class GeventKeywords:
         try:
             alias = alias or list(self._active_gevent_bundles.items())[-1][0]
             self._active_gevent_bundles.pop(alias).clear()
+            self._close_stream(alias)
+            self._cancel_background(alias)
+            self._statistics.pop(alias, None)
         except KeyError as ex:
             raise LookupError(f"Bundle with alias {alias} was not found") from ex
 
@@ -272,11 +741,203 @@ class GeventKeywords:
         removes all coroutines bundles from the list
         """
         self._active_gevent_bundles.clear()
+        for alias in list(self._streams):
+            self._close_stream(alias)
+        for alias in list(self._background):
+            self._cancel_background(alias)
+        self._statistics.clear()
+
+    def _resolve_alias(self, alias: Optional[str] = None) -> str:
+        self[alias]  # pylint: disable=pointless-statement
+        return alias or next(reversed(self._active_gevent_bundles))
+
+    def _get_spawn_callable(
+        self, gevent_pool_size: int, pool_name: Optional[str]
+    ) -> Callable[..., Greenlet]:
+        from GeventLibrary.execution import queued_on_submit
+
+        if gevent_pool_size < 0:
+            raise ValueError(
+                f"'gevent_pool_size' must be a non negative value, got {gevent_pool_size}"
+            )
+        if pool_name:
+            if gevent_pool_size > 0:
+                raise ValueError(
+                    "'gevent_pool_size' and 'pool_name' cannot be used together"
+                )
+            if pool_name not in self._pools:
+                raise LookupError(f"Pool with name {pool_name} was not found")
+            return queued_on_submit(self._pools[pool_name].spawn)
+        if gevent_pool_size > 0:
+            from gevent.pool import Pool
+
+            return queued_on_submit(Pool(gevent_pool_size).spawn)
+        return queued_on_submit(spawn)
+
+    def _get_coroutines_to_run(
+        self, alias: Optional[str]
+    ) -> CoroutineBundle:
+        coros = self[alias]
+        if len(coros) == 0:
+            raise BundleHasNoCoroutines(
+                "The given bundle has no coroutines, please use `Add Coroutine` keyword"
+            )
+        if self._patching:
+            self._patching.patch_by("run")
+        return coros
+
+    def _prepare_run(
+        self, gevent_pool_size: int, settings: "RunSettings"
+    ) -> Tuple["CoroutineLogRenderer", Callable[..., Greenlet]]:
+        """the renderer and the spawn callable of a run, both checked before the bundle is touched"""
+        from GeventLibrary.execution import CoroutineLogRenderer
+
+        return CoroutineLogRenderer(settings.log_level), self._get_spawn_callable(
+            gevent_pool_size, settings.pool_name
+        )
+
+    def _create_run(
+        self,
+        alias: str,
+        coros: CoroutineBundle,
+        settings: "RunSettings",
+        built_in: BuiltIn,
+        *,
+        overrides: Optional[Dict[str, Any]] = None,
+    ) -> "BundleRun":
+        """the run of the coroutines of the bundle, its statistics are kept by alias"""
+        from GeventLibrary.execution import (
+            BundleRun,
+            BundleStatistics,
+            FailFast,
+            SpawnScheduler,
+        )
+
+        records = self._create_records(coros, settings.retry_policy, built_in, overrides)
+        run = BundleRun(
+            records,
+            SpawnScheduler(len(coros), settings.rate, settings.ramp_up, settings.jitter),
+        )
+        run.guard = FailFast() if settings.fail_fast else None
+        if settings.adaptive_concurrency:
+            run.limiter = settings.adaptive_concurrency.limiter()
+        if settings.progress:
+            run.reporter = settings.progress.reporter(alias, len(records))
+        run.result_keyword = coros.result_keyword
+        run.kill_grace_period = settings.kill_grace_period
+        run.template_keyword_names = coros.keyword_names
+        run.monitor = self._resources.monitor
+        self._statistics[alias] = BundleStatistics(
+            records, run.limiter.history if run.limiter else None
+        )
+        return run
+
+    def _create_spec(
+        self,
+        item: Union[RobotKeywordCoroutine, RobotKeywordCoroutines],
+        reducer: Optional[Callable[[Any], Any]],
+    ) -> Union["CoroutineSpec", "SpecBatch"]:
+        """the spec of a coroutine, or the spec batch of a batch of coroutines"""
+        from GeventLibrary.execution import CoroutineSpec, SpecBatch
+
+        threadpool = self._resources.threadpool() if item.blocking else None
+        if isinstance(item, RobotKeywordCoroutines):
+            common = item.common
+            return SpecBatch(
+                CoroutineSpec(
+                    item.keyword_name,
+                    common.all_args,
+                    item.retry_policy,
+                    reducer,
+                    threadpool,
+                    named=common.named_count,
+                ),
+                len(item),
+                None if item.identical else item.arguments,
+            )
+        return CoroutineSpec(
+            item.keyword_name,
+            item.all_args,
+            item.retry_policy,
+            reducer,
+            threadpool,
+            item.function,
+            item.name,
+            item.depends_on,
+            item.named_count,
+        )
+
+    def _create_specs(
+        self,
+        items: Iterable[Union[RobotKeywordCoroutine, RobotKeywordCoroutines]],
+        reducer: Optional[Callable[[Any], Any]],
+    ) -> List[Union["CoroutineSpec", "SpecBatch"]]:
+        """the specs of the coroutines and batches, in bundle order"""
+        return [self._create_spec(item, reducer) for item in items]
+
+    def _create_records(
+        self,
+        coros: CoroutineBundle,
+        retry_policy: Optional["RetryPolicy"],
+        built_in: BuiltIn,
+        overrides: Optional[Dict[str, Any]] = None,
+    ) -> "CoroutineRecords":
+        """the records of a run, a template reuses the specs created when it was frozen,
+        only its overridden coroutines get new specs.
+        The records are created as the coroutines are pulled, batches are never expanded upfront"""
+        from GeventLibrary.execution import CoroutineRecords, with_retry_policy
+
+        reducer = _result_reducer(
+            built_in.run_keyword, coros.result_keyword, coros.keep_values
+        )
+        specs = coros.specs or self._create_specs(coros, reducer)
+        if overrides:
+            specs = [
+                self._create_spec(item, reducer)
+                if isinstance(item, RobotKeywordCoroutine) and item.name in overrides
+                else spec
+                for spec, item in zip(specs, coros.overridden(overrides))
+            ]
+        if retry_policy:
+            specs = [with_retry_policy(spec, retry_policy) for spec in specs]
+        return CoroutineRecords(specs)
+
+    def _get_statistics(self, alias: Optional[str]) -> "BundleStatistics":
+        alias = self._resolve_alias(alias)
+        if alias not in self._statistics:
+            raise LookupError(f"Bundle with alias {alias} was not run yet")
+        return self._statistics[alias]
+
+    def _close_stream(self, alias: str) -> None:
+        stream = self._streams.pop(alias, None)
+        if stream is not None:
+            stream.close()
+
+    def _cancel_background(self, alias: str) -> None:
+        handle = self._background.pop(alias, None)
+        if handle is not None and not handle.finished:
+            handle.cancel()
+
+    def _report_blocking(self) -> None:
+        monitor = self._resources.monitor
+        if monitor is None:
+            return
+        for block in monitor.take():
+            logger.warn(
+                f"Coroutine {block.keyword_name}    "
+                f"{'    '.join(str(arg) for arg in block.args)} "
+                f"blocked the gevent hub for at least {block.blocked:.3f} seconds, "
+                f"all the other coroutines were waiting:\n{block.stack}"
+            )
+
+    def _forget_background(self, handle: "BackgroundBundle") -> None:
+        if self._background.get(handle.alias) is handle:
+            del self._background[handle.alias]
 
     def __len__(self):
         return len(self._active_gevent_bundles)
 
-    def __getitem__(self, alias: Optional[str] = None) -> List[RobotKeywordCoroutine]:
+    def __getitem__(self, alias: Optional[str] = None) -> CoroutineBundle:
         if len(self._active_gevent_bundles) == 0:
             raise NoBundleCreated(
                 "Please create a bundle with `Create Gevent Bundle` keyword"
@@ -0,0 +1,68 @@
+"""resources shared by all the bundles of the library"""
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from gevent.threadpool import ThreadPool
+
+    from GeventLibrary.execution import BlockingMonitor, HttpConnectionPool
+
+# the pools and the monitor are imported by the bundles using them
+# pylint: disable=import-outside-toplevel
+
+
+class LibraryResources:
+    """The thread pool of the blocking coroutines, the connections of the HTTP coroutines
+    and the monitor of the coroutines blocking the gevent hub, shared by all the bundles.
+    The pools are created on first use, `close` releases all of them.
+    The monitor watches the hub only while bundles run, every run starts and stops it."""
+
+    def __init__(
+        self,
+        threadpool_size: int = 10,
+        http_connections_per_host: int = 10,
+        blocking_threshold: float = 0,
+    ) -> None:
+        if threadpool_size <= 0:
+            raise ValueError(
+                f"'threadpool_size' must be a positive value, got {threadpool_size}"
+            )
+        if http_connections_per_host <= 0:
+            raise ValueError(
+                "'http_connections_per_host' must be a positive value, "
+                f"got {http_connections_per_host}"
+            )
+        self._threadpool_size = threadpool_size
+        self._http_connections_per_host = http_connections_per_host
+        self._threadpool: Optional["ThreadPool"] = None
+        self._http_pool: Optional["HttpConnectionPool"] = None
+        # reports the coroutines blocking the hub, None when they are not monitored
+        self.monitor: Optional["BlockingMonitor"] = None
+        if blocking_threshold:
+            from GeventLibrary.execution import BlockingMonitor
+
+            self.monitor = BlockingMonitor(blocking_threshold)
+
+    def threadpool(self) -> "ThreadPool":
+        """the native threads running the library keywords of blocking coroutines"""
+        if self._threadpool is None:
+            from gevent.threadpool import ThreadPool
+
+            self._threadpool = ThreadPool(self._threadpool_size)
+        return self._threadpool
+
+    def http_pool(self) -> "HttpConnectionPool":
+        """the keep-alive connections of the HTTP coroutines"""
+        if self._http_pool is None:
+            from GeventLibrary.execution import HttpConnectionPool
+
+            self._http_pool = HttpConnectionPool(self._http_connections_per_host)
+        return self._http_pool
+
+    def close(self) -> None:
+        """closes the pools, they are created again on next use"""
+        if self._http_pool is not None:
+            self._http_pool.close()
+            self._http_pool = None
+        if self._threadpool is not None:
+            self._threadpool.kill()
+            self._threadpool = None
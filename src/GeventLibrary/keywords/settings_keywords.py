@@ -0,0 +1,260 @@
+"""keywords creating the settings of the bundle runs"""
+from typing import TYPE_CHECKING, Any, List, Optional, Union
+
+from robot.api.deco import keyword
+
+if TYPE_CHECKING:
+    from GeventLibrary.execution import (
+        AdaptiveConcurrency,
+        ProgressReporting,
+        RetryPolicy,
+        RunSettings,
+    )
+
+# the settings are imported by the keywords creating them
+# pylint: disable=import-outside-toplevel
+
+
+class SettingsKeywords:
+    """class defining the keywords creating the settings of the bundle runs"""
+
+    @keyword
+    def create_run_settings(
+        self,
+        *,
+        log_level: str = "NESTED",
+        pool_name: Optional[str] = None,
+        fail_fast: bool = False,
+        backend: str = "gevent",
+        process_workers: int = 0,
+        remote_workers: Union[str, List[str], None] = None,
+        rate: float = 0,
+        ramp_up: float = 0,
+        jitter: float = 0,
+        retry_policy: Optional["RetryPolicy"] = None,
+        adaptive_concurrency: Optional["AdaptiveConcurrency"] = None,
+        progress: Optional["ProgressReporting"] = None,
+        kill_grace_period: float = 5,
+    ) -> "RunSettings":
+        """Creates the settings of bundle runs, given as ``settings`` to `Run Coroutines`,
+        `Run Coroutines As Completed` and `Start Coroutines`. The same settings can be given
+        to any number of runs. ``fail_fast``, ``backend``, ``adaptive_concurrency`` and ``progress``
+        are supported by `Run Coroutines` only.
+        Examples:
+
+        |    ${settings}    Create Run Settings    log_level=ONELINE    fail_fast=True
+        |    ${values}    Run Coroutines    alias=alias1    settings=${settings}
+        |    ${settings}    Create Run Settings    backend=process    process_workers=4
+        |    ${settings}    Create Run Settings    backend=remote    remote_workers=node1:8271,node2:8271
+        |    ${settings}    Create Run Settings    rate=50    ramp_up=10    jitter=0.1
+        |    ${settings}    Create Run Settings    pool_name=backend    progress=${progress}
+
+        Args:
+
+            ``log_level``           <str, optional> Logging of the coroutines keywords, one of
+                                    NESTED (every coroutine is logged as a nested keyword once it is done),
+                                    FULL (html table per keyword), ONELINE (a single line per keyword)
+                                    or NONE (no logging). Defaults to NESTED.
+
+            ``pool_name``           <str, optional> Name of a pool created by `Create Gevent Pool`,
+                                    cannot be combined with ``gevent_pool_size``. Defaults to None.
+
+            ``fail_fast``           <bool, optional> Kill the remaining coroutines as soon as one fails,
+                                    all the errors are then reported together. Defaults to False.
+
+            ``backend``             <str, optional> ``gevent`` runs all coroutines on the current thread,
+                                    ``process`` splits the bundle between worker processes,
+                                    each running its slice on its own gevent hub, to use multiple
+                                    cores for CPU heavy keywords, ``remote`` splits it between
+                                    worker nodes given by ``remote_workers``. Only library keywords
+                                    with picklable arguments and values can run with ``process``
+                                    or ``remote``. Defaults to gevent.
+
+            ``process_workers``     <int, optional> Number of worker processes of the ``process`` backend,
+                                    0 for the number of CPUs. Defaults to 0.
+
+            ``remote_workers``      <str or list, optional> ``host:port`` addresses of the worker nodes
+                                    of the ``remote`` backend, a list or a comma separated string.
+                                    The bundle is split between the nodes like with ``process``.
+                                    Defaults to None.
+
+            ``rate``                <float, optional> Maximal number of coroutines started per second,
+                                    0 for no limit. Defaults to 0.
+
+            ``ramp_up``             <float, optional> Seconds over which the coroutines starts are spread
+                                    linearly, 0 to start all at once. Defaults to 0.
+
+            ``jitter``              <float, optional> Maximal random delay in seconds added to the start
+                                    of every coroutine. Defaults to 0.
+
+            ``retry_policy``        <RetryPolicy, optional> Policy created by `Create Retry Policy` for all
+                                    coroutines without a policy of their own. Defaults to None.
+
+            ``adaptive_concurrency`` <AdaptiveConcurrency, optional> Settings created by
+                                    `Create Adaptive Concurrency`, the number of coroutines running
+                                    at once adapts to their latency and failures. Defaults to None.
+
+            ``progress``            <ProgressReporting, optional> Settings created by
+                                    `Create Progress Reporting`, the progress of the run
+                                    is reported periodically while it runs. Defaults to None.
+
+            ``kill_grace_period``   <float, optional> Seconds given to the coroutines killed on a timeout,
+                                    a failure or a cancellation to finish their cleanup, coroutines
+                                    still running after it are reported. Defaults to 5.
+
+        All the settings are given as named arguments.
+        """
+        from GeventLibrary.execution import RunSettings
+
+        if kill_grace_period < 0:
+            raise ValueError(
+                f"'kill_grace_period' must be a positive value or 0, got {kill_grace_period}"
+            )
+        return RunSettings(
+            log_level,
+            pool_name,
+            fail_fast,
+            backend,
+            process_workers,
+            remote_workers,
+            rate,
+            ramp_up,
+            jitter,
+            retry_policy,
+            adaptive_concurrency,
+            progress,
+            kill_grace_period,
+        )
+
+    @keyword
+    def create_retry_policy(
+        self,
+        *retry_on: str,
+        max_attempts: int = 3,
+        backoff: float = 0.1,
+        max_backoff: float = 10,
+        jitter: bool = True,
+    ) -> "RetryPolicy":
+        """Creates a retry policy for coroutines, a failed coroutine is executed again
+        inside its greenlet, so only the failing coroutine is re-run.
+        The delay before a retry starts at ``backoff`` and is doubled on every retry.
+
+        The policy is given to `Add Coroutine` or `Add Coroutines` for specific coroutines,
+        or to `Create Run Settings` for all the coroutines of the bundle.
+        The number of attempts of every coroutine is found in `Get Bundle Statistics`.
+        Examples:
+
+        |    ${policy}    Create Retry Policy    max_attempts=5    backoff=0.5
+        |    ${policy}    Create Retry Policy    ConnectionError*    *503*    jitter=False
+        |    Add Coroutine    GET    ${url}    retry_policy=${policy}
+        |    ${settings}    Create Run Settings    retry_policy=${policy}
+
+        Args:
+
+            ``*retry_on``           <str> Glob patterns of the errors to retry, all errors when not given.
+
+            ``max_attempts``        <int, optional> Maximal number of executions, including the first. Defaults to 3.
+
+            ``backoff``             <float, optional> Seconds to wait before the first retry. Defaults to 0.1.
+
+            ``max_backoff``         <float, optional> Maximal seconds to wait before a retry. Defaults to 10.
+
+            ``jitter``              <bool, optional> Randomize the delay between 0 and the backoff. Defaults to True.
+
+        The settings after ``*retry_on`` are given as named arguments only.
+        """
+        from GeventLibrary.execution import RetryPolicy
+
+        return RetryPolicy(
+            max_attempts, backoff, max_backoff, jitter=jitter, retry_on=retry_on
+        )
+
+    @keyword
+    def create_adaptive_concurrency(
+        self,
+        initial: int = 4,
+        *,
+        minimum: int = 1,
+        maximum: int = 1000,
+        latency_tolerance: float = 2.0,
+        backoff: float = 0.5,
+    ) -> "AdaptiveConcurrency":
+        """Creates adaptive concurrency settings for `Create Run Settings`, the number of coroutines
+        running at once is adapted during the run instead of a fixed ``gevent_pool_size``.
+
+        Every completed coroutine adapts the limit: a failure, or a latency growing beyond
+        ``latency_tolerance`` times the lowest latency seen, multiplies it by ``backoff``,
+        otherwise it grows by one per completion until the first backoff and by one per
+        limit completions afterwards (additive increase, multiplicative decrease).
+        The limit over time is found under ``concurrency`` in `Get Bundle Statistics`.
+        Examples:
+
+        |    ${adaptive}    Create Adaptive Concurrency    initial=10    maximum=200
+        |    ${settings}    Create Run Settings    adaptive_concurrency=${adaptive}
+
+        Args:
+
+            ``initial``             <int, optional> Coroutines running at once when the run starts. Defaults to 4.
+
+            ``minimum``             <int, optional> Lowest limit. Defaults to 1.
+
+            ``maximum``             <int, optional> Highest limit. Defaults to 1000.
+
+            ``latency_tolerance``   <float, optional> Latency, relative to the lowest latency seen,
+                                    considered as overload. Defaults to 2.
+
+            ``backoff``             <float, optional> Factor the limit is multiplied by on overload
+                                    or failure, between 0 and 1. Defaults to 0.5.
+
+        The settings after ``initial`` are given as named arguments only.
+        """
+        from GeventLibrary.execution import AdaptiveConcurrency
+
+        return AdaptiveConcurrency(
+            initial,
+            minimum=minimum,
+            maximum=maximum,
+            latency_tolerance=latency_tolerance,
+            backoff=backoff,
+        )
+
+    @keyword
+    def create_progress_reporting(
+        self,
+        interval: float = 5,
+        console: bool = True,
+        path: Optional[str] = None,
+        listener: Any = None,
+    ) -> "ProgressReporting":
+        """Creates progress reporting settings for `Create Run Settings`, the progress of a long run
+        is reported every ``interval`` seconds while it runs, and once more when it ends.
+
+        Every report has the number of ``completed`` coroutines (of the ``total``), how many of them
+        ``failed``, how many are ``running`` and ``pending``, the ``throughput`` (completions per
+        second) since the previous report and the ``eta`` (estimated seconds left at that throughput).
+        Coroutines are counted as their greenlets are spawned and complete, the reports are made
+        by a greenlet of their own.
+        Examples:
+
+        |    ${progress}    Create Progress Reporting    interval=10
+        |    ${progress}    Create Progress Reporting    console=False    path=${OUTPUT DIR}/progress.jsonl
+        |    ${progress}    Create Progress Reporting    listener=my_listeners.ProgressListener
+        |    ${settings}    Create Run Settings    progress=${progress}
+
+        Args:
+
+            ``interval``            <float, optional> Seconds between reports. Defaults to 5.
+
+            ``console``             <bool, optional> Whether reports are written to robot's console,
+                                    a line per report. Defaults to True.
+
+            ``path``                <str, optional> JSON lines file every report is appended to.
+                                    Defaults to None.
+
+            ``listener``            <object or str, optional> Object, or name of a class or module
+                                    imported like a robot listener, whose ``bundle_progress`` method
+                                    is called with every report as a dict. Defaults to None.
+        """
+        from GeventLibrary.execution import ProgressReporting
+
+        return ProgressReporting(interval, console, path, listener)
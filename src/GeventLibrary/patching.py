@@ -0,0 +1,88 @@
+"""configurable monkey patching of the standard library by gevent"""
+import os
+from typing import List, Optional, Sequence, Set, Union
+
+from gevent import monkey
+
+# when the standard library is patched, in order
+PATCH_MOMENTS = ("init", "run", "never")
+# the subsystems gevent can patch, as named by the arguments of ``gevent.monkey.patch_all``
+SUBSYSTEMS = (
+    "socket",
+    "dns",
+    "time",
+    "select",
+    "thread",
+    "os",
+    "ssl",
+    "subprocess",
+    "sys",
+    "Event",
+    "builtins",
+    "signal",
+    "queue",
+    "contextvars",
+)
+# threads are patched only on demand, see the ``patch_threads`` library argument
+DEFAULT_SUBSYSTEMS = tuple(name for name in SUBSYSTEMS if name not in ("thread", "sys"))
+
+MOMENT_VARIABLE = "GEVENT_LIBRARY_PATCH"
+SUBSYSTEMS_VARIABLE = "GEVENT_LIBRARY_PATCH_SUBSYSTEMS"
+
+
+def _parse_subsystems(subsystems: Union[str, Sequence[str]]) -> List[str]:
+    if isinstance(subsystems, str):
+        subsystems = [name.strip() for name in subsystems.split(",") if name.strip()]
+    by_lower_name = {name.lower(): name for name in SUBSYSTEMS}
+    parsed = []
+    for name in subsystems:
+        if name.lower() not in by_lower_name:
+            raise ValueError(
+                f"'patch_subsystems' must be a list of {', '.join(SUBSYSTEMS)}, got {name}"
+            )
+        parsed.append(by_lower_name[name.lower()])
+    return parsed
+
+
+class MonkeyPatching:
+    """Patches the standard library with gevent's cooperative versions at a configured moment.
+
+    ``init`` patches when the library is initialized with its arguments (the default),
+    ``run`` right before the first bundle runs and ``never`` leaves patching to the user,
+    for example to ``python -m GeventLibrary`` which patches before robot imports anything.
+    The moment and the subsystems default to the ``GEVENT_LIBRARY_PATCH``
+    and ``GEVENT_LIBRARY_PATCH_SUBSYSTEMS`` environment variables.
+    Every subsystem is patched once per process, whatever the number of instances.
+    """
+
+    patched: Set[str] = set()
+
+    def __init__(
+        self,
+        moment: Optional[str] = None,
+        subsystems: Union[str, Sequence[str], None] = None,
+    ) -> None:
+        moment = moment or os.environ.get(MOMENT_VARIABLE) or PATCH_MOMENTS[0]
+        if moment not in PATCH_MOMENTS:
+            raise ValueError(
+                f"'patch_at' must be one of {', '.join(PATCH_MOMENTS)}, got {moment}"
+            )
+        if subsystems is None:
+            subsystems = os.environ.get(SUBSYSTEMS_VARIABLE) or DEFAULT_SUBSYSTEMS
+        self.moment = moment
+        self.subsystems = _parse_subsystems(subsystems)
+
+    def patch_by(self, moment: str) -> None:
+        """patches the subsystems if they are due to be patched by the given moment"""
+        if self.moment == "never":
+            return
+        if PATCH_MOMENTS.index(self.moment) <= PATCH_MOMENTS.index(moment):
+            self.patch()
+
+    def patch(self) -> None:
+        """patches the subsystems that are not patched yet"""
+        missing = [name for name in self.subsystems if name not in self.patched]
+        if not missing:
+            return
+        monkey.patch_all(**{name: name in missing for name in SUBSYSTEMS})
+        self.patched.update(missing)
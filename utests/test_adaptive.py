@@ -0,0 +1,127 @@
+"""unittest module, adaptive concurrency of bundle runs"""
+import sys
+from unittest import TestCase, mock, main
+
+import gevent
+from gevent import GreenletExit
+from robot.errors import HandlerExecutionFailed
+from robot.utils.error import ErrorDetails
+
+sys.path.insert(0, "src")
+from GeventLibrary.execution import AdaptiveConcurrency, RunSettings
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+# coroutines running at once before the stand-in service slows down
+CAPACITY = 10
+
+
+class TestAdaptiveConcurrency(TestCase):
+    """This suite tests that the concurrency adapts to the latency and failures of coroutines"""
+
+    def setUp(self):
+        self.running = 0
+
+        def _service(*_):
+            self.running += 1
+            try:
+                gevent.sleep(0.005 * max(1, self.running / CAPACITY))
+            finally:
+                self.running -= 1
+
+        patchers = [
+            mock.patch(
+                "robot.libraries.BuiltIn.BuiltIn.run_keyword", side_effect=_service
+            ),
+            mock.patch(
+                "robot.running.context.ExecutionContexts.current",
+                returned_Value="not null...",
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.gevent_library_instance = GeventKeywords()
+        self.gevent_library_instance.create_gevent_bundle(alias="my_alias")
+
+    def test_limit_follows_the_latency(self):
+        """the limit grows while the latency holds and backs off once it grows"""
+        self.gevent_library_instance.add_coroutines("Request", count=1000)
+        self.gevent_library_instance.run_coroutines(
+            settings=RunSettings(adaptive_concurrency=AdaptiveConcurrency(initial=2))
+        )
+
+        stats = self.gevent_library_instance.get_bundle_statistics()
+        limits = [limit for _, limit in stats["concurrency"]]
+        self.assertEqual(2, limits[0])
+        self.assertGreater(max(limits), CAPACITY)
+        self.assertLess(stats["max_concurrency"], 5 * CAPACITY)
+        self.assertTrue(
+            any(later < earlier for earlier, later in zip(limits, limits[1:])), limits
+        )
+        times = [time for time, _ in stats["concurrency"]]
+        self.assertListEqual(sorted(times), times)
+
+    def test_failures_back_off(self):
+        """failures multiply the limit by the backoff down to the minimum"""
+        limiter = AdaptiveConcurrency(initial=16, minimum=2).limiter()
+        spawn = limiter.wrap(gevent.spawn)
+        # the hub prints the errors of failed greenlets
+        self.addCleanup(mock.patch.stopall)
+        mock.patch.object(gevent.get_hub(), "print_exception").start()
+        for _ in range(3):
+            gevent.joinall(
+                [spawn(self._fail) for _ in range(16)], raise_error=False
+            )
+        # a decrease per generation of coroutines spawned after the previous one
+        self.assertListEqual([16, 8, 4, 2], [limit for _, limit in limiter.history])
+
+    def test_kills_do_not_back_off(self):
+        """killed coroutines free their slot without decreasing the limit"""
+        limiter = AdaptiveConcurrency(initial=4).limiter()
+        spawn = limiter.wrap(gevent.spawn)
+        # the hub prints the errors of failed greenlets
+        self.addCleanup(mock.patch.stopall)
+        mock.patch.object(gevent.get_hub(), "print_exception").start()
+        greenlets = [spawn(self._killed) for _ in range(4)]
+        gevent.sleep(0.001)
+        gevent.killall(greenlets)
+        self.assertListEqual([4], [limit for _, limit in limiter.history])
+        gevent.joinall([spawn(gevent.sleep, 0.001) for _ in range(4)], timeout=1)
+        self.assertListEqual([4, 5, 6, 7, 8], [limit for _, limit in limiter.history])
+
+    def test_not_adaptive(self):
+        """runs with a fixed concurrency report no limits"""
+        self.gevent_library_instance.add_coroutine("Request")
+        self.gevent_library_instance.run_coroutines()
+        self.assertIsNone(
+            self.gevent_library_instance.get_bundle_statistics()["concurrency"]
+        )
+
+    def test_invalid_settings(self):
+        """the initial limit must be within the bounds"""
+        with self.assertRaises(ValueError) as exp:
+            self.gevent_library_instance.create_adaptive_concurrency(
+                initial=20, maximum=10
+            )
+        self.assertEqual(
+            str(exp.exception), "'initial' must be between 'minimum' and 'maximum', got 20"
+        )
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrency(backoff=1)
+
+    @staticmethod
+    def _killed():
+        try:
+            gevent.sleep(5)
+        except GreenletExit:
+            # robot reports a killed keyword as a failure of its own
+            raise HandlerExecutionFailed(ErrorDetails())  # pylint: disable=raise-missing-from
+
+    @staticmethod
+    def _fail():
+        gevent.sleep(0.001)
+        raise AssertionError("overloaded")
+
+
+if __name__ == "__main__":
+    main()
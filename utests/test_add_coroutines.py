@@ -0,0 +1,100 @@
+"""unittest module, adding a batch of coroutines at once"""
+import sys
+from unittest import TestCase, mock, main
+
+sys.path.insert(0, "src")
+from GeventLibrary.execution import CoroutineRecord, RunSettings
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+
+def _echo(keyword_name, *args):
+    return (keyword_name, *args)
+
+
+class TestAddCoroutines(TestCase):
+    """This suite tests the `Add Coroutines` keyword"""
+
+    def setUp(self):
+        patchers = [
+            mock.patch("robot.libraries.BuiltIn.BuiltIn.run_keyword", side_effect=_echo),
+            mock.patch(
+                "robot.running.context.ExecutionContexts.current",
+                returned_Value="not null...",
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.gevent_library_instance = GeventKeywords()
+        self.gevent_library_instance.create_gevent_bundle(alias="my_alias")
+
+    def test_add_count(self):
+        """count adds identical coroutines"""
+        self.gevent_library_instance.add_coroutines("GET", "url", count=1000, timeout=1)
+        self.assertEqual(1000, len(self.gevent_library_instance["my_alias"]))
+        values = self.gevent_library_instance.run_coroutines(
+            settings=RunSettings(log_level="NONE")
+        )
+        self.assertEqual(1000, len(values))
+        self.assertEqual(("GET", "url", "timeout=1"), values[-1])
+        self.assertEqual(0, len(self.gevent_library_instance["my_alias"]))
+
+    def test_add_arg_sets(self):
+        """each item of arg_sets is a list, a dictionary or a single argument"""
+        self.gevent_library_instance.add_coroutine("Log", "first")
+        self.gevent_library_instance.add_coroutines(
+            "Sleep", arg_sets=["1s", ["2s", "reason"], {"time_": "3s"}], level="INFO"
+        )
+        self.gevent_library_instance.add_coroutine("Log", "last")
+        values = self.gevent_library_instance.run_coroutines()
+        self.assertListEqual(
+            [
+                ("Log", "first"),
+                ("Sleep", "1s", "level=INFO"),
+                ("Sleep", "2s", "reason", "level=INFO"),
+                ("Sleep", "level=INFO", "time_=3s"),
+                ("Log", "last"),
+            ],
+            values,
+        )
+
+    def test_records_are_created_as_pulled(self):
+        """the record of a coroutine of a batch is created once the pool pulls the coroutine"""
+        created = []
+        seen = []
+
+        class _CountedRecord(CoroutineRecord):
+            __slots__ = ()
+
+            def __init__(self, spec):
+                created.append(spec)
+                super().__init__(spec)
+
+        def _count(keyword_name, *args):
+            seen.append(len(created))
+            return _echo(keyword_name, *args)
+
+        self.gevent_library_instance.add_coroutines("GET", arg_sets=["a", "b", "c", "d"])
+        with mock.patch(
+            "GeventLibrary.execution.records.CoroutineRecord", _CountedRecord
+        ), mock.patch("robot.libraries.BuiltIn.BuiltIn.run_keyword", side_effect=_count):
+            values = self.gevent_library_instance.run_coroutines(gevent_pool_size=1)
+        self.assertEqual([("GET", arg) for arg in "abcd"], values)
+        # the running coroutine and the one waiting for the pool slot
+        self.assertListEqual([2, 3, 4, 4], seen)
+
+    def test_count_or_arg_sets(self):
+        """exactly one of count and arg_sets is required"""
+        with self.assertRaises(ValueError) as exp:
+            self.gevent_library_instance.add_coroutines("Log", count=1, arg_sets=[1])
+        self.assertEqual(
+            str(exp.exception), "Exactly one of 'count' and 'arg_sets' must be given"
+        )
+        with self.assertRaises(ValueError):
+            self.gevent_library_instance.add_coroutines("Log")
+        with self.assertRaises(ValueError):
+            self.gevent_library_instance.add_coroutines("Log", count=-1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""unittest module, async keywords awaited on the shared asyncio loop"""
+import asyncio
+import sys
+import time
+from unittest import TestCase, mock, main
+
+import gevent
+
+sys.path.insert(0, "src")
+from GeventLibrary.execution import AsyncioBridge
+
+
+async def _sleep_and_return(seconds, value="PASS"):
+    await asyncio.sleep(seconds)
+    if value == "FAIL":
+        raise ValueError("some value error...")
+    return value
+
+
+class TestAsyncioBridge(TestCase):
+    """This suite tests awaiting coroutines of async keywords from greenlets"""
+
+    def setUp(self):
+        self.bridge = AsyncioBridge()
+        self.addCleanup(self.bridge.close_loop)
+
+    def test_greenlets_await_concurrently(self):
+        """every greenlet waits only for its own coroutine, the loop is shared"""
+        started = time.monotonic()
+        jobs = [
+            gevent.spawn(self.bridge.run_until_complete, _sleep_and_return(0.1, index))
+            for index in range(500)
+        ]
+        gevent.joinall(jobs, raise_error=True)
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(list(range(500)), [job.value for job in jobs])
+
+    def test_exception_is_raised(self):
+        """the exception of the coroutine is raised in the awaiting greenlet"""
+        with self.assertRaises(ValueError):
+            self.bridge.run_until_complete(_sleep_and_return(0, "FAIL"))
+
+    def test_loop_required_for_coroutines(self):
+        """only coroutines are awaited on the loop"""
+        coroutine = _sleep_and_return(0)
+        self.assertTrue(self.bridge.is_loop_required(coroutine))
+        self.assertFalse(self.bridge.is_loop_required("PASS"))
+        self.assertEqual("PASS", self.bridge.run_until_complete(coroutine))
+
+    def test_other_asyncio_code_is_not_affected(self):
+        """greenlets running their own loops are not confused by the shared loop"""
+        self.bridge.run_until_complete(_sleep_and_return(0))
+        job = gevent.spawn(asyncio.run, _sleep_and_return(0.01, "own loop"))
+        value = self.bridge.run_until_complete(_sleep_and_return(0.02, "shared loop"))
+        self.assertEqual(["own loop", "shared loop"], [job.get(), value])
+
+    def test_install_replaces_robot_loop(self):
+        """the bridge is installed once per execution context"""
+        context = mock.MagicMock()
+        robot_loop = context.asynchronous
+        AsyncioBridge.install(context)
+        bridge = context.asynchronous
+        self.assertIsInstance(bridge, AsyncioBridge)
+        self.assertIsNot(robot_loop, bridge)
+        AsyncioBridge.install(context)
+        self.assertIs(bridge, context.asynchronous)
+
+    def test_close_loop(self):
+        """a closed bridge starts a new loop on its next use"""
+        self.bridge.run_until_complete(_sleep_and_return(0))
+        loop = self.bridge.event_loop
+        self.bridge.close_loop()
+        self.assertTrue(loop.is_closed())
+        self.assertEqual("PASS", self.bridge.run_until_complete(_sleep_and_return(0)))
+
+
+if __name__ == "__main__":
+    main()
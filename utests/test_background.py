@@ -0,0 +1,203 @@
+"""unittest module, bundles running in the background of the test"""
+import sys
+import time
+from types import SimpleNamespace
+from unittest import TestCase, mock, main
+
+import gevent
+
+sys.path.insert(0, "src")
+from GeventLibrary.exceptions import (
+    CoroutinesTimedOut,
+    NoPendingCoroutines,
+    UnsupportedRobotVersion,
+)
+from GeventLibrary.execution import (
+    CoroutineContextStacks,
+    GreenletLocalStack,
+    RunSettings,
+)
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+
+def _sleep_and_return(name, seconds, value="PASS"):
+    try:
+        gevent.sleep(float(seconds))
+    except gevent.GreenletExit:
+        if name != "Ignore Kill":
+            raise
+        gevent.sleep(float(seconds))
+    if value == "FAIL":
+        raise ValueError("some value error...")
+    return value
+
+
+class TestStartCoroutines(TestCase):
+    """This suite tests `Start Coroutines`, `Wait For Coroutines` and `Cancel Coroutines`"""
+
+    def setUp(self):
+        patchers = [
+            mock.patch(
+                "robot.libraries.BuiltIn.BuiltIn.run_keyword",
+                side_effect=_sleep_and_return,
+            ),
+            mock.patch(
+                "robot.running.context.ExecutionContexts.current",
+                returned_Value="not null...",
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.gevent_library_instance = GeventKeywords()
+        self.gevent_library_instance.create_gevent_bundle(alias="my_alias")
+
+    def test_overlaps_with_the_test(self):
+        """the bundle runs while the test goes on, the total time is the longest of the two"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0.1", "first")
+        self.gevent_library_instance.add_coroutine("Sleep", "0.05", "second")
+        started = time.monotonic()
+        handle = self.gevent_library_instance.start_coroutines()
+        self.assertLess(time.monotonic() - started, 0.05)
+
+        gevent.sleep(0.1)  # the test's own keywords
+        values = self.gevent_library_instance.wait_for_coroutines(handle)
+
+        self.assertEqual(["first", "second"], values)
+        self.assertLess(time.monotonic() - started, 0.18)
+        self.assertTrue(handle.finished)
+
+    def test_failure_is_raised_on_wait(self):
+        """the exception of a failed coroutine is raised by `Wait For Coroutines`"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0.01", "FAIL")
+        handle = self.gevent_library_instance.start_coroutines()
+        with self.assertRaises(ValueError):
+            self.gevent_library_instance.wait_for_coroutines(handle)
+
+    def test_timeout_on_wait(self):
+        """coroutines that did not complete within the wait timeout are killed and reported"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0.01")
+        self.gevent_library_instance.add_coroutine("Sleep", "10")
+        handle = self.gevent_library_instance.start_coroutines()
+        with self.assertRaises(CoroutinesTimedOut) as exp:
+            self.gevent_library_instance.wait_for_coroutines(handle, timeout=0.05)
+        self.assertEqual(1, len(exp.exception.stragglers))
+
+    def test_coroutine_surviving_the_kill_on_wait(self):
+        """coroutines still running after the grace period are named, not a gevent timeout"""
+        self.gevent_library_instance.add_coroutine("Ignore Kill", "0.3")
+        handle = self.gevent_library_instance.start_coroutines(
+            settings=RunSettings(kill_grace_period=0.05)
+        )
+        with self.assertRaises(CoroutinesTimedOut) as exp:
+            self.gevent_library_instance.wait_for_coroutines(handle, timeout=0.05)
+        self.assertEqual(1, len(exp.exception.survivors))
+        gevent.sleep(0.4)
+
+    def test_cancel(self):
+        """cancelling kills the coroutines that did not complete yet"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0")
+        self.gevent_library_instance.add_coroutine("Sleep", "10")
+        self.gevent_library_instance.add_coroutine("Sleep", "10")
+        handle = self.gevent_library_instance.start_coroutines()
+        gevent.sleep(0.01)
+        self.assertEqual(2, self.gevent_library_instance.cancel_coroutines(handle))
+        self.assertEqual(
+            {"PASS": 1, "KILLED": 2},
+            self.gevent_library_instance.get_bundle_statistics()["statuses"],
+        )
+
+    def test_coroutine_surviving_the_cancel(self):
+        """coroutines still running after the grace period of a cancel are reported"""
+        self.gevent_library_instance.add_coroutine("Ignore Kill", "0.3")
+        handle = self.gevent_library_instance.start_coroutines(
+            settings=RunSettings(kill_grace_period=0.05)
+        )
+        gevent.sleep(0.01)
+        with mock.patch("GeventLibrary.execution.background.logger.warn") as warn:
+            self.assertEqual(1, self.gevent_library_instance.cancel_coroutines(handle))
+        warn.assert_called_once()
+        self.assertIn("Ignore Kill    0.3", warn.call_args[0][0])
+        gevent.sleep(0.4)
+
+    def test_finished_handle(self):
+        """a handle can be waited for or cancelled only once"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0")
+        handle = self.gevent_library_instance.start_coroutines()
+        self.gevent_library_instance.wait_for_coroutines(handle)
+        with self.assertRaises(NoPendingCoroutines):
+            self.gevent_library_instance.cancel_coroutines(handle)
+
+    def test_clear_bundle_cancels(self):
+        """clearing the bundle cancels its coroutines running in the background"""
+        self.gevent_library_instance.add_coroutine("Sleep", "10")
+        handle = self.gevent_library_instance.start_coroutines()
+        self.gevent_library_instance.clear_bundle("my_alias")
+        self.assertTrue(handle.finished)
+
+
+class TestContextStacks(TestCase):
+    """This suite tests the greenlet local copies of robot's stacks"""
+
+    def test_forked_greenlet_has_own_stack(self):
+        """a forked greenlet starts with a copy of the stack and changes only its copy"""
+        stack = GreenletLocalStack(["suite", "test"])
+        seen = []
+
+        def _keyword():
+            stack.append("keyword")
+            gevent.sleep(0)
+            seen.append(list(stack))
+            stack.pop()
+
+        greenlet = gevent.spawn(_keyword)
+        stack.fork(greenlet)
+        gevent.sleep(0)
+        self.assertEqual(["suite", "test"], list(stack))
+        greenlet.join()
+        self.assertEqual([["suite", "test", "keyword"]], seen)
+        self.assertEqual(["suite", "test"], stack.shared)
+
+    def test_stacks_are_restored(self):
+        """the original lists are put back after the last release"""
+        context = mock.MagicMock()
+        steps = context.steps = []
+        first = CoroutineContextStacks.acquire(context)
+        second = CoroutineContextStacks.acquire(context)
+        self.assertIs(first, second)
+        self.assertIsInstance(context.steps, GreenletLocalStack)
+        first.release()
+        self.assertIsInstance(context.steps, GreenletLocalStack)
+        second.release()
+        self.assertIs(steps, context.steps)
+
+    def test_context_without_steps(self):
+        """contexts of robot before 6.1 keep their started steps in ``step_types``"""
+        variables = SimpleNamespace(_scopes=[], _variables_set=SimpleNamespace(_scopes=[]))
+        context = SimpleNamespace(step_types=[], user_keywords=[], variables=variables)
+        step_types = context.step_types
+        stacks = CoroutineContextStacks.acquire(context)
+        self.assertIsInstance(context.step_types, GreenletLocalStack)
+        self.assertFalse(hasattr(context, "steps"))
+        stacks.release()
+        self.assertIs(step_types, context.step_types)
+
+    def test_unsupported_context(self):
+        """nothing is replaced when a stack is missing, or on an unchecked robot version"""
+        variables = SimpleNamespace(_scopes=[])
+        context = SimpleNamespace(steps=[], user_keywords=[], variables=variables)
+        steps = context.steps
+        with self.assertRaises(UnsupportedRobotVersion):
+            CoroutineContextStacks.acquire(context)
+        self.assertIs(steps, context.steps)
+        self.assertNotIn(id(context), CoroutineContextStacks._installed)
+
+        variables._variables_set = SimpleNamespace(_scopes=[])
+        with mock.patch("GeventLibrary.execution.robot_internals.VERSION", "7.0"):
+            with self.assertRaises(UnsupportedRobotVersion):
+                CoroutineContextStacks.acquire(context)
+        self.assertIs(steps, context.steps)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""unittest module, detection of coroutines blocking the gevent hub"""
+import sys
+from time import monotonic
+from unittest import TestCase, mock, main
+
+import gevent
+
+sys.path.insert(0, "src")
+from GeventLibrary.execution import BlockingMonitor
+from GeventLibrary.execution.blocking_monitor import _monitoring
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+
+def _busy_or_sleep(_, seconds, mode="sleep"):
+    if mode == "busy":
+        end = monotonic() + float(seconds)
+        while monotonic() < end:
+            pass
+    else:
+        gevent.sleep(float(seconds))
+
+
+class TestBlockingMonitor(TestCase):
+    """This suite tests the reports of coroutines blocking the hub"""
+
+    def setUp(self):
+        patchers = [
+            mock.patch(
+                "robot.libraries.BuiltIn.BuiltIn.run_keyword",
+                side_effect=_busy_or_sleep,
+            ),
+            mock.patch(
+                "robot.running.context.ExecutionContexts.current",
+                returned_Value="not null...",
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.logger = mock.patch("GeventLibrary.keywords.gevent_keywords.logger").start()
+        self.addCleanup(mock.patch.stopall)
+        self.gevent_library_instance = GeventKeywords(blocking_threshold=0.05)
+        self.gevent_library_instance.create_gevent_bundle(alias="my_alias")
+
+    def test_blocking_coroutine_is_reported(self):
+        """only the coroutine that did not yield is reported, with its stack"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0.3")
+        self.gevent_library_instance.add_coroutine("Sleep", "0.3", "busy")
+        self.gevent_library_instance.run_coroutines()
+
+        stats = self.gevent_library_instance.get_bundle_statistics()
+        self.assertEqual(1, stats["blocked"])
+        self.assertEqual(1, self.logger.warn.call_count)
+        message = self.logger.warn.call_args[0][0]
+        self.assertIn("Coroutine Sleep    0.3    busy blocked the gevent hub", message)
+        self.assertIn("_busy_or_sleep", message)
+
+    def test_cooperative_coroutines(self):
+        """coroutines that yield to the hub are not reported"""
+        for _ in range(10):
+            self.gevent_library_instance.add_coroutine("Sleep", "0.1")
+        self.gevent_library_instance.run_coroutines()
+
+        self.assertEqual(0, self.gevent_library_instance.get_bundle_statistics()["blocked"])
+        self.logger.warn.assert_not_called()
+
+    def test_monitoring_only_while_running(self):
+        """the hub is monitored while bundles run, blocks are detected again by the next run"""
+        self.assertIsNone(_monitoring.tracer)
+        self.gevent_library_instance.add_coroutine("Sleep", "0.3", "busy")
+        self.gevent_library_instance.run_coroutines()
+        self.assertIsNone(_monitoring.tracer)
+        self.assertEqual([], _monitoring.active)
+        gevent.sleep(0.2)
+
+        self.gevent_library_instance.add_coroutine("Sleep", "0.3", "busy")
+        self.gevent_library_instance.run_coroutines()
+        self.assertEqual(1, self.gevent_library_instance.get_bundle_statistics()["blocked"])
+        self.assertEqual(2, self.logger.warn.call_count)
+
+    def test_monitoring_background_bundle(self):
+        """the hub is monitored until the bundle started in the background is waited for"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0.3", "busy")
+        handle = self.gevent_library_instance.start_coroutines()
+        self.assertIsNotNone(_monitoring.tracer)
+        self.gevent_library_instance.wait_for_coroutines(handle)
+        self.assertIsNone(_monitoring.tracer)
+        self.assertEqual(1, self.logger.warn.call_count)
+
+    def test_threshold_must_be_positive(self):
+        """a negative threshold is rejected"""
+        with self.assertRaises(ValueError):
+            BlockingMonitor(-1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""unittest module, coroutines depending on other coroutines of the bundle"""
+import sys
+import time
+from unittest import TestCase, mock, main
+
+import gevent
+
+sys.path.insert(0, "src")
+from GeventLibrary.execution import DependencyGraph
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+
+def _sleep_and_join(_, seconds, *parts):
+    gevent.sleep(float(seconds))
+    if "FAIL" in parts:
+        raise ValueError("some value error...")
+    return ":".join(parts)
+
+
+class TestDependencyGraph(TestCase):
+    """This suite tests the validation of the dependencies"""
+
+    def test_unknown_dependency(self):
+        """depending on a name that is not in the bundle"""
+        with self.assertRaises(LookupError) as exp:
+            DependencyGraph(["a", None], [(), ("b",)])
+        self.assertEqual("Coroutine with name b was not found", str(exp.exception))
+
+    def test_duplicate_name(self):
+        """names are unique within a bundle"""
+        with self.assertRaises(ValueError):
+            DependencyGraph(["a", "a"], [(), ()])
+
+    def test_cycle(self):
+        """coroutines depending on each other can never start"""
+        with self.assertRaises(ValueError) as exp:
+            DependencyGraph(["a", "b", "c"], [("b",), ("a",), ()])
+        self.assertEqual("Dependencies of coroutines a, b form a cycle", str(exp.exception))
+
+    def test_flat_bundle_is_ordered(self):
+        """without dependencies the coroutines are started by their order"""
+        graph = DependencyGraph([None, None, None], [(), (), ()])
+        self.assertFalse(graph.active)
+        self.assertEqual([(0, []), (1, []), (2, [])], list(graph.ready()))
+
+
+class TestRunDependentCoroutines(TestCase):
+    """This suite tests `Run Coroutines` with dependent coroutines"""
+
+    def setUp(self):
+        patchers = [
+            mock.patch(
+                "robot.libraries.BuiltIn.BuiltIn.run_keyword",
+                side_effect=_sleep_and_join,
+            ),
+            mock.patch(
+                "robot.running.context.ExecutionContexts.current",
+                returned_Value="not null...",
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.gevent_library_instance = GeventKeywords()
+        self.gevent_library_instance.create_gevent_bundle(alias="my_alias")
+
+    def test_values_are_passed_as_arguments(self):
+        """dependents receive the values of their dependencies by the order they were listed"""
+        self.gevent_library_instance.add_coroutine(
+            "Sleep", "0.03", "token", coroutine_name="login"
+        )
+        self.gevent_library_instance.add_coroutine(
+            "Sleep", "0.01", "orders", coroutine_name="orders", depends_on="login"
+        )
+        self.gevent_library_instance.add_coroutine(
+            "Sleep", "0.01", "report", depends_on=["orders", "login"]
+        )
+        self.gevent_library_instance.add_coroutine("Sleep", "0.05", "independent")
+        started = time.monotonic()
+        values = self.gevent_library_instance.run_coroutines()
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(
+            ["token", "orders:token", "report:orders:token:token", "independent"], values
+        )
+        # the pipeline overlaps with the independent coroutine
+        self.assertLess(elapsed, 0.09)
+
+    def test_values_precede_named_arguments(self):
+        """the values are inserted after the positional arguments, before the named ones"""
+        self.gevent_library_instance.add_coroutine(
+            "Sleep", "0", "token", coroutine_name="login"
+        )
+        self.gevent_library_instance.add_coroutine(
+            "Sleep", "0", "orders", depends_on="login", page="2"
+        )
+        values = self.gevent_library_instance.run_coroutines()
+
+        self.assertEqual(["token", "orders:token:page=2"], values)
+
+    def test_failed_dependency(self):
+        """dependents of a failed coroutine are never started"""
+        self.gevent_library_instance.add_coroutine(
+            "Sleep", "0", "FAIL", coroutine_name="login"
+        )
+        self.gevent_library_instance.add_coroutine("Sleep", "0", depends_on="login")
+        self.gevent_library_instance.add_coroutine("Sleep", "0.01")
+        with self.assertRaises(ValueError):
+            self.gevent_library_instance.run_coroutines()
+        self.assertEqual(
+            {"FAIL": 1, "NOT RUN": 1, "PASS": 1},
+            self.gevent_library_instance.get_bundle_statistics()["statuses"],
+        )
+
+    def test_streams_do_not_support_dependencies(self):
+        """dependencies are ordered only by `Run Coroutines`"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0", coroutine_name="login")
+        self.gevent_library_instance.add_coroutine("Sleep", "0", depends_on="login")
+        with self.assertRaises(ValueError):
+            self.gevent_library_instance.run_coroutines_as_completed()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""unittest module, fail fast cancellation of a bundle"""
+import sys
+import time
+from unittest import TestCase, mock, main
+
+import gevent
+from gevent import GreenletExit
+from robot.errors import HandlerExecutionFailed
+from robot.utils.error import ErrorDetails
+
+sys.path.insert(0, "src")
+from GeventLibrary.exceptions import CoroutinesFailed
+from GeventLibrary.execution import RunSettings
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+
+def _sleep_or_fail(_, seconds, value="PASS"):
+    try:
+        gevent.sleep(float(seconds))
+    except GreenletExit:
+        # robot reports a killed keyword as a failure of its own
+        raise HandlerExecutionFailed(ErrorDetails())  # pylint: disable=raise-missing-from
+    if value == "FAIL":
+        raise ValueError(f"failed after {seconds}")
+    return value
+
+
+class TestFailFast(TestCase):
+    """This suite tests `Run Coroutines` with ``fail_fast``"""
+
+    def setUp(self):
+        patchers = [
+            mock.patch(
+                "robot.libraries.BuiltIn.BuiltIn.run_keyword",
+                side_effect=_sleep_or_fail,
+            ),
+            mock.patch(
+                "robot.running.context.ExecutionContexts.current",
+                returned_Value="not null...",
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.gevent_library_instance = GeventKeywords()
+        self.gevent_library_instance.create_gevent_bundle(alias="my_alias")
+
+    def test_remaining_coroutines_are_killed(self):
+        """when a coroutine fails, the slow coroutines are not awaited"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0.01", "FAIL")
+        self.gevent_library_instance.add_coroutine("Sleep", "5")
+        self.gevent_library_instance.add_coroutine("Sleep", "5")
+        started = time.monotonic()
+        with self.assertRaises(CoroutinesFailed) as exp:
+            self.gevent_library_instance.run_coroutines(
+                settings=RunSettings(fail_fast=True)
+            )
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(1, len(exp.exception.errors))
+        self.assertEqual(
+            str(exp.exception), "1 coroutine(s) failed:\n    ValueError: failed after 0.01"
+        )
+
+    def test_killed_coroutines_are_not_reported(self):
+        """coroutines killed by the guard are not listed among the failures"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0.01", "FAIL")
+        self.gevent_library_instance.add_coroutine("Sleep", "0.02", "FAIL")
+        self.gevent_library_instance.add_coroutine("Sleep", "5")
+        with self.assertRaises(CoroutinesFailed) as exp:
+            self.gevent_library_instance.run_coroutines(
+                settings=RunSettings(fail_fast=True)
+            )
+        self.assertEqual(
+            str(exp.exception), "1 coroutine(s) failed:\n    ValueError: failed after 0.01"
+        )
+
+    def test_pending_pool_coroutines_are_not_started(self):
+        """coroutines waiting for a pool slot are not started after a failure"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0.01", "FAIL")
+        self.gevent_library_instance.add_coroutine("Sleep", "5")
+        self.gevent_library_instance.add_coroutine("Sleep", "5")
+        started = time.monotonic()
+        with self.assertRaises(CoroutinesFailed):
+            self.gevent_library_instance.run_coroutines(
+                gevent_pool_size=1, settings=RunSettings(fail_fast=True)
+            )
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_all_errors_are_aggregated(self):
+        """coroutines failing together are all reported"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0.01", "FAIL")
+        self.gevent_library_instance.add_coroutine("Sleep", "0.01", "FAIL")
+        with self.assertRaises(CoroutinesFailed) as exp:
+            self.gevent_library_instance.run_coroutines(
+                settings=RunSettings(fail_fast=True)
+            )
+        self.assertEqual(2, len(exp.exception.errors))
+
+    def test_successful_bundle(self):
+        """without failures, values are returned as usual"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0.01", "A")
+        self.gevent_library_instance.add_coroutine("Sleep", "0", "B")
+        values = self.gevent_library_instance.run_coroutines(
+            settings=RunSettings(fail_fast=True)
+        )
+        self.assertListEqual(["A", "B"], values)
+
+    def test_run_coroutines_only(self):
+        """coroutines started without waiting for them cannot fail fast"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0", "A")
+        settings = self.gevent_library_instance.create_run_settings(fail_fast=True)
+        with self.assertRaises(ValueError) as exp:
+            self.gevent_library_instance.start_coroutines(settings=settings)
+        self.assertEqual(
+            str(exp.exception),
+            "'fail_fast' is supported by `Run Coroutines` only, not by `Start Coroutines`",
+        )
+        self.assertEqual(1, len(self.gevent_library_instance["my_alias"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""unittest module, HTTP coroutines over pooled keep-alive connections"""
+import json
+import sys
+from unittest import TestCase, mock, main
+
+import gevent
+from gevent.pywsgi import WSGIServer
+
+sys.path.insert(0, "src")
+from GeventLibrary.execution import HttpConnectionPool
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+
+class _Server:
+    """local stand-in server, counting connections and concurrent requests"""
+
+    def __init__(self):
+        self.ports = set()
+        self.running = self.most_running = 0
+        self.server = WSGIServer(("127.0.0.1", 0), self.app, log=None)
+        self.server.start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def app(self, environ, start_response):
+        self.ports.add(environ["REMOTE_PORT"])
+        self.running += 1
+        self.most_running = max(self.most_running, self.running)
+        try:
+            gevent.sleep(0.05)
+        finally:
+            self.running -= 1
+        path = environ["PATH_INFO"]
+        if path == "/missing":
+            start_response("404 Not Found", [("Content-Type", "text/plain")])
+            return [b"missing"]
+        if path == "/cookies":
+            start_response(
+                "200 OK", [("Set-Cookie", "a=1"), ("set-cookie", "b=2"), ("Vary", "*")]
+            )
+            return [b""]
+        body = environ["wsgi.input"].read()
+        start_response("200 OK", [("Content-Type", "application/json")])
+        return [json.dumps({"path": path, "body": body.decode()}).encode()]
+
+
+class TestHttpCoroutines(TestCase):
+    """This suite tests the requests of HTTP coroutines"""
+
+    def setUp(self):
+        self.run_keyword = mock.patch(
+            "robot.libraries.BuiltIn.BuiltIn.run_keyword"
+        ).start()
+        mock.patch(
+            "robot.running.context.ExecutionContexts.current",
+            returned_Value="not null...",
+        ).start()
+        self.addCleanup(mock.patch.stopall)
+        self.server = _Server()
+        self.addCleanup(self.server.server.stop)
+        self.gevent_library_instance = GeventKeywords(http_connections_per_host=4)
+        self.addCleanup(self.gevent_library_instance._resources.close)
+        self.gevent_library_instance.create_gevent_bundle(alias="my_alias")
+
+    def test_connections_are_shared(self):
+        """requests run concurrently over at most the per host number of kept connections"""
+        for index in range(20):
+            self.gevent_library_instance.add_http_coroutine(
+                "get", f"{self.server.url}/posts/{index}"
+            )
+        responses = self.gevent_library_instance.run_coroutines()
+
+        self.assertListEqual(
+            [f"/posts/{index}" for index in range(20)],
+            [response.json()["path"] for response in responses],
+        )
+        self.assertEqual(4, self.server.most_running)
+        self.assertEqual(4, len(self.server.ports))
+        self.run_keyword.assert_not_called()
+        # the wait for a free connection is not part of the elapsed time
+        self.assertLess(max(response.elapsed for response in responses), 0.15)
+
+        # the following bundle reuses the kept connections
+        self.gevent_library_instance.add_http_coroutine("GET", self.server.url)
+        self.gevent_library_instance.run_coroutines()
+        self.assertEqual(4, len(self.server.ports))
+
+    def test_json_body(self):
+        """json bodies are serialized"""
+        self.gevent_library_instance.add_http_coroutine(
+            "POST", f"{self.server.url}/posts", json={"title": "a"}
+        )
+        (response,) = self.gevent_library_instance.run_coroutines()
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"title": "a"}, json.loads(response.json()["body"]))
+        self.assertEqual("POST", response.method)
+
+    def test_error_status(self):
+        """error statuses fail the coroutine unless they are expected"""
+        self.gevent_library_instance.add_http_coroutine(
+            "GET", f"{self.server.url}/missing", expected_status="any"
+        )
+        self.gevent_library_instance.add_http_coroutine(
+            "GET", f"{self.server.url}/missing", expected_status="ANY"
+        )
+        self.gevent_library_instance.add_http_coroutine(
+            "GET", f"{self.server.url}/missing", expected_status=404
+        )
+        responses = self.gevent_library_instance.run_coroutines()
+        self.assertListEqual(
+            [404, 404, 404], [response.status_code for response in responses]
+        )
+
+        self.gevent_library_instance.add_http_coroutine("GET", f"{self.server.url}/missing")
+        with self.assertRaises(AssertionError) as exp:
+            self.gevent_library_instance.run_coroutines()
+        self.assertEqual(
+            str(exp.exception), f"404 Not Found for GET {self.server.url}/missing"
+        )
+
+    def test_closed_connection_is_replaced(self):
+        """a kept connection closed meanwhile is replaced"""
+        pool = HttpConnectionPool()
+        self.addCleanup(pool.close)
+        pool.request("GET", self.server.url)
+        for connections in pool._idle.values():
+            for connection in connections:
+                connection.sock.close()
+        self.assertEqual(200, pool.request("GET", self.server.url).status_code)
+
+    def test_closed_connection_fails_non_idempotent_request(self):
+        """a request that may have reached the server is not sent again"""
+        pool = HttpConnectionPool()
+        self.addCleanup(pool.close)
+        pool.request("GET", self.server.url)
+        for connections in pool._idle.values():
+            for connection in connections:
+                connection.sock.close()
+        with self.assertRaises(OSError):
+            pool.request("POST", f"{self.server.url}/posts", body="a")
+        self.assertEqual(200, pool.request("POST", self.server.url).status_code)
+
+    def test_repeated_headers(self):
+        """the values of a repeated header are joined, whatever the case of its name"""
+        pool = HttpConnectionPool()
+        self.addCleanup(pool.close)
+        response = pool.request("GET", f"{self.server.url}/cookies")
+        self.assertEqual("a=1, b=2", response.headers["Set-Cookie"])
+        self.assertEqual("*", response.headers["Vary"])
+
+    def test_invalid_url(self):
+        """only http and https urls are supported"""
+        with self.assertRaises(ValueError):
+            HttpConnectionPool().request("GET", "ftp://localhost/file")
+
+
+if __name__ == "__main__":
+    main()
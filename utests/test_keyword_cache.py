@@ -0,0 +1,139 @@
+"""unittest module, resolving the keywords of a bundle once per run"""
+import sys
+from unittest import TestCase, mock, main
+
+import gevent
+
+sys.path.insert(0, "src")
+from GeventLibrary.execution import CoroutineRecord, CoroutineSpec, KeywordRunnerCache
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+
+def _in_coroutine(function):
+    """runs the function in the greenlet of a coroutine"""
+    return gevent.spawn(CoroutineRecord(CoroutineSpec("Sleep")).run, function).get()
+
+
+class _Namespace:
+    """resolves every name to a new runner, counting the searches"""
+
+    def __init__(self):
+        self.searches = []
+        self.search_order = ()
+
+    def get_runner(self, name, recommend_on_failure=True):
+        self.searches.append((name, recommend_on_failure))
+        return object()
+
+    def set_search_order(self, new_order):
+        old_order, self.search_order = self.search_order, new_order
+        return old_order
+
+
+class _OldNamespace(_Namespace):
+    """resolves names like robotframework 5, without recommendations"""
+
+    def get_runner(self, name):  # pylint: disable=arguments-differ
+        return super().get_runner(name)
+
+
+class TestKeywordRunnerCache(TestCase):
+    """This suite tests the keyword runners cache"""
+
+    def test_names_are_resolved_once(self):
+        """every coroutine gets the runner resolved when the bundle was run"""
+        namespace = _Namespace()
+        cache = KeywordRunnerCache.acquire(namespace, ["Sleep", "Sleep", "GET"])
+        runners = _in_coroutine(
+            lambda: [namespace.get_runner("Sleep") for _ in range(100)]
+        )
+        self.assertEqual(2, len(cache))
+        self.assertEqual([("Sleep", True), ("GET", True)], namespace.searches)
+        self.assertEqual(1, len(set(map(id, runners))))
+        cache.release()
+
+    def test_namespace_without_recommendations(self):
+        """namespaces that do not recommend keywords get the name only"""
+        namespace = _OldNamespace()
+        cache = KeywordRunnerCache.acquire(namespace, ["Sleep"])
+        namespace.get_runner("Log", False)
+        self.assertEqual([("Sleep", True), ("Log", True)], namespace.searches)
+        cache.release()
+
+    def test_other_names_are_searched(self):
+        """names outside of the bundle are searched by the namespace every time"""
+        namespace = _Namespace()
+        cache = KeywordRunnerCache.acquire(namespace, ["Sleep"])
+        namespace.get_runner("Log", False)
+        namespace.get_runner("Log", False)
+        self.assertEqual([("Sleep", True), ("Log", False), ("Log", False)], namespace.searches)
+        cache.release()
+
+    def test_regular_flow_is_searched(self):
+        """names of the bundle run outside of the coroutines are searched every time"""
+        namespace = _Namespace()
+        cache = KeywordRunnerCache.acquire(namespace, ["Sleep"])
+        namespace.get_runner("Sleep", False)
+        self.assertEqual([("Sleep", True), ("Sleep", False)], namespace.searches)
+        cache.release()
+
+    def test_search_order_empties_the_cache(self):
+        """the names are resolved again once the library search order changed"""
+        namespace = _Namespace()
+        set_search_order = namespace.set_search_order
+        cache = KeywordRunnerCache.acquire(namespace, ["Sleep"])
+        before = _in_coroutine(lambda: namespace.get_runner("Sleep"))
+        self.assertEqual((), namespace.set_search_order(("MyLibrary",)))
+        self.assertEqual(("MyLibrary",), namespace.search_order)
+        after = _in_coroutine(lambda: namespace.get_runner("Sleep"))
+        self.assertIsNot(before, after)
+        self.assertIs(after, _in_coroutine(lambda: namespace.get_runner("Sleep")))
+        self.assertEqual(2, len(namespace.searches))
+        cache.release()
+        self.assertEqual(set_search_order, namespace.set_search_order)
+
+    def test_namespace_is_restored(self):
+        """the namespace searches again after the last release"""
+        namespace = _Namespace()
+        first = KeywordRunnerCache.acquire(namespace, ["Sleep"])
+        second = KeywordRunnerCache.acquire(namespace, ["GET"])
+        self.assertIs(first, second)
+        first.release()
+        self.assertEqual(2, len(second))
+        second.release()
+        namespace.get_runner("Sleep")
+        self.assertEqual(3, len(namespace.searches))
+
+
+class TestBundleKeywords(TestCase):
+    """This suite tests the keywords cache of a bundle run"""
+
+    def setUp(self):
+        patchers = [
+            mock.patch("robot.libraries.BuiltIn.BuiltIn.run_keyword"),
+            mock.patch(
+                "robot.running.context.ExecutionContexts.current",
+                returned_Value="not null...",
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.gevent_library_instance = GeventKeywords()
+        self.gevent_library_instance.create_gevent_bundle(
+            alias="my_alias", result_keyword="Get Length"
+        )
+
+    def test_distinct_names_are_resolved(self):
+        """the keywords of the bundle and its result keyword are resolved once each"""
+        with mock.patch.object(KeywordRunnerCache, "acquire") as acquire:
+            for _ in range(10):
+                self.gevent_library_instance.add_coroutine("Sleep", "0")
+            self.gevent_library_instance.add_coroutine("No Operation")
+            self.gevent_library_instance.run_coroutines()
+        self.assertEqual(["Sleep", "No Operation", "Get Length"], acquire.call_args[0][1])
+        acquire.return_value.release.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    main()
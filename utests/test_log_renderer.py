@@ -0,0 +1,83 @@
+"""unittest module, rendering of coroutine keyword events"""
+import sys
+from types import SimpleNamespace
+from unittest import TestCase, mock, main
+
+sys.path.insert(0, "src")
+from GeventLibrary.execution import CoroutineLogRenderer
+
+
+def _keyword_item(status="PASS"):
+    return SimpleNamespace(
+        name="Sleep",
+        args=("1s", "<reason>"),
+        doc="Pauses the test executed for the given time.",
+        result=SimpleNamespace(status=status),
+    )
+
+
+class TestCoroutineLogRenderer(TestCase):
+    """This suite tests the different log levels of the renderer"""
+
+    def test_invalid_log_level(self):
+        """only NESTED, FULL, ONELINE and NONE are supported"""
+        with self.assertRaises(ValueError) as exp:
+            CoroutineLogRenderer("VERBOSE")
+        self.assertEqual(
+            str(exp.exception),
+            "'log_level' must be one of NESTED, FULL, ONELINE, NONE, got VERBOSE",
+        )
+
+    def test_full_level_renders_escaped_table(self):
+        """FULL level renders an html table, arguments are escaped"""
+        renderer = CoroutineLogRenderer("full")
+        html_text = renderer.render_end(_keyword_item("FAIL"))
+        self.assertIn("<td>Completed</td><td>Sleep</td>", html_text)
+        self.assertIn("1s   &lt;reason&gt;", html_text)
+        self.assertIn('<td class="status-fail">FAIL</td>', html_text)
+        self.assertNotIn("<style>", html_text)
+
+    def test_oneline_level_renders_plain_text(self):
+        """ONELINE level renders a single plain text line"""
+        renderer = CoroutineLogRenderer("ONELINE")
+        self.assertEqual(
+            "Started Sleep    1s   <reason>", renderer.render_start(_keyword_item())
+        )
+
+    def test_style_is_written_once_per_output(self):
+        """the stylesheet is written once per robot output,
+        regardless of the amount of keywords and renderers"""
+        context = mock.MagicMock()
+        with mock.patch("robot.api.logger.write") as write, mock.patch(
+            "robot.running.context.ExecutionContexts.current", context
+        ):
+            renderer = CoroutineLogRenderer()
+            renderer.write_style()
+            renderer.write_style()
+            renderer.start_keyword(_keyword_item())
+            CoroutineLogRenderer().end_keyword(_keyword_item())
+            context.output = mock.MagicMock()
+            renderer.write_style()
+        self.assertEqual(4, write.call_count)
+        self.assertIn("<style>", write.call_args_list[0].args[0])
+        self.assertIn("<style>", write.call_args_list[3].args[0])
+
+    def test_unhashable_arguments(self):
+        """arguments are rendered without being hashed"""
+        keyword_item = _keyword_item()
+        keyword_item.args = (["1s"], {"reason": "<done>"})
+        html_text = CoroutineLogRenderer("FULL").render_start(keyword_item)
+        self.assertIn("<td>['1s']   {'reason': '&lt;done&gt;'}</td>", html_text)
+
+    def test_none_level_logs_nothing(self):
+        """NONE level writes neither stylesheet nor keyword events"""
+        with mock.patch("robot.api.logger.write") as write:
+            renderer = CoroutineLogRenderer("NONE")
+            renderer.write_style()
+            renderer.start_keyword(_keyword_item())
+            renderer.end_keyword(_keyword_item())
+        write.assert_not_called()
+
+
+if __name__ == "__main__":
+    main()
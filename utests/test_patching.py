@@ -0,0 +1,106 @@
+"""unittest module, configurable monkey patching"""
+import os
+import subprocess
+import sys
+from unittest import TestCase, mock, main
+
+sys.path.insert(0, "src")
+from GeventLibrary.patching import DEFAULT_SUBSYSTEMS, MonkeyPatching
+
+
+class TestMonkeyPatching(TestCase):
+    """This suite tests when and what the library patches"""
+
+    def setUp(self):
+        self.patch_all = mock.patch("GeventLibrary.patching.monkey.patch_all").start()
+        mock.patch.object(MonkeyPatching, "patched", set()).start()
+        mock.patch.dict(os.environ).start()
+        os.environ.pop("GEVENT_LIBRARY_PATCH", None)
+        os.environ.pop("GEVENT_LIBRARY_PATCH_SUBSYSTEMS", None)
+        self.addCleanup(mock.patch.stopall)
+
+    def test_patched_by_the_moment(self):
+        """subsystems are patched once the configured moment is reached"""
+        patching = MonkeyPatching("run", ["socket", "ssl"])
+        patching.patch_by("init")
+        self.patch_all.assert_not_called()
+        patching.patch_by("run")
+        self.assertTrue(self.patch_all.call_args[1]["socket"])
+        self.assertTrue(self.patch_all.call_args[1]["ssl"])
+        self.assertFalse(self.patch_all.call_args[1]["time"])
+
+    def test_patched_once(self):
+        """patched subsystems are not patched again, by any instance"""
+        MonkeyPatching("init").patch_by("init")
+        MonkeyPatching().patch_by("init")
+        MonkeyPatching("init").patch_by("run")
+        self.assertEqual(1, self.patch_all.call_count)
+        self.assertFalse(self.patch_all.call_args[1]["thread"])
+        self.assertSetEqual(set(DEFAULT_SUBSYSTEMS), MonkeyPatching.patched)
+
+    def test_never(self):
+        """nothing is patched with never"""
+        MonkeyPatching("never").patch_by("run")
+        self.patch_all.assert_not_called()
+
+    def test_environment(self):
+        """the moment and subsystems default to the environment variables"""
+        os.environ["GEVENT_LIBRARY_PATCH"] = "init"
+        os.environ["GEVENT_LIBRARY_PATCH_SUBSYSTEMS"] = "Socket, dns"
+        patching = MonkeyPatching()
+        self.assertEqual("init", patching.moment)
+        self.assertListEqual(["socket", "dns"], patching.subsystems)
+
+    def test_patch_at_run_defers_the_patching(self):
+        """the library arguments decide the moment when the environment does not"""
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys; sys.path.insert(0, 'src'); from GeventLibrary import GeventLibrary; "
+                "from gevent import monkey; GeventLibrary(patch_at='run'); "
+                "print(monkey.is_anything_patched()); GeventLibrary(); "
+                "print(monkey.is_module_patched('socket'))",
+            ],
+            env=os.environ,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        self.assertListEqual(["False", "True"], output.split())
+
+    def test_invalid_values(self):
+        """unknown moments and subsystems are rejected"""
+        with self.assertRaises(ValueError) as exp:
+            MonkeyPatching("later")
+        self.assertEqual(
+            str(exp.exception), "'patch_at' must be one of init, run, never, got later"
+        )
+        with self.assertRaises(ValueError):
+            MonkeyPatching("import")
+        with self.assertRaises(ValueError):
+            MonkeyPatching("run", "socket,files")
+
+    def test_import_is_lazy(self):
+        """importing the library neither patches nor imports the execution machinery,
+        the patching module is imported without robot"""
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys; sys.path.insert(0, 'src'); import GeventLibrary.patching; "
+                "print('robot' in sys.modules); GeventLibrary.GeventLibrary; "
+                "from gevent import monkey; print(monkey.is_anything_patched(), "
+                "[name for name in sys.modules if name.startswith('GeventLibrary.execution')], "
+                "'gevent.pool' in sys.modules)",
+            ],
+            env=dict(os.environ, GEVENT_LIBRARY_PATCH="init"),
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        self.assertEqual("False\nFalse [] False", output.strip())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""unittest module, named gevent pools shared by bundles"""
+import sys
+from unittest import TestCase, mock, main
+
+import gevent
+
+sys.path.insert(0, "src")
+from GeventLibrary.exceptions import PoolAlreadyCreated
+from GeventLibrary.execution import RunSettings
+from GeventLibrary.gevent_library import GeventLibrary
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+
+class TestNamedPools(TestCase):
+    """This suite tests creation and usage of named pools"""
+
+    def setUp(self):
+        self.running = 0
+        self.max_running = 0
+
+        def _sleep(_, seconds):
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            gevent.sleep(float(seconds))
+            self.running -= 1
+            return seconds
+
+        patchers = [
+            mock.patch(
+                "robot.libraries.BuiltIn.BuiltIn.run_keyword", side_effect=_sleep
+            ),
+            mock.patch(
+                "robot.running.context.ExecutionContexts.current",
+                returned_Value="not null...",
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_pool_is_shared_between_bundles(self):
+        """the pool size limits the concurrency of all bundles using it"""
+        gevent_library_instance = GeventKeywords(pools={"backend": 2})
+        gevent_library_instance.create_gevent_bundle(alias="background")
+        for _ in range(3):
+            gevent_library_instance.add_coroutine("Sleep", "0.02")
+        gevent_library_instance.run_coroutines_as_completed(
+            settings=RunSettings(pool_name="backend")
+        )
+        gevent_library_instance.create_gevent_bundle(alias="foreground")
+        for _ in range(3):
+            gevent_library_instance.add_coroutine("Sleep", "0.01")
+        values = gevent_library_instance.run_coroutines(
+            settings=RunSettings(pool_name="backend")
+        )
+
+        self.assertListEqual(["0.01"] * 3, values)
+        self.assertEqual(2, self.max_running)
+        gevent_library_instance.clear_all_bundles()
+
+    def test_pool_from_library_import(self):
+        """pools can be created when the library is imported"""
+        gevent_library = GeventLibrary(pools={"backend": 1})
+        gevent_library.run_keyword("create_gevent_bundle", [], {})
+        gevent_library.run_keyword("add_coroutine", ["Sleep", "0"], {})
+        settings = gevent_library.run_keyword(
+            "create_run_settings", [], {"pool_name": "backend"}
+        )
+        values = gevent_library.run_keyword(
+            "run_coroutines", [], {"settings": settings}
+        )
+        self.assertListEqual(["0"], values)
+
+    def test_pool_already_created(self):
+        """pool names are unique"""
+        gevent_library_instance = GeventKeywords()
+        gevent_library_instance.create_gevent_pool("backend", 1)
+        with self.assertRaises(PoolAlreadyCreated) as exp:
+            gevent_library_instance.create_gevent_pool("backend", 2)
+        self.assertEqual(
+            str(exp.exception), "A pool with name backend has already been created."
+        )
+
+    def test_pool_not_found(self):
+        """running with an unknown or removed pool raises a LookupError"""
+        gevent_library_instance = GeventKeywords()
+        gevent_library_instance.create_gevent_pool("backend", 1)
+        gevent_library_instance.remove_gevent_pool("backend")
+        gevent_library_instance.create_gevent_bundle()
+        gevent_library_instance.add_coroutine("Sleep", "0")
+        with self.assertRaises(LookupError) as exp:
+            gevent_library_instance.run_coroutines(
+                settings=RunSettings(pool_name="backend")
+            )
+        self.assertEqual(str(exp.exception), "Pool with name backend was not found")
+
+    def test_pool_name_and_pool_size(self):
+        """a named pool cannot be combined with a pool size"""
+        gevent_library_instance = GeventKeywords(pools={"backend": 1})
+        gevent_library_instance.create_gevent_bundle()
+        gevent_library_instance.add_coroutine("Sleep", "0")
+        with self.assertRaises(ValueError):
+            gevent_library_instance.run_coroutines(
+                gevent_pool_size=2, settings=RunSettings(pool_name="backend")
+            )
+
+
+if __name__ == "__main__":
+    main()
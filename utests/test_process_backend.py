@@ -0,0 +1,111 @@
+"""unittest module, process backend of bundle execution"""
+import sys
+from time import monotonic
+from types import SimpleNamespace
+from unittest import TestCase, mock, main
+
+sys.path.insert(0, "src")
+from GeventLibrary.exceptions import UnsupportedRobotVersion
+from GeventLibrary.execution import ProcessBackend, RunSettings, resolve_invocation
+from GeventLibrary.execution.process_backend import ProcessInvocation
+from GeventLibrary.execution.records import CoroutineRecord, CoroutineSpec
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+
+def _invocation(library, method, *args):
+    return ProcessInvocation(library, None, (), (), method, args, ())
+
+
+class TestProcessBackend(TestCase):
+    """This suite tests running invocations in worker processes"""
+
+    def test_values_in_bundle_order(self):
+        """values of all workers are merged by the bundle order"""
+        invocations = [
+            _invocation("robot.libraries.String", "convert_to_upper_case", text)
+            for text in ("a", "b", "c")
+        ]
+        records = [CoroutineRecord(CoroutineSpec("Convert To Upper Case")) for _ in invocations]
+        results = ProcessBackend(2).run(invocations, records, timeout=60)
+        self.assertListEqual(["A", "B", "C"], [result.value for result in results])
+        self.assertListEqual(["PASS"] * 3, [record.status for record in records])
+
+    def test_failure_is_returned(self):
+        """exceptions raised in the worker are sent back"""
+        invocations = [_invocation("robot.libraries.String", "should_be_string", 1)]
+        records = [CoroutineRecord(CoroutineSpec("Should Be String"))]
+        results = ProcessBackend(1).run(invocations, records, timeout=60)
+        self.assertEqual("FAIL", results[0].status)
+        self.assertIsInstance(results[0].value, Exception)
+
+    def test_stragglers_are_killed(self):
+        """invocations not completed within the timeout have no result"""
+        invocations = [_invocation("gevent", "sleep", 30)]
+        records = [CoroutineRecord(CoroutineSpec("Sleep"))]
+        results = ProcessBackend(1).run(invocations, records, timeout=1)
+        self.assertListEqual([None], results)
+
+    def test_workers_are_reaped_on_failure(self):
+        """a failing slice aborts the other workers, every killed process is reaped"""
+        started = []
+
+        class FailingBackend(ProcessBackend):
+            """the first slice fails while the other one is still running"""
+
+            def _start(self, worker):
+                process = super()._start(worker)
+                started.append(process)
+                return process
+
+            def _communicate(self, worker, invocation_slice):
+                if worker is started[0]:
+                    raise RuntimeError("slice failed")
+                return super()._communicate(worker, invocation_slice)
+
+        invocations = [_invocation("gevent", "sleep", 30) for _ in range(2)]
+        records = [CoroutineRecord(CoroutineSpec("Sleep")) for _ in invocations]
+        launched = monotonic()
+        with self.assertRaises(RuntimeError):
+            FailingBackend(2).run(invocations, records, timeout=60)
+        self.assertLess(monotonic() - launched, 10)
+        self.assertEqual(2, len(started))
+        self.assertIsNotNone(started[1].returncode)
+
+    def test_unsupported_robot_version(self):
+        """robot's private handler attributes are only used by the checked versions"""
+        with mock.patch("GeventLibrary.execution.robot_internals.VERSION", "7.0"):
+            with self.assertRaises(UnsupportedRobotVersion):
+                resolve_invocation(SimpleNamespace(), "Log", [])
+
+    def test_user_keywords_are_rejected(self):
+        """only library keywords can run in worker processes"""
+        context = SimpleNamespace(
+            namespace=SimpleNamespace(get_runner=lambda name: SimpleNamespace())
+        )
+        with self.assertRaises(ValueError) as exp:
+            resolve_invocation(context, "My Keyword", [])
+        self.assertEqual(
+            str(exp.exception),
+            "'My Keyword' is not a library keyword, "
+            "only library keywords can run with the process backend",
+        )
+
+    def test_unknown_backend(self):
+        """only gevent, process and remote backends are supported"""
+        with mock.patch(
+            "robot.running.context.ExecutionContexts.current",
+            returned_Value="not null...",
+        ), self.assertRaises(ValueError) as exp:
+            gevent_library_instance = GeventKeywords()
+            gevent_library_instance.create_gevent_bundle()
+            gevent_library_instance.add_coroutine("Log", "Hello World1")
+            gevent_library_instance.run_coroutines(
+                settings=RunSettings(backend="threads")
+            )
+        self.assertEqual(
+            str(exp.exception), "'backend' must be one of gevent, process, remote, got threads"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""unittest module, live progress reporting of bundle runs"""
+import json
+import os
+import sys
+import tempfile
+from unittest import TestCase, mock, main
+
+import gevent
+from gevent import GreenletExit
+from robot.errors import HandlerExecutionFailed
+from robot.utils.error import ErrorDetails
+
+sys.path.insert(0, "src")
+from GeventLibrary.exceptions import CoroutinesFailed
+from GeventLibrary.execution import ProgressReporting, RunSettings
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+
+class _Listener:
+    def __init__(self):
+        self.reports = []
+
+    def bundle_progress(self, progress):
+        """keeps the reports"""
+        self.reports.append(progress)
+
+
+class TestProgressReporting(TestCase):
+    """This suite tests that the progress of a run is reported while it runs"""
+
+    def setUp(self):
+        def _run_keyword(name, *_):
+            try:
+                gevent.sleep(5 if name == "Slow" else 0.01)
+            except GreenletExit:
+                # robot reports a killed keyword as a failure of its own
+                raise HandlerExecutionFailed(ErrorDetails())  # pylint: disable=raise-missing-from
+            if name == "Fail":
+                raise AssertionError("failed")
+
+        patchers = [
+            mock.patch(
+                "robot.libraries.BuiltIn.BuiltIn.run_keyword", side_effect=_run_keyword
+            ),
+            mock.patch(
+                "robot.running.context.ExecutionContexts.current",
+                returned_Value="not null...",
+            ),
+            mock.patch.object(gevent.get_hub(), "print_exception"),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        console_patcher = mock.patch("robot.api.logger.console")
+        self.console = console_patcher.start()
+        self.addCleanup(console_patcher.stop)
+        self.gevent_library_instance = GeventKeywords()
+        self.gevent_library_instance.create_gevent_bundle(alias="my_alias")
+
+    def test_reports_while_running(self):
+        """the listener gets periodic reports and a final one with all coroutines completed"""
+        listener = _Listener()
+        self.gevent_library_instance.add_coroutines("Sleep", count=20)
+        self.gevent_library_instance.run_coroutines(
+            gevent_pool_size=2,
+            settings=RunSettings(
+                progress=ProgressReporting(
+                    interval=0.02, console=False, listener=listener
+                )
+            ),
+        )
+
+        self.assertGreater(len(listener.reports), 2)
+        completed = [report["completed"] for report in listener.reports]
+        self.assertListEqual(sorted(completed), completed)
+        self.assertTrue(any(report["running"] for report in listener.reports[:-1]))
+        final = listener.reports[-1]
+        self.assertEqual(20, final["completed"])
+        self.assertEqual(0, final["running"])
+        self.assertEqual(0, final["pending"])
+        self.assertEqual(0.0, final["eta"])
+        self.assertEqual("my_alias", final["alias"])
+
+    def test_failures_are_counted(self):
+        """failed coroutines are counted as completed and failed"""
+        listener = _Listener()
+        self.gevent_library_instance.add_coroutines("Sleep", count=3)
+        self.gevent_library_instance.add_coroutine("Fail")
+        with self.assertRaises(AssertionError):
+            self.gevent_library_instance.run_coroutines(
+                settings=RunSettings(
+                    progress=ProgressReporting(console=False, listener=listener)
+                )
+            )
+
+        self.assertEqual(4, listener.reports[-1]["completed"])
+        self.assertEqual(1, listener.reports[-1]["failed"])
+
+    def test_killed_coroutines_are_not_failures(self):
+        """coroutines killed by fail-fast are completed, only the real failure is counted"""
+        listener = _Listener()
+        self.gevent_library_instance.add_coroutine("Fail")
+        self.gevent_library_instance.add_coroutines("Slow", count=2)
+        with self.assertRaises(CoroutinesFailed):
+            self.gevent_library_instance.run_coroutines(
+                settings=RunSettings(
+                    fail_fast=True,
+                    progress=ProgressReporting(console=False, listener=listener),
+                )
+            )
+
+        self.assertEqual(3, listener.reports[-1]["completed"])
+        self.assertEqual(1, listener.reports[-1]["failed"])
+
+    def test_reports_to_console_and_file(self):
+        """reports are written to the console and appended to the json lines file"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "progress.jsonl")
+            self.gevent_library_instance.add_coroutines("Sleep", count=5)
+            self.gevent_library_instance.run_coroutines(
+                settings=RunSettings(
+                    progress=self.gevent_library_instance.create_progress_reporting(
+                        path=path
+                    )
+                )
+            )
+            with open(path, encoding="utf-8") as jsonl:
+                reports = [json.loads(line) for line in jsonl]
+
+        self.assertEqual(5, reports[-1]["completed"])
+        self.assertIn("5/5 completed, 0 failed", self.console.call_args[0][0])
+
+    def test_invalid_settings(self):
+        """the interval must be positive and the listener must have a bundle_progress method"""
+        with self.assertRaises(ValueError):
+            ProgressReporting(interval=0)
+        with self.assertRaises(ValueError):
+            ProgressReporting(listener=object())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""unittest module, remote backend of bundle execution"""
+import os
+import sys
+from unittest import TestCase, main
+
+from gevent.subprocess import PIPE, Popen
+
+sys.path.insert(0, "src")
+from GeventLibrary.execution import RemoteBackend
+from GeventLibrary.execution.process_backend import ProcessInvocation
+from GeventLibrary.execution.records import CoroutineRecord, CoroutineSpec
+from GeventLibrary.execution.remote_backend import KEY_VARIABLE
+
+KEY = "unittest-key"
+
+
+def _invocation(library, method, *args):
+    return ProcessInvocation(library, None, (), (), method, args, ())
+
+
+def _start_worker(key=KEY):
+    env = dict(os.environ)
+    env[KEY_VARIABLE] = key
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    worker = Popen(
+        [sys.executable, "-m", "GeventLibrary.execution.remote_worker", "--port", "0"],
+        stdout=PIPE,
+        env=env,
+    )
+    # Serving on host:port
+    address = worker.stdout.readline().decode().split()[-1]
+    return worker, address
+
+
+class TestRemoteBackend(TestCase):
+    """This suite tests running invocations on worker nodes over localhost"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.workers = [_start_worker() for _ in range(2)]
+        cls.addresses = [address for _, address in cls.workers]
+
+    @classmethod
+    def tearDownClass(cls):
+        for worker, _ in cls.workers:
+            worker.kill()
+            worker.wait()
+            worker.stdout.close()
+
+    def test_values_in_bundle_order(self):
+        """values and statuses of all the nodes are merged by the bundle order"""
+        invocations = [
+            _invocation("robot.libraries.String", "convert_to_upper_case", text)
+            for text in ("a", "b", "c", "d", "e")
+        ]
+        records = [CoroutineRecord(CoroutineSpec("Convert To Upper Case")) for _ in invocations]
+        results = RemoteBackend(",".join(self.addresses), KEY).run(invocations, records, 60)
+        self.assertListEqual(
+            ["A", "B", "C", "D", "E"], [result.value for result in results]
+        )
+        self.assertListEqual(["PASS"] * 5, [record.status for record in records])
+
+    def test_messages_and_failures_are_returned(self):
+        """messages logged and exceptions raised on the node are sent back"""
+        invocations = [
+            _invocation("robot.libraries.BuiltIn", "log", "Hello World"),
+            _invocation("robot.libraries.String", "should_be_string", 1),
+        ]
+        records = [CoroutineRecord(CoroutineSpec("Log")), CoroutineRecord(CoroutineSpec("Should Be String"))]
+        results = RemoteBackend(self.addresses, KEY).run(invocations, records, 60)
+        self.assertEqual("PASS", results[0].status)
+        self.assertEqual([("Hello World", "INFO", False)], results[0].messages)
+        self.assertEqual("FAIL", results[1].status)
+        self.assertIsInstance(results[1].value, Exception)
+
+    def test_stragglers_are_killed(self):
+        """invocations not completed within the timeout have no result,
+        the node keeps serving"""
+        invocations = [_invocation("gevent", "sleep", 30)]
+        records = [CoroutineRecord(CoroutineSpec("Sleep"))]
+        backend = RemoteBackend(self.addresses[:1], KEY)
+        self.assertListEqual([None], backend.run(invocations, records, timeout=1))
+
+        invocations = [_invocation("robot.libraries.String", "convert_to_upper_case", "a")]
+        self.assertEqual("A", backend.run(invocations, records, timeout=60)[0].value)
+
+    def test_unreachable_worker(self):
+        """a node that does not listen is reported"""
+        with self.assertRaises(ConnectionError):
+            RemoteBackend(["127.0.0.1:1"], KEY).run(
+                [_invocation("gevent", "sleep", 0)], [CoroutineRecord(CoroutineSpec("Sleep"))], 1
+            )
+
+    def test_invalid_addresses(self):
+        """addresses must have a host and a port"""
+        with self.assertRaises(ValueError) as exp:
+            RemoteBackend("localhost", KEY)
+        self.assertEqual(
+            str(exp.exception),
+            "'remote_workers' must be addresses of the form host:port, got localhost",
+        )
+        with self.assertRaises(ValueError):
+            RemoteBackend([], KEY)
+
+    def test_wrong_key_is_rejected(self):
+        """a node only serves a suite that proves it has the shared key"""
+        backend = RemoteBackend(self.addresses[:1], "wrong-key")
+        with self.assertRaises(PermissionError) as exp:
+            backend.run([_invocation("gevent", "sleep", 0)], [CoroutineRecord(CoroutineSpec("Sleep"))], 10)
+        self.assertIn("rejected the shared key", str(exp.exception))
+
+    def test_key_is_required(self):
+        """the key is taken from the environment when it is not given"""
+        environ = dict(os.environ)
+        try:
+            os.environ.pop(KEY_VARIABLE, None)
+            with self.assertRaises(ValueError):
+                RemoteBackend(self.addresses)
+            os.environ[KEY_VARIABLE] = KEY
+            RemoteBackend(self.addresses).run(
+                [_invocation("gevent", "sleep", 0)], [CoroutineRecord(CoroutineSpec("Sleep"))], 10
+            )
+        finally:
+            os.environ.clear()
+            os.environ.update(environ)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""unittest module, buffering coroutine results into nested keywords"""
+import sys
+from types import SimpleNamespace
+from unittest import TestCase, mock, main
+
+import gevent
+from robot.output import LOGGER
+
+sys.path.insert(0, "src")
+from GeventLibrary.execution import (
+    CoroutineLogRenderer,
+    CoroutineOutputRouter,
+    CoroutineResultBuffer,
+)
+from GeventLibrary.execution import acquire_robot_ctx
+
+
+def _keyword_item(name):
+    return SimpleNamespace(name=name, args=(), doc="", result=SimpleNamespace(status="PASS"))
+
+
+class TestCoroutineResultBuffer(TestCase):
+    """This suite tests the replay of buffered events"""
+
+    def test_events_are_replayed_in_order(self):
+        """events are written in the order they were recorded and the buffer is emptied"""
+        buffer = CoroutineResultBuffer()
+        outer, inner = _keyword_item("outer"), _keyword_item("inner")
+        buffer.start_keyword(outer)
+        buffer.start_keyword(inner)
+        buffer.log_message("message")
+        buffer.end_keyword(inner)
+        buffer.end_keyword(outer)
+        written = []
+        buffer.replay(
+            lambda kw: written.append(("start", kw.name)),
+            lambda kw: written.append(("end", kw.name)),
+            lambda msg: written.append(("message", msg)),
+        )
+        self.assertEqual(
+            [
+                ("start", "outer"),
+                ("start", "inner"),
+                ("message", "message"),
+                ("end", "inner"),
+                ("end", "outer"),
+            ],
+            written,
+        )
+        self.assertEqual(0, len(buffer))
+
+    def test_open_keywords_are_ended(self):
+        """keywords of a killed coroutine that never ended are ended on replay"""
+        buffer = CoroutineResultBuffer()
+        buffer.start_keyword(_keyword_item("outer"))
+        buffer.start_keyword(_keyword_item("inner"))
+        ended = []
+        buffer.replay(lambda kw: None, lambda kw: ended.append(kw.name), lambda msg: None)
+        self.assertEqual(["inner", "outer"], ended)
+
+
+class TestNestedRouting(TestCase):
+    """This suite tests the routing of bundle greenlets events into result buffers"""
+
+    def setUp(self):
+        self.output = mock.MagicMock()
+        self.written = self.output.written = []
+        self.output.start_keyword = lambda kw: self.written.append(("start", kw.name))
+        self.output.end_keyword = lambda kw: self.written.append(("end", kw.name))
+        self.router = CoroutineOutputRouter.acquire(self.output)
+        self.addCleanup(self.router.release)
+        # messages that reach robot's logger are recorded instead
+        self.router._log_message = lambda msg, *args: self.written.append(("message", msg))
+        self.renderer = CoroutineLogRenderer("NESTED")
+
+    def _coroutine(self, name, seconds):
+        self.output.start_keyword(_keyword_item(name))
+        gevent.sleep(seconds)
+        LOGGER._log_message(f"{name} logged")
+        self.output.end_keyword(_keyword_item(name))
+
+    def test_coroutines_are_written_whole(self):
+        """interleaving coroutines are written one after the other, each when it completes"""
+        jobs = [
+            self.router.spawn(gevent.spawn, self.renderer, self._coroutine, "slow", 0.02),
+            self.router.spawn(gevent.spawn, self.renderer, self._coroutine, "fast", 0.01),
+        ]
+        gevent.joinall(jobs)
+        self.assertEqual(
+            [
+                ("start", "fast"),
+                ("message", "fast logged"),
+                ("end", "fast"),
+                ("start", "slow"),
+                ("message", "slow logged"),
+                ("end", "slow"),
+            ],
+            self.written,
+        )
+
+    def test_regular_flow_is_not_buffered(self):
+        """messages of greenlets outside of bundles go straight to the output"""
+        job = self.router.spawn(gevent.spawn, self.renderer, self._coroutine, "co", 0.02)
+        LOGGER._log_message("main logged")
+        self.assertEqual([("message", "main logged")], self.written)
+        job.join()
+
+    def test_deferred_flush(self):
+        """with deferred flushing the results are written only when flushed"""
+        job = self.router.spawn(
+            gevent.spawn, self.renderer, self._coroutine, "co", 0, defer_flush=True
+        )
+        job.join()
+        gevent.sleep(0)
+        self.assertEqual([], self.written)
+        self.router.flush(job)
+        self.assertEqual(("start", "co"), self.written[0])
+        self.assertEqual(3, len(self.written))
+
+    def test_killed_coroutine_is_settled(self):
+        """results of killed coroutines are written as soon as they are settled"""
+        job = self.router.spawn(gevent.spawn, self.renderer, self._coroutine, "co", 10)
+        gevent.sleep(0)
+        gevent.killall([job])
+        self.router.settle([job])
+        self.assertEqual([("start", "co"), ("end", "co")], self.written)
+
+
+class TestAcquireRollback(TestCase):
+    """This suite tests that a failing preparation of robot's context is rolled back"""
+
+    def test_router_released_when_stacks_fail(self):
+        """the router is removed from the output when acquiring the stacks raises"""
+        output = mock.MagicMock()
+        start_keyword = output.start_keyword
+        context = SimpleNamespace(output=output, asynchronous=None, namespace=None)
+        with mock.patch(
+            "robot.running.context.ExecutionContexts.current", context
+        ), mock.patch(
+            "GeventLibrary.execution.CoroutineContextStacks.acquire",
+            side_effect=AttributeError("steps"),
+        ):
+            with self.assertRaises(AttributeError):
+                acquire_robot_ctx(["Sleep"])
+
+        self.assertIs(start_keyword, output.start_keyword)
+        self.assertNotIn(id(output), CoroutineOutputRouter._routers)
+        self.assertNotIn("_log_message", LOGGER.__dict__)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""unittest module, reducing and discarding the values of the coroutines"""
+import sys
+from unittest import TestCase, mock, main
+
+import gevent
+
+sys.path.insert(0, "src")
+from GeventLibrary.execution import RunSettings
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+
+def _run_keyword(name, *args):
+    if name == "Get Length":
+        if args[0] == "FAIL":
+            raise ValueError("some value error...")
+        return len(args[0])
+    gevent.sleep(0)
+    return args[0]
+
+
+class TestResultValues(TestCase):
+    """This suite tests the result keyword and discarded values of a bundle"""
+
+    def setUp(self):
+        patchers = [
+            mock.patch(
+                "robot.libraries.BuiltIn.BuiltIn.run_keyword",
+                side_effect=_run_keyword,
+            ),
+            mock.patch(
+                "robot.running.context.ExecutionContexts.current",
+                returned_Value="not null...",
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.gevent_library_instance = GeventKeywords()
+
+    def _add_coroutines(self, *values):
+        for value in values:
+            self.gevent_library_instance.add_coroutine("Set Variable", value)
+
+    def test_result_keyword(self):
+        """every value is replaced by the value of the result keyword"""
+        self.gevent_library_instance.create_gevent_bundle(
+            alias="my_alias", result_keyword="Get Length"
+        )
+        self._add_coroutines("a" * 10, "b" * 1000)
+        self.assertEqual([10, 1000], self.gevent_library_instance.run_coroutines())
+
+    def test_result_keyword_failure(self):
+        """a coroutine whose result keyword fails is failed"""
+        self.gevent_library_instance.create_gevent_bundle(
+            alias="my_alias", result_keyword="Get Length"
+        )
+        self._add_coroutines("FAIL", "PASS")
+        with self.assertRaises(ValueError):
+            self.gevent_library_instance.run_coroutines()
+        self.assertEqual(
+            {"FAIL": 1, "PASS": 1},
+            self.gevent_library_instance.get_bundle_statistics()["statuses"],
+        )
+
+    def test_discarded_values(self):
+        """without values the number of coroutines by status is returned"""
+        self.gevent_library_instance.create_gevent_bundle(
+            alias="my_alias", keep_values=False
+        )
+        self._add_coroutines(*["a" * 100] * 50)
+        self.assertEqual({"PASS": 50}, self.gevent_library_instance.run_coroutines())
+
+    def test_discarded_values_in_background(self):
+        """`Wait For Coroutines` follows the bundle as well"""
+        self.gevent_library_instance.create_gevent_bundle(
+            alias="my_alias", keep_values=False
+        )
+        self._add_coroutines("a", "b")
+        handle = self.gevent_library_instance.start_coroutines()
+        self.assertEqual(
+            {"PASS": 2}, self.gevent_library_instance.wait_for_coroutines(handle)
+        )
+
+    def test_process_backend_rejects_result_keyword(self):
+        """the result keyword runs only on the gevent backend"""
+        self.gevent_library_instance.create_gevent_bundle(
+            alias="my_alias", result_keyword="Get Length"
+        )
+        self._add_coroutines("a")
+        with self.assertRaises(ValueError):
+            self.gevent_library_instance.run_coroutines(
+                settings=RunSettings(backend="process")
+            )
+
+
+if __name__ == "__main__":
+    main()
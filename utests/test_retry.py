@@ -0,0 +1,139 @@
+"""unittest module, retrying failed coroutines"""
+import sys
+from unittest import TestCase, mock, main
+
+import gevent
+from gevent import GreenletExit
+from robot.errors import HandlerExecutionFailed
+from robot.utils import ErrorDetails
+
+sys.path.insert(0, "src")
+from GeventLibrary.exceptions import CoroutinesTimedOut
+from GeventLibrary.execution import RetryPolicy, RunSettings
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+
+def _robot_sleep(seconds):
+    """sleeps like a keyword run by robot, which wraps the kill of its greenlet as a failure"""
+    try:
+        gevent.sleep(seconds)
+    except GreenletExit:
+        raise HandlerExecutionFailed(ErrorDetails())  # pylint: disable=raise-missing-from
+
+
+class TestRetryPolicy(TestCase):
+    """This suite tests retry policies of coroutines"""
+
+    def setUp(self):
+        self.calls = {}
+
+        def _flaky(_, name, failures):
+            self.calls[name] = self.calls.get(name, 0) + 1
+            if self.calls[name] <= int(failures):
+                raise ConnectionError(f"{name} attempt {self.calls[name]}")
+            return name
+
+        patchers = [
+            mock.patch("robot.libraries.BuiltIn.BuiltIn.run_keyword", side_effect=_flaky),
+            mock.patch(
+                "robot.running.context.ExecutionContexts.current",
+                returned_Value="not null...",
+            ),
+            mock.patch("robot.api.logger.write"),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.gevent_library_instance = GeventKeywords()
+        self.gevent_library_instance.create_gevent_bundle(alias="my_alias")
+
+    def test_only_failed_coroutine_is_retried(self):
+        """the bundle policy retries the failing coroutine only"""
+        policy = self.gevent_library_instance.create_retry_policy(
+            max_attempts=3, backoff=0.001
+        )
+        self.gevent_library_instance.add_coroutine("Flaky", "a", "2")
+        self.gevent_library_instance.add_coroutine("Flaky", "b", "0")
+        values = self.gevent_library_instance.run_coroutines(
+            settings=RunSettings(retry_policy=policy)
+        )
+        stats = self.gevent_library_instance.get_bundle_statistics()
+
+        self.assertListEqual(["a", "b"], values)
+        self.assertDictEqual({"a": 3, "b": 1}, self.calls)
+        self.assertEqual(2, stats["retries"])
+
+    def test_attempts_are_exhausted(self):
+        """the last error is raised once all attempts failed"""
+        self.gevent_library_instance.add_coroutine(
+            "Flaky", "a", "5", retry_policy=RetryPolicy(2, 0)
+        )
+        with self.assertRaises(ConnectionError) as exp:
+            self.gevent_library_instance.run_coroutines()
+        self.assertEqual(str(exp.exception), "a attempt 2")
+
+    def test_coroutine_policy_overrides_bundle_policy(self):
+        """a policy given to Add Coroutines is used instead of the bundle's policy"""
+        self.gevent_library_instance.add_coroutines(
+            "Flaky", arg_sets=[["a", "1"], ["b", "1"]], retry_policy=RetryPolicy(2, 0)
+        )
+        self.gevent_library_instance.run_coroutines(
+            settings=RunSettings(retry_policy=RetryPolicy(1))
+        )
+        self.assertDictEqual({"a": 2, "b": 2}, self.calls)
+
+    def test_retry_on_patterns(self):
+        """only errors matching the patterns are retried"""
+        policy = self.gevent_library_instance.create_retry_policy(
+            "ValueError*", max_attempts=3, backoff=0, jitter=False
+        )
+        self.assertTrue(policy.should_retry(ValueError("bad value")))
+        self.assertFalse(policy.should_retry(ConnectionError("refused")))
+        self.assertTrue(RetryPolicy(retry_on="*refused").should_retry(OSError("refused")))
+
+    def test_exponential_backoff(self):
+        """the delay is doubled on every retry, up to max_backoff"""
+        policy = RetryPolicy(10, backoff=0.1, max_backoff=0.3, jitter=False)
+        self.assertListEqual(
+            [0.1, 0.2, 0.3, 0.3], [policy.delay(retry) for retry in range(1, 5)]
+        )
+        with self.assertRaises(ValueError):
+            RetryPolicy(0)
+
+    def test_wrapped_kill_is_not_retried(self):
+        """a kill wrapped by robot is raised as is, without another attempt"""
+        calls = []
+
+        def _killed():
+            calls.append(1)
+            try:
+                raise GreenletExit()
+            except GreenletExit:
+                raise HandlerExecutionFailed(ErrorDetails())  # pylint: disable=raise-missing-from
+
+        with self.assertRaises(HandlerExecutionFailed):
+            RetryPolicy(3, 0).call(_killed)
+        self.assertEqual(1, len(calls))
+
+    def test_timed_out_coroutine_is_not_retried(self):
+        """a coroutine killed by the timeout is not run again by its policy"""
+        calls = []
+
+        def _sleep(_, seconds):
+            calls.append(seconds)
+            _robot_sleep(float(seconds))
+
+        with mock.patch(
+            "robot.libraries.BuiltIn.BuiltIn.run_keyword", side_effect=_sleep
+        ):
+            self.gevent_library_instance.add_coroutine("Sleep", "0.2")
+            with self.assertRaises(CoroutinesTimedOut):
+                self.gevent_library_instance.run_coroutines(
+                    timeout=0.05, settings=RunSettings(retry_policy=RetryPolicy(3, 0))
+                )
+
+        self.assertEqual(["0.2"], calls)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""unittest module, pacing of coroutines starts"""
+import gc
+import sys
+from time import monotonic
+from unittest import TestCase, mock, main
+
+sys.path.insert(0, "src")
+from GeventLibrary.execution import RunSettings, SpawnScheduler, TokenBucket
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+
+class TestSpawnScheduling(TestCase):
+    """This suite tests rate limiting, ramp up and jitter of coroutines starts"""
+
+    def setUp(self):
+        self.starts = []
+
+        def _record_start(*_):
+            self.starts.append(monotonic())
+
+        patchers = [
+            mock.patch(
+                "robot.libraries.BuiltIn.BuiltIn.run_keyword", side_effect=_record_start
+            ),
+            mock.patch(
+                "robot.running.context.ExecutionContexts.current",
+                returned_Value="not null...",
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.gevent_library_instance = GeventKeywords()
+        self.gevent_library_instance.create_gevent_bundle(alias="my_alias")
+        for _ in range(5):
+            self.gevent_library_instance.add_coroutine("No Operation")
+        # a full collection of the garbage left by earlier tests would skew the measured gaps
+        gc.collect()
+
+    def _gaps(self):
+        return [later - earlier for earlier, later in zip(self.starts, self.starts[1:])]
+
+    def test_rate(self):
+        """with rate, starts are spaced by at least 1/rate seconds"""
+        self.gevent_library_instance.run_coroutines(settings=RunSettings(rate=100))
+        self.assertEqual(5, len(self.starts))
+        self.assertTrue(all(gap > 0.008 for gap in self._gaps()), self._gaps())
+
+    def test_ramp_up(self):
+        """with ramp up, starts are spread linearly"""
+        self.gevent_library_instance.run_coroutines(settings=RunSettings(ramp_up=0.1))
+        self.assertGreater(self.starts[-1] - self.starts[0], 0.075)
+        self.assertTrue(all(gap > 0.015 for gap in self._gaps()), self._gaps())
+
+    def test_jitter(self):
+        """with jitter, starts are delayed by no more than the jitter"""
+        started = monotonic()
+        self.gevent_library_instance.run_coroutines(settings=RunSettings(jitter=0.05))
+        self.assertEqual(5, len(self.starts))
+        self.assertLess(max(self.starts) - started, 0.1)
+
+    def test_negative_values(self):
+        """pacing values cannot be negative"""
+        with self.assertRaises(ValueError) as exp:
+            self.gevent_library_instance.run_coroutines(settings=RunSettings(rate=-1))
+        self.assertEqual(str(exp.exception), "'rate' must be a non negative value, got -1")
+
+    def test_token_bucket_burst(self):
+        """a burst is allowed immediately, then tokens are added by the rate"""
+        bucket = TokenBucket(rate=20, burst=3)
+        started = monotonic()
+        for _ in range(4):
+            bucket.acquire()
+        elapsed = monotonic() - started
+        self.assertGreater(elapsed, 0.04)
+        self.assertLess(elapsed, 0.2)
+        self.assertFalse(SpawnScheduler(1).active)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""unittest module, timing statistics of bundle runs"""
+import csv
+import json
+import os
+import sys
+import tempfile
+from unittest import TestCase, mock, main
+
+import gevent
+from robot.errors import HandlerExecutionFailed
+from robot.utils import ErrorDetails
+
+sys.path.insert(0, "src")
+from GeventLibrary.execution import RunSettings
+from GeventLibrary.execution.statistics import percentile
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+
+def _sleep_or_fail(_, seconds, value="PASS"):
+    try:
+        gevent.sleep(float(seconds))
+    except gevent.GreenletExit:
+        # robot wraps the kill of a keyword in a failure
+        raise HandlerExecutionFailed(ErrorDetails())  # pylint: disable=raise-missing-from
+    if value == "FAIL":
+        raise ValueError("some value error...")
+    return value
+
+
+class TestBundleStatistics(TestCase):
+    """This suite tests `Get Bundle Statistics` and `Save Bundle Statistics`"""
+
+    def setUp(self):
+        patchers = [
+            mock.patch(
+                "robot.libraries.BuiltIn.BuiltIn.run_keyword",
+                side_effect=_sleep_or_fail,
+            ),
+            mock.patch(
+                "robot.running.context.ExecutionContexts.current",
+                returned_Value="not null...",
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.gevent_library_instance = GeventKeywords()
+        self.gevent_library_instance.create_gevent_bundle(alias="my_alias")
+
+    def test_percentile(self):
+        """nearest rank percentiles"""
+        values = list(range(1, 101))
+        self.assertEqual(50, percentile(values, 50))
+        self.assertEqual(95, percentile(values, 95))
+        self.assertEqual(1, percentile([1], 99))
+        self.assertIsNone(percentile([], 50))
+
+    def test_statistics_of_pooled_run(self):
+        """durations, queue wait and concurrency of a run"""
+        for _ in range(4):
+            self.gevent_library_instance.add_coroutine("Sleep", "0.02")
+        self.gevent_library_instance.run_coroutines(gevent_pool_size=2)
+        stats = self.gevent_library_instance.get_bundle_statistics()
+
+        self.assertEqual(4, stats["count"])
+        self.assertEqual({"PASS": 4}, stats["statuses"])
+        self.assertEqual(2, stats["max_concurrency"])
+        self.assertGreaterEqual(stats["p50"], 0.015)
+        self.assertGreater(stats["mean_queue_wait"], 0.005)
+        self.assertGreater(stats["throughput"], 0)
+
+    def test_statuses_of_failed_run(self):
+        """failed and never started coroutines are counted"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0", "FAIL")
+        self.gevent_library_instance.add_coroutine("Sleep", "0.01")
+        self.gevent_library_instance.add_coroutine("Sleep", "0.01")
+        with self.assertRaises(Exception):
+            self.gevent_library_instance.run_coroutines(
+                gevent_pool_size=1, settings=RunSettings(fail_fast=True)
+            )
+        stats = self.gevent_library_instance.get_bundle_statistics("my_alias")
+        self.assertEqual({"FAIL": 1, "NOT RUN": 2}, stats["statuses"])
+        self.assertEqual(1, stats["completed"])
+
+    def test_killed_coroutines(self):
+        """coroutines killed by the timeout are counted as killed, also when robot wraps the kill"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0")
+        self.gevent_library_instance.add_coroutine("Sleep", "1")
+        with self.assertRaises(Exception):
+            self.gevent_library_instance.run_coroutines(timeout=0.05)
+        stats = self.gevent_library_instance.get_bundle_statistics("my_alias")
+        self.assertEqual({"PASS": 1, "KILLED": 1}, stats["statuses"])
+
+    def test_queue_wait_excludes_pacing(self):
+        """the queue wait is the wait for a pool slot, paced starts do not count"""
+        for _ in range(3):
+            self.gevent_library_instance.add_coroutine("Sleep", "0")
+        self.gevent_library_instance.run_coroutines(
+            settings=RunSettings(rate=20, jitter=0.02)
+        )
+        stats = self.gevent_library_instance.get_bundle_statistics()
+
+        self.assertLess(stats["mean_queue_wait"], 0.005)
+        self.assertGreater(stats["wall_time"], 0.09)
+
+    def test_save_statistics(self):
+        """statistics are saved as json or csv"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0", "A")
+        self.gevent_library_instance.add_coroutine("Sleep", "0", "B")
+        self.gevent_library_instance.run_coroutines()
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = os.path.join(tmp, "stats.json")
+            csv_path = os.path.join(tmp, "stats.csv")
+            self.gevent_library_instance.save_bundle_statistics(json_path)
+            self.gevent_library_instance.save_bundle_statistics(csv_path)
+            with open(json_path, encoding="utf-8") as json_file:
+                saved = json.load(json_file)
+            with open(csv_path, encoding="utf-8") as csv_file:
+                rows = list(csv.DictReader(csv_file))
+            with self.assertRaises(ValueError):
+                self.gevent_library_instance.save_bundle_statistics(
+                    os.path.join(tmp, "stats.txt")
+                )
+        self.assertEqual(2, saved["summary"]["count"])
+        self.assertEqual("0    B", saved["coroutines"][1]["args"])
+        self.assertListEqual(["PASS", "PASS"], [row["status"] for row in rows])
+
+    def test_bundle_not_run(self):
+        """there are no statistics before the bundle runs"""
+        with self.assertRaises(LookupError) as exp:
+            self.gevent_library_instance.get_bundle_statistics()
+        self.assertEqual(
+            str(exp.exception), "Bundle with alias my_alias was not run yet"
+        )
+
+
+if __name__ == "__main__":
+    main()
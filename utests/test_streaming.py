@@ -0,0 +1,117 @@
+"""unittest module, streaming values of a bundle in completion order"""
+import sys
+from unittest import TestCase, mock, main
+
+import gevent
+
+sys.path.insert(0, "src")
+from GeventLibrary.exceptions import NoPendingCoroutines
+from GeventLibrary.execution import RunSettings
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+
+def _sleep_and_return(keyword_name, seconds, value="PASS"):
+    if keyword_name == "Log":
+        return None
+    try:
+        gevent.sleep(float(seconds))
+    except gevent.GreenletExit:
+        if keyword_name != "Ignore Kill":
+            raise
+        gevent.sleep(float(seconds))
+    if value == "FAIL":
+        raise ValueError("some value error...")
+    return value
+
+
+class TestRunCoroutinesAsCompleted(TestCase):
+    """This suite tests `Run Coroutines As Completed` and `Get Next Result`"""
+
+    def setUp(self):
+        patchers = [
+            mock.patch(
+                "robot.libraries.BuiltIn.BuiltIn.run_keyword",
+                side_effect=_sleep_and_return,
+            ),
+            mock.patch(
+                "robot.running.context.ExecutionContexts.current",
+                returned_Value="not null...",
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.gevent_library_instance = GeventKeywords()
+        self.gevent_library_instance.create_gevent_bundle(alias="my_alias")
+
+    def test_values_in_completion_order(self):
+        """values are returned by the order the coroutines complete"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0.03", "slow")
+        self.gevent_library_instance.add_coroutine("Sleep", "0.01", "fast")
+        self.gevent_library_instance.add_coroutine("Sleep", "0.02", "medium")
+
+        count = self.gevent_library_instance.run_coroutines_as_completed()
+        values = [self.gevent_library_instance.get_next_result() for _ in range(count)]
+
+        self.assertEqual(3, count)
+        self.assertListEqual(["fast", "medium", "slow"], values)
+        self.assertEqual(0, len(self.gevent_library_instance["my_alias"]))
+
+    def test_no_pending_values(self):
+        """once all values were returned, asking for the next value raises an error"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0")
+        self.gevent_library_instance.run_coroutines_as_completed()
+        self.gevent_library_instance.get_next_result()
+        with self.assertRaises(NoPendingCoroutines):
+            self.gevent_library_instance.get_next_result()
+
+    def test_failed_coroutine_raises_its_exception(self):
+        """the exception of a failed coroutine is raised when its turn comes"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0.01", "FAIL")
+        self.gevent_library_instance.add_coroutine("Sleep", "0.02")
+        self.gevent_library_instance.run_coroutines_as_completed(gevent_pool_size=1)
+        with self.assertRaises(ValueError):
+            self.gevent_library_instance.get_next_result()
+        self.assertEqual("PASS", self.gevent_library_instance.get_next_result())
+
+    def test_next_value_timeout(self):
+        """waiting for the next value is limited by the timeout"""
+        self.gevent_library_instance.add_coroutine("Sleep", "1")
+        self.gevent_library_instance.run_coroutines_as_completed()
+        with self.assertRaises(TimeoutError):
+            self.gevent_library_instance.get_next_result(timeout=0.01)
+        self.gevent_library_instance.clear_all_bundles()
+
+    def test_close_does_not_hang_on_surviving_coroutine(self):
+        """closing the stream waits for killed coroutines only for the grace period"""
+        self.gevent_library_instance.add_coroutine("Ignore Kill", "0.3")
+        self.gevent_library_instance.run_coroutines_as_completed(
+            settings=RunSettings(kill_grace_period=0.05)
+        )
+        gevent.sleep(0.01)
+        with mock.patch("robot.api.logger.warn") as warn:
+            self.gevent_library_instance.clear_all_bundles()
+        warn.assert_called_once_with(
+            "1 coroutine(s) were still running after being killed"
+        )
+        gevent.sleep(0.4)
+
+    def test_callback_called_in_completion_order(self):
+        """in callback mode the callback keyword receives every value"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0.02", "slow")
+        self.gevent_library_instance.add_coroutine("Sleep", "0.01", "fast")
+        with mock.patch(
+            "robot.libraries.BuiltIn.BuiltIn.run_keyword",
+            side_effect=_sleep_and_return,
+        ) as run_keyword:
+            self.gevent_library_instance.run_coroutines_as_completed(
+                callback="Log", gevent_pool_size=2
+            )
+        callbacks = [
+            call.args for call in run_keyword.call_args_list if call.args[0] == "Log"
+        ]
+        self.assertListEqual([("Log", "fast"), ("Log", "slow")], callbacks)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""unittest module, bundles kept as templates"""
+import sys
+from unittest import TestCase, mock, main
+
+sys.path.insert(0, "src")
+from GeventLibrary.exceptions import BundleHasNoCoroutines, BundleIsTemplate
+from GeventLibrary.keywords.bundle import RobotKeywordCoroutine
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+
+class TestTemplates(TestCase):
+    """This suite tests that frozen bundles run repeatedly, with per-run overrides"""
+
+    def setUp(self):
+        patchers = [
+            mock.patch(
+                "robot.libraries.BuiltIn.BuiltIn.run_keyword",
+                side_effect=lambda name, *args: (name, *args),
+            ),
+            mock.patch(
+                "robot.running.context.ExecutionContexts.current",
+                returned_Value="not null...",
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.gevent_library_instance = GeventKeywords()
+        self.gevent_library_instance.create_gevent_bundle(alias="my_alias")
+        self.gevent_library_instance.add_coroutine(
+            "Login", "user1", coroutine_name="login", timeout="5s"
+        )
+        self.gevent_library_instance.add_coroutines("Get Orders", count=2)
+
+    def test_frozen_bundle_runs_repeatedly(self):
+        """a frozen bundle keeps its coroutines between runs"""
+        self.gevent_library_instance.freeze_gevent_bundle()
+
+        first = self.gevent_library_instance.run_coroutines()
+        second = self.gevent_library_instance.run_coroutines()
+
+        self.assertListEqual(first, second)
+        self.assertEqual(3, len(second))
+
+    def test_specs_are_created_once(self):
+        """the runs of a frozen bundle reuse the specs and keyword names created by freezing it"""
+        self.gevent_library_instance.freeze_gevent_bundle()
+        bundle = self.gevent_library_instance["my_alias"]
+
+        with mock.patch.object(
+            GeventKeywords, "_create_specs", side_effect=AssertionError
+        ):
+            self.gevent_library_instance.run_coroutines()
+            self.gevent_library_instance.run_coroutines()
+
+        # the batch of two coroutines is kept as a single spec batch
+        self.assertEqual(2, len(bundle.specs))
+        self.assertListEqual(["Login", "Get Orders"], bundle.keyword_names)
+
+    def test_freezing_empty_bundle_fails(self):
+        """a bundle is frozen once its coroutines were added"""
+        self.gevent_library_instance.create_gevent_bundle(alias="empty")
+
+        with self.assertRaises(BundleHasNoCoroutines):
+            self.gevent_library_instance.freeze_gevent_bundle("empty")
+        self.assertFalse(self.gevent_library_instance["empty"].is_template)
+
+    def test_unfrozen_bundle_is_cleared(self):
+        """a bundle that is not frozen is emptied by its run"""
+        self.gevent_library_instance.run_coroutines()
+
+        self.assertEqual(0, len(self.gevent_library_instance["my_alias"]))
+
+    def test_adding_to_frozen_bundle_fails(self):
+        """coroutines cannot be added to a frozen bundle"""
+        self.gevent_library_instance.freeze_gevent_bundle()
+
+        with self.assertRaises(BundleIsTemplate):
+            self.gevent_library_instance.add_coroutine("Logout")
+
+    def test_overrides_apply_to_a_single_run(self):
+        """positional overrides replace the arguments, named overrides are merged"""
+        self.gevent_library_instance.freeze_gevent_bundle()
+
+        replaced = self.gevent_library_instance.run_coroutines(
+            overrides={"login": ["user2"]}
+        )
+        merged = self.gevent_library_instance.run_coroutines(
+            overrides={"login": {"timeout": "10s"}}
+        )
+        plain = self.gevent_library_instance.run_coroutines()
+
+        self.assertEqual(("Login", "user2", "timeout=5s"), replaced[0])
+        self.assertEqual(("Login", "user1", "timeout=10s"), merged[0])
+        self.assertEqual(("Login", "user1", "timeout=5s"), plain[0])
+
+    def test_overrides_keep_the_settings(self):
+        """an overridden coroutine keeps its name, dependencies and settings"""
+        coro = RobotKeywordCoroutine("Login", "user1", timeout="5s")
+        coro.name, coro.depends_on, coro.blocking = "login", ("setup",), True
+
+        overridden = coro.overridden({"timeout": "10s"})
+
+        self.assertEqual(["user1", "timeout=10s"], overridden.all_args)
+        self.assertEqual(("login", ("setup",), True), (
+            overridden.name, overridden.depends_on, overridden.blocking
+        ))
+        self.assertEqual(["user1", "timeout=5s"], coro.all_args)
+
+    def test_unknown_override_fails(self):
+        """overrides of coroutines that are not in the bundle are rejected"""
+        with self.assertRaises(LookupError):
+            self.gevent_library_instance.run_coroutines(overrides={"logout": []})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""unittest module, running the library keywords of blocking coroutines on a thread pool"""
+import sys
+from time import monotonic
+from unittest import TestCase, mock, main
+
+import gevent
+from gevent import monkey
+from robot.output import librarylogger
+from robot.running.librarykeywordrunner import LibraryKeywordRunner
+
+sys.path.insert(0, "src")
+from GeventLibrary.execution import ThreadOffload
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+# the sleep of the time module, blocking the whole thread even if it was patched by gevent
+blocking_sleep = monkey.get_original("time", "sleep")
+# the identity of the native thread, even if other tests patched the thread module
+get_ident = monkey.get_original("_thread", "get_ident")
+
+
+def _library_keyword(seconds):
+    blocking_sleep(float(seconds))
+    ThreadOffload._write(f"slept {seconds} seconds", "INFO")
+    return get_ident()
+
+
+def _run_library_keyword(name, seconds):
+    runner = mock.Mock(libname="SSHLibrary" if name == "Blocking" else "BuiltIn")
+    return ThreadOffload._runner_for(runner, None, _library_keyword, (seconds,), {})
+
+
+class TestThreadOffload(TestCase):
+    """This suite tests that the library keywords of blocking coroutines run on native threads"""
+
+    def setUp(self):
+        patchers = [
+            mock.patch(
+                "robot.libraries.BuiltIn.BuiltIn.run_keyword",
+                side_effect=_run_library_keyword,
+            ),
+            mock.patch(
+                "robot.running.context.ExecutionContexts.current",
+                returned_Value="not null...",
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        mock.patch(
+            "GeventLibrary.execution.thread_offload._original_runner_for",
+            lambda runner, context, handler, positional, named: handler(*positional),
+        ).start()
+        self.write = mock.patch(
+            "GeventLibrary.execution.thread_offload._original_write"
+        ).start()
+        self.addCleanup(mock.patch.stopall)
+        self.gevent_library_instance = GeventKeywords(threadpool_size=4)
+        self.gevent_library_instance.create_gevent_bundle(alias="my_alias")
+
+    def test_blocking_coroutines_overlap(self):
+        """blocking library keywords run concurrently on the threads, their messages are logged"""
+        for _ in range(4):
+            self.gevent_library_instance.add_coroutine("Blocking", "0.3", blocking=True)
+        start = monotonic()
+        idents = self.gevent_library_instance.run_coroutines()
+        self.assertLess(monotonic() - start, 0.9)
+
+        self.assertNotIn(get_ident(), idents)
+        self.assertEqual(4, self.write.call_count)
+        self.assertIn("slept 0.3 seconds", self.write.call_args[0][0])
+
+    def test_hub_is_not_blocked(self):
+        """cooperative coroutines keep running while a blocking one waits for its thread"""
+        self.gevent_library_instance.add_coroutine("Blocking", "0.3", blocking=True)
+        with mock.patch(
+            "robot.libraries.BuiltIn.BuiltIn.run_keyword",
+            side_effect=lambda name, *args: (
+                _run_library_keyword(name, *args)
+                if name == "Blocking"
+                else gevent.sleep(float(args[0]))
+            ),
+        ):
+            for _ in range(5):
+                self.gevent_library_instance.add_coroutine("Sleep", "0.3")
+            start = monotonic()
+            self.gevent_library_instance.run_coroutines()
+        self.assertLess(monotonic() - start, 0.5)
+
+    def test_not_offloaded(self):
+        """coroutines not marked as blocking and robot's own libraries stay on the hub's thread"""
+        self.gevent_library_instance.add_coroutine("Blocking", "0")
+        self.gevent_library_instance.add_coroutine("Builtin", "0", blocking=True)
+        idents = self.gevent_library_instance.run_coroutines()
+
+        self.assertEqual([get_ident()] * 2, idents)
+        self.assertEqual(2, self.write.call_count)
+
+    def test_installed_while_running(self):
+        """robot's runner and logger are patched only while a bundle with blocking coroutines runs"""
+        original_runner_for = LibraryKeywordRunner._runner_for
+        original_write = librarylogger.write
+        installed = []
+
+        def _check_installed(name, seconds):
+            installed.append(
+                LibraryKeywordRunner._runner_for is ThreadOffload._runner_for
+            )
+            return _run_library_keyword(name, seconds)
+
+        with mock.patch(
+            "robot.libraries.BuiltIn.BuiltIn.run_keyword", side_effect=_check_installed
+        ):
+            self.gevent_library_instance.add_coroutine("Blocking", "0")
+            self.gevent_library_instance.run_coroutines()
+            self.gevent_library_instance.add_coroutine("Blocking", "0", blocking=True)
+            self.gevent_library_instance.run_coroutines()
+
+        self.assertEqual([False, True], installed)
+        self.assertIs(original_runner_for, LibraryKeywordRunner._runner_for)
+        self.assertIs(original_write, librarylogger.write)
+
+    def test_threadpool_size_must_be_positive(self):
+        """a zero size is rejected"""
+        with self.assertRaises(ValueError):
+            GeventKeywords(threadpool_size=0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""unittest module, coroutines that do not complete within the timeout"""
+import sys
+import time
+from unittest import TestCase, mock, main
+
+import gevent
+
+sys.path.insert(0, "src")
+from GeventLibrary.exceptions import CoroutinesTimedOut
+from GeventLibrary.execution import BundleRun, RunSettings
+from GeventLibrary.keywords.gevent_keywords import GeventKeywords
+
+
+class TestTimeout(TestCase):
+    """This suite tests stragglers of `Run Coroutines`"""
+
+    def setUp(self):
+        self.finished = []
+
+        def _sleep(name, seconds):
+            try:
+                gevent.sleep(float(seconds))
+            except gevent.GreenletExit:
+                if name != "Ignore Kill":
+                    raise
+                gevent.sleep(float(seconds))
+            self.finished.append(seconds)
+            return seconds
+
+        patchers = [
+            mock.patch(
+                "robot.libraries.BuiltIn.BuiltIn.run_keyword", side_effect=_sleep
+            ),
+            mock.patch(
+                "robot.running.context.ExecutionContexts.current",
+                returned_Value="not null...",
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.gevent_library_instance = GeventKeywords()
+        self.gevent_library_instance.create_gevent_bundle(alias="my_alias")
+
+    def test_stragglers_are_reported_and_killed(self):
+        """coroutines exceeding the timeout are killed and listed in the error"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0")
+        self.gevent_library_instance.add_coroutine("Sleep", "0.5")
+        started = time.monotonic()
+        with self.assertRaises(CoroutinesTimedOut) as exp:
+            self.gevent_library_instance.run_coroutines(timeout=0.05)
+        stragglers = exp.exception.stragglers
+        self.assertEqual(1, len(stragglers))
+        self.assertListEqual(["0.5"], stragglers[0].spec.args)
+        # the timeout counts from the start of the run, not from the start of the coroutine
+        self.assertGreaterEqual(stragglers[0].ended - started, 0.05)
+        self.assertIn("1 coroutine(s) did not complete within 0.05 seconds", str(exp.exception))
+        gevent.sleep(0.6)
+        self.assertListEqual(["0"], self.finished)
+
+    def test_coroutine_surviving_the_kill(self):
+        """coroutines still running after the grace period are named in the error"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0.01")
+        self.gevent_library_instance.add_coroutine("Ignore Kill", "0.5")
+        started = time.monotonic()
+        with self.assertRaises(CoroutinesTimedOut) as exp:
+            self.gevent_library_instance.run_coroutines(
+                timeout=0.05, settings=RunSettings(kill_grace_period=0.05)
+            )
+        self.assertLess(time.monotonic() - started, 0.4)
+        self.assertEqual(1, len(exp.exception.survivors))
+        self.assertEqual("Ignore Kill", exp.exception.survivors[0].spec.keyword_name)
+        self.assertIn("(still running after being killed)", str(exp.exception))
+        gevent.sleep(0.6)
+
+    def test_timeout_while_waiting_for_pool(self):
+        """coroutines that never got a pool slot are reported as never started"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0.5")
+        self.gevent_library_instance.add_coroutine("Sleep", "0.5")
+        started = time.monotonic()
+        with self.assertRaises(CoroutinesTimedOut) as exp:
+            self.gevent_library_instance.run_coroutines(
+                timeout=0.05, gevent_pool_size=1
+            )
+        self.assertLess(time.monotonic() - started, 0.4)
+        self.assertEqual(2, len(exp.exception.stragglers))
+        self.assertIsNone(exp.exception.stragglers[1].elapsed)
+        self.assertIn("(never started)", str(exp.exception))
+
+    def test_timeout_right_after_spawning(self):
+        """a coroutine spawned when the timeout interrupts the spawning is killed as well"""
+        self.gevent_library_instance.add_coroutine("Sleep", "0.3")
+        wrap = BundleRun._wrap  # pylint: disable=protected-access
+
+        def _blocking_after_spawn(run, spawn_callable):
+            def _spawn(function, *args):
+                greenlet = wrap(run, spawn_callable)(function, *args)
+                gevent.sleep(1)
+                return greenlet
+
+            return _spawn
+
+        with mock.patch.object(BundleRun, "_wrap", _blocking_after_spawn):
+            with self.assertRaises(CoroutinesTimedOut) as exp:
+                self.gevent_library_instance.run_coroutines(timeout=0.05)
+        self.assertEqual(1, len(exp.exception.stragglers))
+        gevent.sleep(0.4)
+        self.assertListEqual([], self.finished)
+
+
+if __name__ == "__main__":
+    main()